@@ -0,0 +1 @@
+"""Offline benchmarks of the exporter against a simulated fleet of ICON validators."""
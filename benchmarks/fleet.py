@@ -0,0 +1,220 @@
+"""A stand in for an ICON network: the main JSON-RPC API and any number of P-Rep peer status endpoints.
+
+Every simulated node gets its own loopback address (127.x.y.z) and they are all served by one listener on
+0.0.0.0, telling nodes apart by the Host header. This relies on the whole of 127.0.0.0/8 routing to the
+loopback interface, which is the case on Linux.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+from time import time
+
+from aiohttp import web
+
+_PREPS_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'output.json')
+
+TERM_PERIOD = 43120
+
+
+def node_ip(index: int) -> str:
+    return f'127.{(index >> 16) + 1}.{(index >> 8) & 255}.{index & 255}'
+
+
+def build_preps(num_nodes: int, preps_path: str = _PREPS_PATH) -> list:
+    # Seeded from a real getPReps response, repeated with unique names and addresses past its length
+    with open(preps_path) as f:
+        seed = json.load(f)['result']['preps']
+    preps = []
+    for i in range(num_nodes):
+        prep = dict(seed[i % len(seed)])
+        if i >= len(seed):
+            prep['name'] = f"{prep['name']} #{i // len(seed)}"
+            prep['address'] = f"hx{i:040x}"
+        prep['p2pEndpoint'] = f'{node_ip(i)}:7100'
+        preps.append(prep)
+    return preps
+
+
+class FakeFleet:
+    def __init__(self, num_nodes: int, latency: float = .01, jitter: float = .005, failure_rate: float = 0,
+                 hang_rate: float = 0, down_rate: float = 0, block_time: float = 2, start_height: int = 20000000,
+                 seed: int = 0):
+        self.preps = build_preps(num_nodes)
+        self.index_by_ip = {node_ip(i): i for i in range(num_nodes)}
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.hang_rate = hang_rate
+        self.block_time = block_time
+        self.start_height = start_height
+        self.start_time = time()
+        self.random = random.Random(seed)
+        # Some nodes trail the chain by a few blocks
+        self.lag = [self.random.choice((0, 0, 0, 1, 2)) for _ in range(num_nodes)]
+        # Extra latency in seconds of slow nodes by index
+        self.delays = {}
+        # Reported state of nodes by index, Vote for main P-Reps and Watch for the rest otherwise
+        self.states = {}
+        # Nodes that never answer, like a firewalled port 9000
+        self.down = set(self.random.sample(range(num_nodes), int(num_nodes * down_rate)))
+        self.total_tx_per_block = 3
+        self.requests = 0
+        self.rpc_requests = 0
+        # Serve /api/v3/icon_dex/block block notifications
+        self.block_websocket = True
+        self.ws_connections = 0
+        self.runner = None
+
+    def height(self) -> int:
+        return self.start_height + int((time() - self.start_time) / self.block_time)
+
+    def block(self, height: int) -> dict:
+        return {'height': height,
+                'block_hash': f'{height:064x}',
+                'time_stamp': int((self.start_time + (height - self.start_height) * self.block_time) * 1e6),
+                'confirmed_transaction_list': [{'txHash': f'0x{height:056x}{i:08x}'}
+                                               for i in range(self.total_tx_per_block)]}
+
+    def rpc_result(self, request: dict):
+        method = request.get('method')
+        if method == 'icx_call':
+            method = request['params']['data']['method']
+
+        height = self.height()
+        if method == 'getPReps':
+            params = request['params']['data'].get('params', {})
+            end = int(params.get('endRanking', hex(len(self.preps))), 16)
+            return {'blockHeight': hex(height), 'startRanking': '0x1', 'preps': self.preps[:end]}
+        if method == 'getIISSInfo':
+            return {'blockHeight': hex(height), 'nextCalculation': hex(height + TERM_PERIOD - height % TERM_PERIOD)}
+        if method == 'icx_getLastBlock':
+            return self.block(height)
+        if method == 'icx_getBlockByHeight':
+            block_height = int(request['params']['height'], 16)
+            if block_height > height:
+                raise KeyError(f'block {block_height}')
+            return self.block(block_height)
+        if method == 'icx_getTotalSupply':
+            return hex(800460000 * 10 ** 18 + height * 10 ** 18)
+        raise KeyError(method)
+
+    def rpc_response(self, request: dict) -> dict:
+        try:
+            return {'jsonrpc': '2.0', 'id': request.get('id'), 'result': self.rpc_result(request)}
+        except KeyError as e:
+            return {'jsonrpc': '2.0', 'id': request.get('id'),
+                    'error': {'code': -32601, 'message': f'Method not found: {e}'}}
+
+    async def main_api(self, request: web.Request) -> web.Response:
+        self.rpc_requests += 1
+        body = await request.json()
+        if isinstance(body, list):
+            return web.json_response([self.rpc_response(r) for r in body])
+        return web.json_response(self.rpc_response(body))
+
+    async def block_notifications(self, request: web.Request) -> web.WebSocketResponse:
+        # Notifies every block from the requested height on, like goloop's block websocket
+        self.ws_connections += 1
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        height = int((await ws.receive_json())['height'], 16)
+        await ws.send_json({'code': 0})
+        while not ws.closed:
+            while height <= self.height():
+                await ws.send_json({'hash': f'0x{height:064x}', 'height': hex(height)})
+                height += 1
+            await asyncio.sleep(self.block_time / 4)
+        return ws
+
+    async def peer_status(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        index = self.index_by_ip.get(request.host.split(':')[0])
+        if index is None:
+            raise web.HTTPNotFound()
+
+        roll = self.random.random()
+        if index in self.down or roll < self.hang_rate:
+            await asyncio.sleep(3600)
+        if roll < self.hang_rate + self.failure_rate:
+            raise web.HTTPInternalServerError()
+        await asyncio.sleep(max(self.latency + self.random.uniform(-self.jitter, self.jitter), 0) +
+                            self.delays.get(index, 0))
+
+        height = self.height() - self.lag[index]
+        return web.json_response({
+            'made_block_count': 0,
+            'leader_complaint': 1,
+            'peer_type': '1' if index < 22 else '0',
+            'block_height': height,
+            'round': 0,
+            'epoch_height': height,
+            'unconfirmed_block_height': height,
+            'total_tx': (height - self.start_height) * self.total_tx_per_block,
+            'unconfirmed_tx': 0,
+            'peer_target': self.preps[index]['p2pEndpoint'],
+            'leader': self.preps[0]['nodeAddress'],
+            'peer_id': self.preps[index]['nodeAddress'],
+            'state': self.states.get(index, 'Vote' if index < 22 else 'Watch'),
+            'status': 'Service is online: 1',
+        })
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/api/v3', self.main_api)
+        if self.block_websocket:
+            app.router.add_get('/api/v3/icon_dex/block', self.block_notifications)
+        app.router.add_get('/api/v1/status/peer', self.peer_status)
+        return app
+
+    async def start(self, host: str = '0.0.0.0', port: int = 0) -> int:
+        self.runner = web.AppRunner(self.app(), shutdown_timeout=.1)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+        return self.runner.addresses[0][1]
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+def add_fleet_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--latency', type=float, default=.01, help='Mean response time of a node in seconds')
+    parser.add_argument('--jitter', type=float, default=.005, help='Uniform jitter on the response time in seconds')
+    parser.add_argument('--failure-rate', type=float, default=0, help='Share of requests answered with a 500')
+    parser.add_argument('--hang-rate', type=float, default=0, help='Share of requests that never get an answer')
+    parser.add_argument('--down-rate', type=float, default=0, help='Share of nodes that never answer')
+    parser.add_argument('--block-time', type=float, default=2, help='Seconds per block')
+
+
+def fleet_kwargs(args: argparse.Namespace) -> dict:
+    return {'latency': args.latency, 'jitter': args.jitter, 'failure_rate': args.failure_rate,
+            'hang_rate': args.hang_rate, 'down_rate': args.down_rate, 'block_time': args.block_time}
+
+
+def serve(num_nodes: int, port: int, host: str = '0.0.0.0', **kwargs):
+    async def run():
+        fleet = FakeFleet(num_nodes, **kwargs)
+        await fleet.start(host, port)
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', type=int, default=100)
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=9000)
+    add_fleet_arguments(parser)
+    args = parser.parse_args()
+    print(f'Serving {args.nodes} nodes, main API on http://127.0.0.1:{args.port}/api/v3')
+    serve(args.nodes, args.port, args.host, **fleet_kwargs(args))
+
+
+if __name__ == '__main__':
+    main()
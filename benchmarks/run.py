@@ -0,0 +1,139 @@
+"""Benchmark exporter iterations against a simulated fleet as the number of nodes grows.
+
+    python -m benchmarks.run --nodes 100,500,1000,2000 --iterations 5
+
+The fleet runs in its own process so the CPU and memory figures are the exporter's only.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import socket
+import statistics
+from time import perf_counter, process_time, sleep
+
+import aiohttp
+from prometheus_client import CollectorRegistry, generate_latest
+
+from benchmarks import fleet
+from icon_network_exporter import Exporter
+from icon_network_exporter.config import Config
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.utils import create_session
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_for(url: str, timeout: float = 10):
+    async def ping():
+        async with aiohttp.ClientSession() as session:
+            async with session.post(url, json={'jsonrpc': '2.0', 'id': 1, 'method': 'icx_getLastBlock'}):
+                pass
+
+    start = perf_counter()
+    while True:
+        try:
+            return asyncio.run(ping())
+        except aiohttp.ClientError:
+            if perf_counter() - start > timeout:
+                raise
+            sleep(.1)
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def measure(config: Config, iterations: int) -> dict:
+    metrics = Metrics(CollectorRegistry())
+    exporter = Exporter(config, metrics)
+    session = create_session(config.connection_limit, config.connection_limit_per_host,
+                             config.dns_cache_ttl, config.keepalive_timeout)
+    wall, cpu, render, responses = [], [], [], []
+    try:
+        await exporter.open(session)
+        for _ in range(iterations):
+            start, start_cpu = perf_counter(), process_time()
+            await exporter.poll()
+            wall.append(perf_counter() - start)
+            cpu.append(process_time() - start_cpu)
+            responses.append(sum(1 for r in exporter.responses if r))
+
+            start = perf_counter()
+            payload = generate_latest(metrics.registry)
+            render.append(perf_counter() - start)
+    finally:
+        exporter.close()
+        await session.close()
+
+    return {
+        'nodes': len(exporter.registry),
+        'iteration_p50_s': statistics.median(wall),
+        'iteration_max_s': max(wall),
+        'cpu_per_iteration_s': statistics.mean(cpu),
+        'render_p50_s': statistics.median(render),
+        'payload_kb': len(payload) / 1024,
+        'responses_min': min(responses),
+        'max_rss_mb': max_rss_mb(),
+    }
+
+
+def run_benchmark(num_nodes: int, iterations: int, fleet_kwargs: dict, config_kwargs: dict) -> dict:
+    port = free_port()
+    process = multiprocessing.Process(target=fleet.serve, args=(num_nodes, port), kwargs=fleet_kwargs, daemon=True)
+    process.start()
+    try:
+        main_api_endpoint = f'http://127.0.0.1:{port}/api/v3'
+        wait_for(main_api_endpoint)
+        config = Config(main_api_endpoint=main_api_endpoint, end_ranking=hex(num_nodes), peer_api_port=port,
+                        **config_kwargs)
+        return asyncio.run(measure(config, iterations))
+    finally:
+        process.terminate()
+        process.join()
+
+
+COLUMNS = ['nodes', 'iteration_p50_s', 'iteration_max_s', 'cpu_per_iteration_s', 'render_p50_s', 'payload_kb',
+           'responses_min', 'max_rss_mb']
+
+
+def format_row(values: list) -> str:
+    return ' '.join(f'{v:>20.4f}' if isinstance(v, float) else f'{v:>20}' for v in values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', default='100,500,1000', help='Comma separated fleet sizes')
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--poll-interval', type=float, default=5)
+    parser.add_argument('--parallelism', type=int, default=Config.__fields__['parallelism'].default)
+    parser.add_argument('--soft-deadline', type=float, help='Seconds after which a poll stops waiting on nodes')
+    parser.add_argument('--workers', type=int, default=0, help='Scrape from this many worker processes')
+    parser.add_argument('--output', help='Write the results as json to this file')
+    fleet.add_fleet_arguments(parser)
+    args = parser.parse_args()
+
+    config_kwargs = {'poll_interval': args.poll_interval, 'parallelism': args.parallelism,
+                     'scrape_workers': args.workers, 'soft_deadline': args.soft_deadline}
+    results = []
+    for num_nodes in [int(n) for n in args.nodes.split(',')]:
+        results.append(run_benchmark(num_nodes, args.iterations, fleet.fleet_kwargs(args), config_kwargs))
+
+    print(format_row(COLUMNS))
+    for r in results:
+        print(format_row([r[c] for c in COLUMNS]))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
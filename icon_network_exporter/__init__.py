@@ -2,19 +2,34 @@
 # Scrapes metrics from all the nodes in the network and exposes them
 # to be scraped by prometheus
 
-from prometheus_client import start_http_server
-from prometheus_client import Gauge
-import requests
-from signal import signal, SIGINT, SIGTERM
+from prometheus_client import CollectorRegistry, REGISTRY
+import aiohttp
+from signal import SIGINT, SIGTERM
 import asyncio
-from typing import List
+import functools
+import numpy as np
+import os
+from typing import Awaitable, Callable, Dict, List, Optional, Union
 
-from time import sleep, time
+from time import time, perf_counter
 
+from icon_network_exporter import analytics, exposition, reference, replicas, snapshot
+from icon_network_exporter.backoff import NodeBackoff
+from icon_network_exporter.blocks import BlockSubscriber
+from icon_network_exporter.collector import OnDemandCollector
 from icon_network_exporter.config import Config
+from icon_network_exporter.decoding import PeerStatus, decode_preps
 from icon_network_exporter.exceptions import IconRPCError
-from icon_network_exporter.utils import get_prep_list_async, get_highest_block, get_rpc_attributes
-from icon_network_exporter.rpc import get_preps_rpc, get_iiss_info
+from icon_network_exporter.jsonrpc import JsonRpcClient
+from icon_network_exporter.labels import LabelLifecycle
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.registry import PRep, PRepRegistry
+from icon_network_exporter.remote_write import Pusher
+from icon_network_exporter.scraper import Scraper
+from icon_network_exporter.sharding import ShardedScraper
+from icon_network_exporter.store import SampleStore, FIELDS
+from icon_network_exporter.utils import get_rpc_attributes, connections_in_use, create_session
+from icon_network_exporter.rpc import get_preps_rpc, get_iiss_info, get_last_block, get_total_supply
 
 STATE_MAP = {
     'BlockGenerate': 0,
@@ -27,191 +42,492 @@ STATE_MAP = {
     'InitComponents': 7,
 }
 
+# Per node gauges set from the P-Rep list rather than the node's responses
+PREP_LIST_GAUGES = ('rank', 'delegated', 'stake', 'penalty', 'validation_rate', 'missed_blocks_rate',
+                    'delegation_change')
+
 
 class Exporter:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, metrics: Metrics = None):
 
         self.config = config
 
         self.last_processed_block_num = None
         self.last_processed_block_hash = None
 
-        self.gauge_prep_node_block_height = Gauge('icon_prep_node_block_height',
-                                                  'Node block height',
-                                                  ['name', 'network_name'])
-        self.gauge_prep_node_state = Gauge('icon_prep_node_state', 'Number to indicate node state - ie Vote=1, Watch=2',
-                                           ['name', 'network_name'])
-
-        self.gauge_prep_node_rank = Gauge('icon_prep_node_rank', 'Rank of the node', ['name', 'network_name'])
-
-        self.gauge_prep_node_block_time = Gauge('icon_prep_node_block_time', 'Time in seconds per block for a node',
-                                                ['name', 'network_name'])
-
-        self.gauge_prep_node_latency = Gauge('icon_prep_node_latency', 'Time in seconds per for get request to node',
-                                             ['name', 'network_name'])
-
-        self.gauge_prep_reference_block_height = Gauge('icon_prep_reference_block_height',
-                                                       'Block height of reference node', ['network_name'])
-
-        self.gauge_prep_reference_block_time = Gauge('icon_prep_reference_block_time',
-                                                     'Time in seconds per block', ['network_name'])
-
-        self.gauge_total_tx = Gauge('icon_total_tx',
-                                    'Total number of transactions', ['network_name'])
-
-        self.gauge_blocks_left_in_term = Gauge('icon_blocks_left_in_term',
-                                               'Number of blocks left in term', ['network_name'])
-
-        self.gauge_total_active_main_preps = Gauge('icon_total_active_main_preps',
-                                                   'Total number of active nodes above rank 22', ['network_name'])
-
-        self.gauge_total_active_sub_preps = Gauge('icon_total_active_sub_preps',
-                                                  'Total number of active validators - (Watch / Vote / BlockGenerate)',
-                                                  ['network_name'])
-
-        self.gauge_total_inactive_sub_preps = Gauge('icon_total_inactive_sub_preps',
-                                                    'Total number of inactive validators - (nodes off / in blocksync)',
-                                                    ['network_name'])
-
-        self.prep_list: list = []
-        self.prep_urls: list = []
+        self.metrics = metrics or Metrics(latency_buckets=self.config.latency_buckets)
+        self.registry = PRepRegistry(self.config.network_name.value, self.metrics.node_gauges(),
+                                     self.config.peer_api_port)
+        self.labels = LabelLifecycle(self.metrics.node_gauges(), self.config.network_name.value, keep=PREP_LIST_GAUGES + ('up',))
+        self.backoff = NodeBackoff(self.config.poll_interval, self.config.backoff_factor,
+                                   self.config.backoff_max_interval, self.config.backoff_after_failures)
         self.prep_list_request_counter: int = 0
-        self.resp: List[List] = []
-        self.resp_non_null: List[List] = []
+        self.polls_since_prep_list: int = 0
+        self.term_change_block: Optional[int] = None
+        self.term_changed: bool = False
+        # When the P-Rep list in the registry was fetched
+        self.prep_list_time: Optional[float] = None
+        # Latest peer status responses, lined up with the registry
+        self.responses: List[Optional[PeerStatus]] = []
+        self.samples = SampleStore(self.config.sample_capacity)
         self.reference_list: List[List] = []
+        # Registry indexes of the nodes the reference height is taken over
+        self.reference_candidates = np.arange(0)
+        self.reference_node_index: Optional[int] = None
+        self.reference_block_height: int = 0
+        self.last_block_height: Optional[int] = None
+        # Whether this replica exports the chain level gauges
+        self.elected = self.config.replica_index in replicas.owners(
+            self.config.network_name.value, self.config.replica_count, self.config.replica_overlap)
+
+        # One pooled session for the lifetime of the process so that connections to the
+        # nodes are kept alive between iterations. Created once the event loop is running
+        # and shared between the networks scraped by the process.
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.scraper: Optional[Union[Scraper, ShardedScraper]] = None
+        self.rpc: Optional[JsonRpcClient] = None
+        self.blocks: Optional[BlockSubscriber] = None
+        # Called when gauges change between polls
+        self.on_change: Optional[Callable[[], None]] = None
+        # Whether the poll is waiting on the scrape, responses coming in meanwhile are
+        # rendered with the poll
+        self.scraping: bool = False
         print(f"Running on {self.config.network_name.value} network")
 
-    def serve_forever(self):
-        start_http_server(self.config.exporter_port, self.config.exporter_address)
-        stop = [False]
-
-        def set_stop(_number, _frame):
-            stop[0] = True
-
-        signal(SIGINT, set_stop)
-        signal(SIGTERM, set_stop)
+        self.last_snapshot_time = time()
+        if self.config.snapshot_dir:
+            self.restore_snapshot()
 
-        while not stop[0]:
+    def serve_forever(self):
+        serve_forever(self.config, [self])
+
+    async def open(self, session: aiohttp.ClientSession):
+        self.session = session
+        if self.config.scrape_workers:
+            self.scraper = ShardedScraper(self.config, self.metrics)
+        else:
+            self.scraper = Scraper(self.session, self.config, self.metrics)
+        self.rpc = JsonRpcClient(self.session, self.config.main_api_endpoint)
+        if self.config.block_subscription and self.elected:
+            self.blocks = BlockSubscriber(self.session, self.config, self.metrics, self.rpc)
+            self.blocks.on_block = self.changed
+
+    def changed(self):
+        if self.on_change:
+            self.on_change()
+
+    @property
+    def streaming(self) -> bool:
+        # Chain level gauges come from the block subscription while it is following blocks
+        return self.blocks is not None and self.blocks.is_live(2 * self.config.poll_interval)
+
+    def close(self):
+        if self.scraper:
+            self.scraper.close()
+        if self.config.snapshot_dir and self.registry:
+            self.save_snapshot()
+
+    def restore_snapshot(self):
+        # Warm start from the last snapshot, skips fetching the P-Rep list and fills the
+        # sample window so all the gauges are set on the first poll
+        path = snapshot.snapshot_file(self.config.snapshot_dir, self.config.network_name.value)
+        saved = snapshot.load(path, self.config.network_name.value, self.config.snapshot_max_age)
+        if not saved:
+            return
+
+        self.set_prep_list(saved['prep_list'], saved['prep_list_time'])
+        self.term_change_block = saved['term_change_block']
+        samples = saved['samples']
+        num_polls = len(samples['block_height'])
+        for i in range(num_polls):
+            self.samples.append({f: a[i] for f, a in samples.items()})
+        print(f"Restored {len(self.registry)} P-Reps and {num_polls} polls from {path}, saved {saved['age']:.0f}s ago")
+
+    def save_snapshot(self):
+        path = snapshot.snapshot_file(self.config.snapshot_dir, self.config.network_name.value)
+        try:
+            os.makedirs(self.config.snapshot_dir, exist_ok=True)
+            snapshot.save(path, self.registry, self.samples, self.term_change_block, self.prep_list_time)
+        except OSError as e:
+            print(f"Saving snapshot {path} failed: {e!r}")
+        self.last_snapshot_time = time()
+
+    async def run(self, stop: asyncio.Event, on_poll: Callable[[], Awaitable] = None):
+        # Polling schedule for this network
+        while not stop.is_set():
             next_iteration_time = time() + self.config.poll_interval
-            try:
-                self._run_updaters()
-            except IconRPCError:
-                pass
+            await self.poll()
+            if on_poll:
+                await on_poll()
 
             delay = next_iteration_time - time()
             if delay > 0:
-                sleep(delay)
-
-    def _run_updaters(self):
-        print(f"Iteration #{self.prep_list_request_counter}")
-        self.get_prep_list()
-        self.scrape_metrics()
-        self.get_active_preps()
-        self.get_reference()
-        self.summarize_metrics()
-
-    def get_prep_list(self):
-        if self.prep_list_request_counter % self.config.refresh_prep_list_count == 0:
-            self.prep_list = requests.post(self.config.main_api_endpoint,
-                                           json=get_preps_rpc(self.config.end_ranking)).json()["result"]["preps"]
-            for i, v in enumerate(self.prep_list):
-                self.prep_list[i]['apiEndpoint'] = ''.join(
-                    ['http://', v['p2pEndpoint'].split(':')[0], ':9000/api/v1/status/peer'])
-                self.gauge_prep_node_rank.labels(v['name'], self.config.network_name.value).set(i)
+                try:
+                    await asyncio.wait_for(stop.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def poll(self):
+        try:
+            await self._run_updaters()
+        except IconRPCError as e:
+            print(f"Iteration on {self.config.network_name.value} failed: {e}")
+        except Exception as e:
+            # Unexpected replies, the other networks keep polling
+            print(f"Iteration on {self.config.network_name.value} failed: {e!r}")
+
+    async def _run_updaters(self):
+        print(f"Iteration #{self.prep_list_request_counter} on {self.config.network_name.value}")
+        # P-Rep registrations and ranks matter at term boundaries, in between the list is only
+        # refreshed every refresh_prep_list_count polls as a fallback
+        refresh_prep_list = self.term_changed or self.polls_since_prep_list >= self.config.refresh_prep_list_count
+        if not self.registry:
+            # Nothing to scrape until the first list of P-Reps is in
+            self.set_prep_list(await self.timed('prep_list', self.get_prep_list()))
+            refresh_prep_list = False
+
+        # Main API calls and the peer status fan-out all go out at once, with the main API
+        # calls in one batch request. A refreshed list only takes effect once this
+        # iteration's responses have been processed.
+        updaters = [self.timed('scrape', self.scrape_metrics()),
+                    self.timed('iiss_info', self.get_term_change_block()),
+                    self.timed('chain_info', self.get_chain_info())]
+        if refresh_prep_list:
+            updaters.append(self.timed('prep_list', self.get_prep_list()))
+        # A failed main API call neither stops the scrape midway nor drops its responses, the
+        # error is raised once they have been processed
+        scrape, _, _, *prep_list = results = await asyncio.gather(*updaters, return_exceptions=True)
+        if isinstance(scrape, BaseException):
+            raise scrape
+        errors = [r for r in results if isinstance(r, BaseException)]
+
+        with self.phase('active_preps'):
+            self.get_active_preps()
+        with self.phase('reference'):
+            # The last known term change when getIISSInfo failed
+            self.get_reference(self.term_change_block)
+        with self.phase('summarize'):
+            self.summarize_metrics()
+
+        if prep_list and not isinstance(prep_list[0], BaseException):
+            self.set_prep_list(prep_list[0])
         self.prep_list_request_counter += 1
-
-    def scrape_metrics(self):
-        self.resp.insert(0, asyncio.run(get_prep_list_async(self.prep_list)))
-        self.resp_non_null.insert(0, [i for i in self.resp[0] if i is not None])
-        if len(self.resp) > self.config.num_data_points_retentation:
-            self.resp.pop()
-            self.resp_non_null.pop()
-
-        for i in self.resp_non_null[0]:
-            if i:
-                name = next(item for item in self.prep_list if item['apiEndpoint'] == i['apiEndpoint'])['name']
-                self.gauge_prep_node_block_height.labels(name, self.config.network_name.value).set(i['block_height'])
-                self.gauge_prep_node_latency.labels(name, self.config.network_name.value).set(i['latency'])
-                self.gauge_prep_node_state.labels(name, self.config.network_name.value).set(STATE_MAP[i['state']])
+        self.polls_since_prep_list += 1
+
+        if self.config.snapshot_dir and time() - self.last_snapshot_time >= self.config.snapshot_interval:
+            with self.phase('snapshot'):
+                self.save_snapshot()
+
+        if errors:
+            raise errors[0]
+
+    def phase(self, name: str):
+        return self.metrics.histogram_phase_duration.labels(name, self.config.network_name.value).time()
+
+    async def timed(self, name: str, coro):
+        with self.phase(name):
+            return await coro
+
+    async def get_prep_list(self) -> list:
+        result = await self.rpc.call(get_preps_rpc(self.config.end_ranking))
+        return decode_preps(result)
+
+    def set_prep_list(self, prep_list: list, prep_list_time: float = None):
+        if self.config.replica_count > 1:
+            prep_list = replicas.select(prep_list, self.config.replica_index, self.config.replica_count,
+                                        self.config.replica_overlap)
+        old_preps = self.registry.preps
+        old_ranks = [p.rank for p in old_preps]
+        old_columns = self.registry.columns
+        previous_index = self.registry.rebuild(prep_list)
+        self.polls_since_prep_list = 0
+        self.term_changed = False
+        self.metrics.gauge_assigned_nodes.labels(self.config.network_name.value).set(len(self.registry))
+        self.update_prep_numbers(old_columns, previous_index, prep_list_time or time())
+        if len(old_preps) == len(self.registry) and all(
+                p is q and p.rank == r for p, q, r in zip(old_preps, self.registry, old_ranks)):
+            # Nothing moved, the per node state and gauges are still in line
+            return
+
+        self.samples.remap(previous_index)
+        self.backoff.remap(previous_index)
+        self.labels.refresh(old_preps, self.registry.preps)
+        self.reference_candidates = reference.get_candidates(self.registry, self.config.reference_nodes)
+        for prep, previous in zip(self.registry, previous_index):
+            if previous is None or old_preps[previous] is not prep or old_ranks[previous] != prep.rank:
+                prep.gauges['rank'].set(prep.rank)
+
+    def update_prep_numbers(self, old_columns: Dict[str, np.ndarray], previous_index: List[Optional[int]],
+                            prep_list_time: float):
+        # Gauges of the getPReps numbers and of their changes since the previous list, which
+        # old_columns are from. Without a previous list the changes are all NaN.
+        columns = self.registry.columns
+        index = np.array([-1 if i is None else i for i in previous_index], dtype=int)
+        known = index >= 0
+        previous = {f: np.full(len(index), np.nan) for f in columns}
+        if self.prep_list_time is not None and prep_list_time > self.prep_list_time:
+            for f, a in old_columns.items():
+                previous[f][known] = a[index[known]]
+        values = {'delegated': columns['delegated'], 'stake': columns['stake'], 'penalty': columns['penalty'],
+                  **analytics.productivity(previous, columns, prep_list_time - (self.prep_list_time or 0))}
+        self.prep_list_time = prep_list_time
+
+        network_name = self.config.network_name.value
+        for name, a in values.items():
+            gauge = self.registry.gauges[name]
+            for prep, value in zip(self.registry, a.tolist()):
+                if np.isnan(value):
+                    # No series rather than a 0 for nodes without blocks to validate
+                    try:
+                        gauge.remove(prep.name, network_name)
+                    except KeyError:
+                        pass
+                    # Looked up again once there is a value
+                    prep.gauges.pop(name, None)
+                else:
+                    prep.gauges[name].set(value)
+
+    async def get_term_change_block(self) -> int:
+        result = await self.rpc.call(get_iiss_info())
+        term_change_block = int(result['nextCalculation'], 16)
+        if self.term_change_block is not None and term_change_block != self.term_change_block:
+            # A new term started, pick up the new P-Rep list on the next poll
+            self.term_changed = True
+        self.term_change_block = term_change_block
+        if self.blocks:
+            self.blocks.term_change_block = term_change_block
+        return term_change_block
+
+    async def get_chain_info(self):
+        last_block, total_supply = await self.rpc.call_many([get_last_block(), get_total_supply()])
+        self.last_block_height = last_block['height']
+        if not self.elected:
+            return
+        if not self.streaming:
+            self.metrics.gauge_last_block_height.labels(self.config.network_name.value).set(self.last_block_height)
+        self.metrics.gauge_total_supply.labels(self.config.network_name.value).set(int(total_supply, 16) / 10 ** 18)
+
+    async def scrape_metrics(self):
+        preps = self.registry.preps
+        now = time()
+        due = self.backoff.due(now)
+        preps_due = [p for p in preps if due[p.index]]
+        hedge_after = self.get_hedge_delays()
+        if hedge_after is not None:
+            hedge_after = [hedge_after[p.index] for p in preps_due]
+        self.responses = [None] * len(preps)
+        self.scraping = True
+        try:
+            responses = await self.scraper.scrape(preps_due, hedge_after, self.publish)
+        finally:
+            self.scraping = False
+        for prep, r in zip(preps_due, responses):
+            self.responses[prep.index] = r
+        self.samples.append(get_sample_columns(self.responses))
+        responded = ~np.isnan(self.samples.latest('block_height'))
+        self.backoff.update(now, due, responded)
+        self.metrics.gauge_backed_off_nodes.labels(self.config.network_name.value).set(len(preps) - len(preps_due))
+        self.evict_stale_nodes()
+
+        for prep, r in zip(preps, self.responses):
+            prep.gauges['up'].set(1 if r else 0)
+            if r:
+                prep.gauges['block_height'].set(r.block_height)
+                prep.gauges['latency'].set(r.latency)
+                prep.gauges['latency_seconds'].observe(r.latency / 1000)
+                prep.gauges['state'].set(STATE_MAP.get(r.state, np.nan))
+
+    def get_hedge_delays(self) -> Optional[List[Optional[float]]]:
+        # Per node delay in seconds before a second request is sent, None for nodes
+        # without latency samples
+        if self.config.hedge_percentile is None or not len(self.samples):
+            return None
+        latency = analytics.latency_percentile(self.samples.window('latency'), self.config.hedge_percentile)
+        delays = np.maximum(latency / 1000, self.config.hedge_min_delay)
+        return [None if np.isnan(d) else d for d in delays.tolist()]
+
+    def publish(self, prep: PRep, r: PeerStatus):
+        # Per node gauges are set as soon as a response comes in rather than once all of
+        # the poll's responses are in
+        prep.gauges['up'].set(1)
+        prep.gauges['block_height'].set(r.block_height)
+        prep.gauges['latency'].set(r.latency)
+        prep.gauges['state'].set(STATE_MAP.get(r.state, np.nan))
+        if not self.scraping:
+            # Late responses come in after the poll's render
+            self.changed()
+
+    def evict_stale_nodes(self):
+        missed = self.config.evict_after_missed_polls
+        if len(self.samples) >= missed:
+            stale = np.isnan(self.samples.window('block_height', missed)).all(axis=0)
+        else:
+            stale = np.zeros(len(self.registry), dtype=bool)
+        # Backed off nodes are down rather than holding on to their last values
+        stale |= self.backoff.backed_off(time())
+        responded = ~np.isnan(self.samples.latest('block_height'))
+        self.labels.update(self.registry, responded, stale)
 
     def get_active_preps(self):
+        # Totals over the whole network, which a replica only sees a share of
+        if self.config.replica_count > 1:
+            return
         active_main_preps = 0
         active_sub_preps = 0
-        for prep in range(0, int(self.config.end_ranking, 16) - 1):
-            state = None
-            for i, v in enumerate(self.resp_non_null[0]):
-                if self.prep_list[prep]['apiEndpoint'] == self.resp_non_null[0][i]['apiEndpoint']:
-                    state = self.resp_non_null[0][i]['state']
-                    break
-            # resp_lookup = next(item for item in self.resp_non_null[0] if item['apiEndpoint'] == self.prep_list[i]['apiEndpoint'])
-            # state = resp_lookup['state'] if 'state' in resp_lookup else None
-            if state:
-                if STATE_MAP[state] < 2 and prep < 22:
+        for prep, r in zip(self.registry, self.responses):
+            if r:
+                # Nodes in an unknown state count as inactive
+                state = STATE_MAP.get(r.state, len(STATE_MAP))
+                if state < 2 and prep.rank < 22:
                     active_main_preps += 1
-                if STATE_MAP[state] < 3 and prep >= 22:
+                if state < 3 and prep.rank >= 22:
                     active_sub_preps += 1
 
-        self.gauge_total_active_main_preps.labels(self.config.network_name.value).set(active_main_preps)
-        self.gauge_total_active_sub_preps.labels(self.config.network_name.value).set(active_sub_preps)
-        self.gauge_total_inactive_sub_preps.labels(self.config.network_name.value).set(78 - active_sub_preps)
-
-    def get_reference(self):
-        # Get reference
-        highest_block, self.reference_node_api_endpoint = get_highest_block(self.prep_list, self.resp_non_null[0])
-        # reference_node_name = next(item for item in self.resp_non_null[0] if item['apiEndpoint'] == self.reference_node_api_endpoint)[
-        #     'apiEndpoint']
-        self.gauge_prep_reference_block_height.labels(self.config.network_name.value).set(highest_block)
+        self.metrics.gauge_total_active_main_preps.labels(self.config.network_name.value).set(active_main_preps)
+        self.metrics.gauge_total_active_sub_preps.labels(self.config.network_name.value).set(active_sub_preps)
+        self.metrics.gauge_total_inactive_sub_preps.labels(self.config.network_name.value).set(
+            max(len(self.registry) - 22, 0) - active_sub_preps)
+
+    def get_reference(self, term_change_block: Optional[int]):
+        highest_block, self.reference_node_index = reference.get_reference(
+            self.samples.latest('block_height'), self.reference_candidates, self.config.reference_quorum,
+            self.last_block_height)
+        if highest_block is None:
+            return
+        self.reference_block_height = highest_block
+        if not self.elected:
+            return
+        if self.streaming:
+            if self.reference_node_index is not None:
+                self.blocks.seed_total_tx(highest_block, self.samples.latest('total_tx')[self.reference_node_index])
+            return
+        self.metrics.gauge_prep_reference_block_height.labels(self.config.network_name.value).set(highest_block)
 
         # self.reference_list.insert(0, get_rpc_attributes())
         # if len(self.reference_list) > self.config.num_data_points_retentation:
         #     self.reference_list.pop()
 
-        total_tx = \
-        next(item for item in self.resp_non_null[0] if item['apiEndpoint'] == self.reference_node_api_endpoint)[
-            'total_tx']
-        # Get total TX
-        self.gauge_total_tx.labels(self.config.network_name.value).set(total_tx)
-
-        term_change_block = requests.post(self.config.main_api_endpoint,
-                                          json=get_iiss_info()).json()['result']['nextCalculation']
+        if self.reference_node_index is not None:
+            total_tx = self.samples.latest('total_tx')[self.reference_node_index]
+            # Get total TX
+            self.metrics.gauge_total_tx.labels(self.config.network_name.value).set(total_tx)
 
-        self.gauge_blocks_left_in_term.labels(self.config.network_name.value).set(int(term_change_block, 16) - highest_block)
+        if term_change_block is not None:
+            self.metrics.gauge_blocks_left_in_term.labels(self.config.network_name.value).set(
+                term_change_block - highest_block)
 
     def summarize_metrics(self):
-        if len(self.resp_non_null) == self.config.num_data_points_retentation:
-            # Instance summary
-            for i, v in enumerate(self.resp_non_null[0]):
-                # We're going to take the current block and subtract the block height
-                # from the same address from a previous sample. That sample might not exist
-                # so need to check first.
-                current_block = self.resp_non_null[0][i]['block_height']
-
-                previous_block = None
-                for j in self.resp_non_null[self.config.num_data_points_retentation - 1]:
-                    if j['apiEndpoint'] == self.resp_non_null[0][i]['apiEndpoint']:
-                        previous_block = j['block_height']
-                if previous_block:
-                    num_blocks = current_block - previous_block
-                    if num_blocks > 0:
-                        # Adding half a block to account for mid block sample
-                        block_time = (self.config.poll_interval * self.config.num_data_points_retentation) / (
-                            num_blocks)
-
-                        prep_data = next(item for item in self.prep_list if
-                                         item['apiEndpoint'] == self.resp_non_null[0][i]['apiEndpoint'])
-
-                        self.gauge_prep_node_block_time.labels(prep_data['name'], self.config.network_name.value).set(
-                            block_time)
-                        if self.resp_non_null[0][i]['apiEndpoint'] == self.reference_node_api_endpoint:
-                            # prep_data['name'], prep_data['address']
-                            self.gauge_prep_reference_block_time.labels(self.config.network_name.value).set(block_time)
+        # Block time from measured sample timestamps, block lag against the reference and
+        # rolling latency stats, computed for all nodes at once over the window
+        window = self.config.num_data_points_retentation
+        if len(self.samples) < 2:
+            return
+        summary = analytics.summarize(self.samples.window('block_height', window),
+                                      self.samples.window('timestamp', window),
+                                      self.samples.window('latency', window),
+                                      self.reference_block_height)
+
+        for name, values in summary.items():
+            for prep in self.registry:
+                value = values[prep.index]
+                if not np.isnan(value):
+                    prep.gauges[name].set(value)
+
+        if self.reference_node_index is not None and self.elected and not self.streaming:
+            block_time = summary['block_time'][self.reference_node_index]
+            if not np.isnan(block_time):
+                self.metrics.gauge_prep_reference_block_time.labels(self.config.network_name.value).set(block_time)
+
+
+def get_sample_columns(responses: List[Optional[PeerStatus]]) -> Dict[str, np.ndarray]:
+    columns = {f: np.full(len(responses), np.nan) for f in FIELDS}
+    for i, r in enumerate(responses):
+        if r:
+            columns['block_height'][i] = r.block_height
+            columns['timestamp'][i] = r.timestamp
+            columns['latency'][i] = r.latency
+            columns['total_tx'][i] = r.total_tx
+            columns['state'][i] = STATE_MAP.get(r.state, np.nan)
+    return columns
+
+
+def serve_forever(config: Config, exporters: List[Exporter]):
+    collector = None
+    if config.scrape_on_demand:
+        # The exporters' gauges live in their own registry and only get to /metrics
+        # through the collector's snapshot
+        collector = OnDemandCollector(exporters, exporters[0].metrics, config.max_staleness, config.scrape_timeout)
+        REGISTRY.register(collector)
+    asyncio.run(serve(config, exporters, collector))
+
+
+async def serve(config: Config, exporters: List[Exporter], collector: OnDemandCollector = None):
+    # All networks run on one loop and share a connection pool
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(SIGINT, stop.set)
+    loop.add_signal_handler(SIGTERM, stop.set)
+
+    session = create_session(config.connection_limit,
+                             config.connection_limit_per_host,
+                             config.dns_cache_ttl,
+                             config.keepalive_timeout)
+    # /metrics is rendered once per poll and served from memory on this loop
+    cache = exposition.MetricsCache(REGISTRY, collector.refresh if collector else None, config.scrape_timeout,
+                                    config.metrics_update_interval)
+    runner = await exposition.start_server(cache, config.exporter_port, config.exporter_address)
+    pusher = Pusher(session, config, exporters[0].metrics, exporters) if config.push_url else None
+
+    async def on_poll(network_name: str):
+        await cache.update()
+        if pusher:
+            await pusher.enqueue(network_name)
+
+    try:
+        for e in exporters:
+            if not collector:
+                # On demand mode serves the families of the last poll
+                e.on_change = cache.invalidate
+            await e.open(session)
+        monitor = asyncio.ensure_future(monitor_event_loop(session, exporters[0].metrics))
+        tasks = [asyncio.ensure_future(e.blocks.run(stop)) for e in exporters if e.blocks]
+        if pusher:
+            tasks.append(asyncio.ensure_future(pusher.run(stop)))
+        if collector:
+            collector.loop = loop
+            await stop.wait()
+        else:
+            await asyncio.gather(*[e.run(stop, functools.partial(on_poll, e.config.network_name.value))
+                                   for e in exporters])
+        monitor.cancel()
+        for t in tasks:
+            t.cancel()
+    finally:
+        for e in exporters:
+            e.close()
+        await runner.cleanup()
+        await session.close()
+
+
+async def monitor_event_loop(session: aiohttp.ClientSession, metrics: Metrics, interval: float = 1):
+    # How late a timer fires on the loop and how busy the shared connection pool is
+    connector = session.connector
+    metrics.gauge_pool_connection_limit.set(connector.limit)
+    while True:
+        start = perf_counter()
+        await asyncio.sleep(interval)
+        metrics.gauge_event_loop_lag.set(max(perf_counter() - start - interval, 0))
+        in_use = connections_in_use(connector)
+        if in_use is not None:
+            metrics.gauge_pool_connections_in_use.set(in_use)
 
 
 def main():
     config = Config()
     print(config)
-    e = Exporter(config)
-    e.serve_forever()
+    metrics = Metrics(CollectorRegistry() if config.scrape_on_demand else REGISTRY, config.latency_buckets)
+    exporters = [Exporter(c, metrics) for c in config.network_configs()]
+    serve_forever(config, exporters)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,68 @@
+import warnings
+from typing import Dict
+
+import numpy as np
+
+
+def block_rate(heights: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+    # Least squares slope of block height over time for each node (column) in blocks per
+    # second. Missing samples are NaN and are left out, nodes with < 2 samples get NaN.
+    mask = ~(np.isnan(heights) | np.isnan(timestamps))
+    n = mask.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.where(mask, timestamps, 0)
+        h = np.where(mask, heights, 0)
+        dt = np.where(mask, t - t.sum(axis=0) / n, 0)
+        dh = np.where(mask, h - h.sum(axis=0) / n, 0)
+        slope = (dt * dh).sum(axis=0) / (dt * dt).sum(axis=0)
+    slope[n < 2] = np.nan
+    return slope
+
+
+def summarize(heights: np.ndarray, timestamps: np.ndarray, latencies: np.ndarray,
+              reference_height: float) -> Dict[str, np.ndarray]:
+    # All arrays are (polls, nodes) windows ordered oldest to newest
+    rate = block_rate(heights, timestamps)
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        # All NaN columns (nodes that never answered in the window) warn and give NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        block_time = np.where(rate > 0, 1 / rate, np.nan)
+        latency_mean = np.nanmean(latencies, axis=0)
+    latency_p95 = latency_percentile(latencies, 95)
+    return {
+        'block_time': block_time,
+        'block_lag': reference_height - heights[-1],
+        'latency_mean': latency_mean,
+        'latency_p95': latency_p95,
+    }
+
+
+def productivity(previous: Dict[str, np.ndarray], current: Dict[str, np.ndarray],
+                 elapsed: float) -> Dict[str, np.ndarray]:
+    # Changes of the getPReps numbers between two P-Rep lists, both lined up with the current
+    # one. NaN for nodes missing from either list and, for the block rates, for nodes that
+    # had no blocks to validate in between.
+    total = current['totalBlocks'] - previous['totalBlocks']
+    missed = total - (current['validatedBlocks'] - previous['validatedBlocks'])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        validating = total > 0
+        return {
+            'validation_rate': np.where(validating, 1 - missed / total, np.nan),
+            'missed_blocks_rate': np.where(validating, missed / elapsed, np.nan),
+            'delegation_change': current['delegated'] - previous['delegated'],
+        }
+
+
+def latency_percentile(latencies: np.ndarray, q: float) -> np.ndarray:
+    # Per node percentile over a (polls, nodes) window, NaN for nodes without samples.
+    # Same as np.nanpercentile with linear interpolation but sorts once, NaN sort last.
+    ordered = np.sort(latencies, axis=0)
+    n = (~np.isnan(latencies)).sum(axis=0)
+    position = np.maximum(n - 1, 0) * q / 100
+    lower = np.floor(position).astype(int)
+    upper = np.minimum(lower + 1, np.maximum(n - 1, 0))
+    low = np.take_along_axis(ordered, lower[None], axis=0)[0]
+    high = np.take_along_axis(ordered, upper[None], axis=0)[0]
+    result = low + (high - low) * (position - lower)
+    result[n == 0] = np.nan
+    return result
@@ -0,0 +1,43 @@
+from typing import List, Optional
+
+import numpy as np
+
+
+class NodeBackoff:
+    # Per node polling schedule indexed by registry index. Healthy nodes are polled every
+    # iteration. Once a node failed after_failures polls in a row it is only retried after
+    # poll_interval * factor ** n seconds, capped at max_interval, where n grows with every
+    # failed retry. The retry doubles as the probe that notices the node is back.
+    def __init__(self, poll_interval: float, factor: float = 2, max_interval: float = 300, after_failures: int = 2):
+        self.poll_interval = poll_interval
+        self.factor = factor
+        self.max_interval = max_interval
+        self.after_failures = after_failures
+
+        self.failures = np.zeros(0, dtype=int)
+        self.next_attempt = np.zeros(0)
+
+    def remap(self, previous_index: List[Optional[int]]):
+        index = np.array([-1 if i is None else i for i in previous_index], dtype=int)
+        known = index >= 0
+        failures = np.zeros(len(index), dtype=int)
+        next_attempt = np.zeros(len(index))
+        failures[known] = self.failures[index[known]]
+        next_attempt[known] = self.next_attempt[index[known]]
+        self.failures, self.next_attempt = failures, next_attempt
+
+    def due(self, now: float) -> np.ndarray:
+        return self.next_attempt <= now
+
+    def backed_off(self, now: float) -> np.ndarray:
+        return ~self.due(now)
+
+    def update(self, now: float, attempted: np.ndarray, responded: np.ndarray):
+        failed = attempted & ~responded
+        self.failures[attempted & responded] = 0
+        self.failures[failed] += 1
+
+        retries = self.failures - self.after_failures
+        delay = np.minimum(self.poll_interval * self.factor ** np.maximum(retries, 0), self.max_interval)
+        backing_off = failed & (retries >= 0)
+        self.next_attempt[backing_off] = now + delay[backing_off]
@@ -0,0 +1,147 @@
+# Chain level gauges updated for every block instead of once per poll. Blocks are followed
+# through the main API's block websocket (/api/v3/icon_dex/block) and fetched with
+# icx_getBlockByHeight. Endpoints without the websocket are polled with icx_getLastBlock every
+# block_poll_interval seconds instead.
+import asyncio
+from collections import deque
+from time import time
+from typing import Callable, Optional
+
+import aiohttp
+
+from icon_network_exporter.config import Config
+from icon_network_exporter.decoding import loads
+from icon_network_exporter.exceptions import IconRPCError
+from icon_network_exporter.jsonrpc import JsonRpcClient
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.rpc import get_block_by_height, get_last_block
+
+# Blocks fetched at most when catching up after a gap, past that the interval and
+# transaction count of the skipped blocks are lost
+MAX_CATCH_UP = 100
+
+
+def get_websocket_url(main_api_endpoint: str) -> str:
+    # https://ctz.solidwallet.io/api/v3 -> wss://ctz.solidwallet.io/api/v3/icon_dex/block
+    url = main_api_endpoint.rstrip('/')
+    if url.startswith('http'):
+        url = 'ws' + url[len('http'):]
+    return f'{url}/icon_dex/block'
+
+
+class BlockSubscriber:
+    def __init__(self, session: aiohttp.ClientSession, config: Config, metrics: Metrics, rpc: JsonRpcClient):
+        self.session = session
+        self.metrics = metrics
+        self.rpc = rpc
+        self.network_name = config.network_name.value
+        self.url = get_websocket_url(config.main_api_endpoint)
+        self.poll_interval = config.block_poll_interval
+        self.use_websocket = True
+
+        self.height: Optional[int] = None
+        self.time_stamp: Optional[int] = None
+        self.last_block_time: float = 0
+        # Set from the exporter's getIISSInfo call
+        self.term_change_block: Optional[int] = None
+        # Transaction count of recent blocks, to seed total_tx from a peer's count at an earlier height
+        self.recent_txs = deque(maxlen=MAX_CATCH_UP)
+        self.total_tx: Optional[int] = None
+        # Called after each block's gauges are set
+        self.on_block: Optional[Callable[[], None]] = None
+
+    def is_live(self, max_age: float) -> bool:
+        # Whether the gauges are kept up to date by the subscription rather than the polls
+        return self.height is not None and time() - self.last_block_time < max_age
+
+    async def run(self, stop: asyncio.Event):
+        while not stop.is_set():
+            try:
+                if self.use_websocket:
+                    await self.subscribe()
+                else:
+                    await self.poll_blocks()
+            except aiohttp.WSServerHandshakeError as e:
+                print(f"No block websocket at {self.url} ({e.status}), polling for blocks")
+                self.use_websocket = False
+                continue
+            except (aiohttp.ClientError, asyncio.TimeoutError, IconRPCError, ValueError, KeyError) as e:
+                print(f"Block subscription on {self.network_name} failed: {e!r}")
+
+            try:
+                await asyncio.wait_for(stop.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def subscribe(self):
+        if self.height is None:
+            self.process_block(await self.rpc.call(get_last_block()))
+
+        async with self.session.ws_connect(self.url, heartbeat=30) as ws:
+            # Notifications start at the requested height so nothing is missed after a reconnect
+            await ws.send_json({'height': hex(self.height + 1)})
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    break
+                notification = loads(msg.data)
+                if 'height' in notification:
+                    await self.catch_up(int(notification['height'], 16))
+                elif notification.get('code'):
+                    raise IconRPCError(f"Block subscription at {self.url} returned {notification}")
+
+    async def poll_blocks(self):
+        while True:
+            block = await self.rpc.call(get_last_block())
+            if self.height is None or block['height'] > self.height + 1:
+                await self.catch_up(block['height'] - 1)
+            if self.height is None or block['height'] > self.height:
+                self.process_block(block)
+            await asyncio.sleep(self.poll_interval)
+
+    async def catch_up(self, height: int):
+        # Fetches the blocks up to height, the last MAX_CATCH_UP of them after a long gap
+        if self.height is None:
+            return
+        start = max(self.height + 1, height - MAX_CATCH_UP + 1)
+        if start > height:
+            return
+        blocks = await self.rpc.call_many([get_block_by_height(h) for h in range(start, height + 1)])
+        for block in blocks:
+            self.process_block(block)
+
+    def process_block(self, block: dict):
+        height, time_stamp = block['height'], block['time_stamp']
+        if self.height is not None and height <= self.height:
+            return
+        if self.height is not None and height == self.height + 1:
+            # time_stamp is in microseconds
+            self.metrics.gauge_prep_reference_block_time.labels(self.network_name).set(
+                (time_stamp - self.time_stamp) / 1e6)
+        elif self.height is not None:
+            # Blocks went missing, total_tx is seeded again from the next poll
+            self.total_tx = None
+            self.recent_txs.clear()
+
+        num_txs = len(block.get('confirmed_transaction_list', ()))
+        self.recent_txs.append((height, num_txs))
+        if self.total_tx is not None:
+            self.total_tx += num_txs
+            self.metrics.gauge_total_tx.labels(self.network_name).set(self.total_tx)
+
+        self.height, self.time_stamp = height, time_stamp
+        self.last_block_time = time()
+        self.metrics.gauge_prep_reference_block_height.labels(self.network_name).set(height)
+        self.metrics.gauge_last_block_height.labels(self.network_name).set(height)
+        if self.term_change_block is not None:
+            self.metrics.gauge_blocks_left_in_term.labels(self.network_name).set(self.term_change_block - height)
+        if self.on_block:
+            self.on_block()
+
+    def seed_total_tx(self, height: int, total_tx: int):
+        # total_tx is a node's count at height, carried forward with the blocks seen since
+        if self.total_tx is not None or not self.recent_txs or height > self.height:
+            return
+        if self.recent_txs[0][0] > height + 1:
+            return
+        self.total_tx = int(total_tx) + sum(n for h, n in self.recent_txs if h > height)
+        self.metrics.gauge_total_tx.labels(self.network_name).set(self.total_tx)
@@ -0,0 +1,50 @@
+import asyncio
+from time import time
+from typing import List, Optional
+
+from icon_network_exporter.metrics import Metrics
+
+
+class OnDemandCollector:
+    # Serves the metric families of the last poll and triggers a new poll when a scrape
+    # comes in and the snapshot is older than max_staleness. MetricsCache awaits refresh()
+    # on the exporter's event loop before rendering, concurrent scrapes all wait on the same
+    # in flight poll. collect() then runs in the cache's executor thread and finds the
+    # snapshot fresh.
+    def __init__(self, exporters: list, metrics: Metrics, max_staleness: float, timeout: float):
+        self.exporters = exporters
+        self.metrics = metrics
+        self.max_staleness = max_staleness
+        self.timeout = timeout
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.families: List = []
+        self.last_poll: float = 0
+        self.in_flight: Optional[asyncio.Future] = None
+
+    async def refresh(self) -> float:
+        # Returns the time of the poll the snapshot is from
+        if time() - self.last_poll < self.max_staleness:
+            return self.last_poll
+        if self.in_flight is None:
+            self.in_flight = asyncio.ensure_future(self._poll())
+        await asyncio.shield(self.in_flight)
+        return self.last_poll
+
+    async def _poll(self):
+        try:
+            await asyncio.gather(*[e.poll() for e in self.exporters])
+            self.families = list(self.metrics.registry.collect())
+            self.last_poll = time()
+        finally:
+            self.in_flight = None
+
+    def collect(self):
+        if self.loop:
+            future = asyncio.run_coroutine_threadsafe(self.refresh(), self.loop)
+            try:
+                future.result(self.timeout)
+            except Exception as e:
+                # Serve the last snapshot, the poll carries on for the next scrape
+                print(f"On demand poll not done within {self.timeout}s: {e!r}")
+        return self.families
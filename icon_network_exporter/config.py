@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any
+from typing import Any, List
 from pydantic import BaseSettings
 
 
@@ -32,19 +32,105 @@ class NetworksEnum(str, Enum):
 class Config(BaseSettings):
 
     network_name: NetworksEnum = NetworksEnum.mainnet
+    # Comma separated networks to scrape from one process, ie "mainnet,zicon" or "all".
+    # Overrides network_name when set.
+    networks: str = None
     exporter_port: int = 6100
-    exporter_address: str = ''
+    exporter_address: str = '0.0.0.0'
 
     main_api_endpoint: str = None
     end_ranking: str = None  # number_preps_scrape_hex
+    # Port of the nodes' /api/v1/status/peer endpoint
+    peer_api_port: int = 9000
 
+    # Names or addresses of the P-Reps the reference block height is taken over, defaults to
+    # the main P-Reps. The reference is the highest block reached by at least reference_quorum
+    # of the responding ones, .5 being the median.
     reference_nodes: list = None
+    reference_quorum: float = .5
     num_data_points_retentation: int = 5
+    # Number of polls of per node samples kept in memory
+    sample_capacity: int = 120
+    # Per node series are removed after a node missed this many polls in a row, or once it
+    # is backed off
+    evict_after_missed_polls: int = 12
 
     poll_interval: float = 5
-    poll_timeout: float = .5
-    refresh_prep_list_count: int = 60
-    parallelism: int = 1
+    # Per request timeouts for the peer status endpoints
+    poll_timeout: float = 2
+    poll_connect_timeout: float = 1
+    poll_read_timeout: float = 2
+    # Scraping stops waiting on nodes after this many seconds, defaults to poll_interval
+    iteration_deadline: float = None
+    # Scraping returns after soft_deadline seconds, responses coming in later are used by the
+    # next poll as long as they are back by iteration_deadline. Defaults to iteration_deadline.
+    soft_deadline: float = None
+    # A second request is sent to a node once the first one takes longer than this percentile
+    # of its latency over the sample window, and at least hedge_min_delay seconds, ie 95. Second
+    # requests count against parallelism. None disables.
+    hedge_percentile: float = None
+    hedge_min_delay: float = .1
+    # The P-Rep list is refreshed when a new term starts and at least every this many polls
+    refresh_prep_list_count: int = 720
+
+    # Poll the nodes when prometheus scrapes instead of every poll_interval. A poll is only
+    # triggered when the last one is older than max_staleness, defaults to poll_interval.
+    scrape_on_demand: bool = False
+    max_staleness: float = None
+    # How long a scrape waits on an on demand poll before serving the previous one
+    scrape_timeout: float = 8
+    # Gauges set between polls, by the block subscription or late responses, are rendered to
+    # /metrics at most every metrics_update_interval seconds
+    metrics_update_interval: float = 1
+    # Buckets in seconds of the icon_prep_node_latency_seconds histograms, ie '[.05, .1, .5, 1]'
+    latency_buckets: list = None
+    # Max number of in flight peer status requests
+    parallelism: int = 32
+    # Nodes that failed backoff_after_failures polls in a row are retried less and less often,
+    # up to every backoff_max_interval seconds
+    backoff_after_failures: int = 2
+    backoff_factor: float = 2
+    backoff_max_interval: float = 300
+
+    # Split the scraping across this many worker processes, 0 scrapes from the main process.
+    # parallelism and connection_limit are divided between the workers.
+    scrape_workers: int = 0
+
+    # Directory the P-Rep list and recent samples are saved to every snapshot_interval seconds
+    # and restored from on startup, unless the snapshot is older than snapshot_max_age seconds
+    snapshot_dir: str = None
+    snapshot_interval: float = 60
+    snapshot_max_age: float = 600
+
+    # Update the chain level gauges for every block through the main API's block websocket,
+    # polling icx_getLastBlock every block_poll_interval seconds when it has none
+    block_subscription: bool = False
+    block_poll_interval: float = 1
+
+    # Push the metrics after every poll, as a prometheus remote write request to push_url or,
+    # with push_format 'pushgateway', as text to a Pushgateway url ie
+    # http://pushgateway:9091/metrics/job/icon. push_labels are added to every remote write
+    # series ie '{"site": "seoul"}'. Up to push_queue_size batches are kept while the receiver
+    # is unreachable, retried up to every push_retry_max_interval seconds.
+    push_url: str = None
+    push_format: str = 'remote_write'
+    push_labels: dict = None
+    push_queue_size: int = 100
+    push_timeout: float = 10
+    push_retry_max_interval: float = 30
+
+    # Run as replica replica_index of replica_count, ie REPLICA_INDEX from the pod ordinal. Each
+    # replica scrapes its rendezvous hash share of the nodes, every node being scraped by
+    # replica_overlap replicas, and replica_overlap of them export the chain level gauges.
+    replica_index: int = 0
+    replica_count: int = 1
+    replica_overlap: int = 1
+
+    # Shared connection pool used for scraping the peer status endpoints
+    connection_limit: int = 100
+    connection_limit_per_host: int = 2
+    dns_cache_ttl: int = 300
+    keepalive_timeout: float = 30
 
     def __init__(self, **values: Any):
         super().__init__(**values)
@@ -54,6 +140,33 @@ class Config(BaseSettings):
         if not self.end_ranking:
             self.end_ranking = RPC_URL_MAP[self.network_name]['end_ranking']
 
+        self.sample_capacity = max(self.sample_capacity, self.num_data_points_retentation,
+                                   self.evict_after_missed_polls)
+
+        if not self.max_staleness:
+            self.max_staleness = self.poll_interval
+
+        if not self.iteration_deadline:
+            self.iteration_deadline = self.poll_interval
+
+        if not 0 <= self.replica_index < self.replica_count:
+            raise ValueError(f"replica_index {self.replica_index} out of range for {self.replica_count} replicas")
+        self.replica_overlap = min(max(self.replica_overlap, 1), self.replica_count)
+
+    def network_configs(self) -> List['Config']:
+        if not self.networks:
+            return [self]
+
+        if self.networks.strip() == 'all':
+            names = list(RPC_URL_MAP)
+        else:
+            names = [n.strip() for n in self.networks.split(',') if n.strip()]
+
+        # Endpoints and rankings come from RPC_URL_MAP for each network
+        values = self.dict(exclude={'network_name', 'networks', 'main_api_endpoint', 'end_ranking'})
+        return [Config(**values, network_name=NetworksEnum(n), networks=None,
+                       main_api_endpoint=None, end_ranking=None) for n in names]
+
 
 if __name__ == '__main__':
     c = Config()
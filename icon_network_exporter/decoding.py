@@ -0,0 +1,49 @@
+# Decoding of the peer status and JSON-RPC payloads into only the fields the exporter uses.
+# orjson is used when it is installed (pip install icon-network-exporter[fast]).
+import json
+
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
+# Fields of a getPReps entry the registry uses
+PREP_FIELDS = ('name', 'address', 'p2pEndpoint')
+# Numeric fields of a getPReps entry kept in the registry's columns, parsed from hex.
+# Amounts are converted from loop to ICX.
+PREP_NUMBERS = ('totalBlocks', 'validatedBlocks', 'delegated', 'stake', 'penalty')
+PREP_AMOUNTS = ('delegated', 'stake')
+
+
+class PeerStatus:
+    __slots__ = ('api_endpoint', 'block_height', 'state', 'total_tx', 'timestamp', 'latency')
+
+    def __init__(self, api_endpoint: str, block_height: int, state: str, total_tx: int,
+                 timestamp: float = None, latency: float = None):
+        self.api_endpoint = api_endpoint
+        self.block_height = block_height
+        self.state = state
+        self.total_tx = total_tx
+        self.timestamp = timestamp
+        self.latency = latency
+
+    def __repr__(self):
+        return f"PeerStatus({self.api_endpoint!r}, {self.block_height}, {self.state!r})"
+
+
+def decode_peer_status(body: bytes, api_endpoint: str) -> PeerStatus:
+    resp = loads(body)
+    return PeerStatus(api_endpoint, resp['block_height'], resp['state'], resp['total_tx'])
+
+
+def decode_preps(result: dict) -> list:
+    preps = []
+    for v in result['preps']:
+        prep = {k: v[k] for k in PREP_FIELDS}
+        for k in PREP_NUMBERS:
+            if k in v:
+                prep[k] = int(v[k], 16) / 10 ** 18 if k in PREP_AMOUNTS else int(v[k], 16)
+        preps.append(prep)
+    return preps
@@ -0,0 +1,142 @@
+# /metrics served from the exporter's event loop. The payload is rendered once per completed
+# poll and kept in memory plain and gzipped, scrapes in between are served from memory with
+# an ETag so that any number of prometheus servers costs the same as one. Gauges set between
+# polls, ie per block, get the payload rendered again at most every min_update_interval.
+import asyncio
+import gzip
+import hashlib
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Optional
+
+from aiohttp import web
+from prometheus_client import CollectorRegistry, REGISTRY, CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client.openmetrics import exposition as openmetrics
+
+GZIP_LEVEL = 6
+
+FORMATS = {
+    'text': (generate_latest, CONTENT_TYPE_LATEST),
+    'openmetrics': (openmetrics.generate_latest, openmetrics.CONTENT_TYPE_LATEST),
+}
+
+
+class Payload:
+    __slots__ = ('content_type', 'plain', 'gzipped', 'etag')
+
+    def __init__(self, content_type: str, plain: bytes):
+        self.content_type = content_type
+        self.plain = plain
+        self.gzipped = gzip.compress(plain, GZIP_LEVEL)
+        self.etag = hashlib.blake2b(plain, digest_size=8).hexdigest()
+
+
+def choose_format(accept: str) -> str:
+    for media_range in accept.split(','):
+        if media_range.split(';')[0].strip() == 'application/openmetrics-text':
+            return 'openmetrics'
+    return 'text'
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    for coding in accept_encoding.split(','):
+        name, *params = [t.strip() for t in coding.split(';')]
+        if name in ('gzip', '*'):
+            for p in params:
+                if p.startswith('q='):
+                    try:
+                        return float(p[2:]) > 0
+                    except ValueError:
+                        return False
+            return True
+    return False
+
+
+class MetricsCache:
+    # refresh is awaited before serving a scrape and returns the time of the last completed
+    # poll, used by on demand mode to poll first
+    def __init__(self, registry: CollectorRegistry = REGISTRY,
+                 refresh: Callable[[], Awaitable[float]] = None, refresh_timeout: float = None,
+                 min_update_interval: float = 1):
+        self.registry = registry
+        self.refresh = refresh
+        self.refresh_timeout = refresh_timeout
+        self.min_update_interval = min_update_interval
+        self.payloads: Dict[str, Payload] = {}
+        self.last_poll: Optional[float] = None
+        self.rendered_at: float = 0
+        self.scheduled: Optional[asyncio.Future] = None
+        self.lock = asyncio.Lock()
+
+    def render(self, fmt: str) -> Payload:
+        encoder, content_type = FORMATS[fmt]
+        return Payload(content_type, encoder(self.registry))
+
+    async def update(self, last_poll: float = None):
+        # Called after each completed poll. The text format is rendered right away off the
+        # loop, OpenMetrics only once it is asked for.
+        async with self.lock:
+            if last_poll is not None and last_poll == self.last_poll:
+                return
+            await self._render_text()
+            self.last_poll = last_poll
+
+    async def _render_text(self):
+        loop = asyncio.get_running_loop()
+        self.rendered_at = monotonic()
+        payload = await loop.run_in_executor(None, self.render, 'text')
+        self.payloads = {'text': payload}
+
+    def invalidate(self):
+        # Called when gauges change between polls. Changes coming in while a render is
+        # scheduled are picked up by it.
+        if self.scheduled is None:
+            self.scheduled = asyncio.ensure_future(self._update_later())
+
+    async def _update_later(self):
+        try:
+            await asyncio.sleep(max(self.rendered_at + self.min_update_interval - monotonic(), 0))
+        finally:
+            self.scheduled = None
+        async with self.lock:
+            await self._render_text()
+
+    async def get(self, fmt: str) -> Payload:
+        if self.refresh:
+            try:
+                await self.update(await asyncio.wait_for(self.refresh(), self.refresh_timeout))
+            except asyncio.TimeoutError:
+                print(f"On demand poll not done within {self.refresh_timeout}s, serving the previous one")
+        if fmt not in self.payloads:
+            async with self.lock:
+                if fmt not in self.payloads:
+                    loop = asyncio.get_running_loop()
+                    self.payloads[fmt] = await loop.run_in_executor(None, self.render, fmt)
+        return self.payloads[fmt]
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await self.get(choose_format(request.headers.get('Accept', '')))
+        use_gzip = accepts_gzip(request.headers.get('Accept-Encoding', ''))
+        # Each representation gets its own strong ETag
+        etag = f'{payload.etag}-gz' if use_gzip else payload.etag
+        headers = {'Vary': 'Accept-Encoding, Accept'}
+        if etag in [t.strip().strip('"') for t in request.headers.get('If-None-Match', '').split(',')]:
+            response = web.Response(status=304, headers=headers)
+            response.etag = etag
+            return response
+
+        if use_gzip:
+            headers['Content-Encoding'] = 'gzip'
+        response = web.Response(body=payload.gzipped if use_gzip else payload.plain, headers=headers)
+        response.headers['Content-Type'] = payload.content_type
+        response.etag = etag
+        return response
+
+
+async def start_server(cache: MetricsCache, port: int, address: str = '0.0.0.0') -> web.AppRunner:
+    # Any path serves the metrics like prometheus_client's start_http_server did
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', cache.handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, address, port).start()
+    return runner
@@ -0,0 +1,110 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+import aiohttp
+
+from icon_network_exporter.decoding import loads
+from icon_network_exporter.exceptions import IconRPCError
+from icon_network_exporter.utils import post_rpc
+
+# Errors of endpoints that can't handle a batch: parse error, invalid request and method
+# not found. Any other error for the whole batch is taken as transient.
+BATCH_UNSUPPORTED_CODES = (-32700, -32600, -32601)
+
+
+class JsonRpcClient:
+    # Calls made in the same loop tick, ie the coroutines gathered for an iteration, are
+    # sent as one JSON-RPC 2.0 batch and the responses handed back by id. Endpoints that
+    # reject batches get the calls one request each from then on.
+    def __init__(self, session: aiohttp.ClientSession, url: str, timeout: float = 10):
+        self.session = session
+        self.url = url
+        self.timeout = timeout
+        self.supports_batch: bool = True
+
+        self.pending: List[Tuple[dict, asyncio.Future]] = []
+        self.next_id = 1
+
+    async def call(self, payload: dict):
+        return await self._queue(payload)
+
+    async def call_many(self, payloads: List[dict]) -> list:
+        # Queued together so they always end up in the same batch
+        return await asyncio.gather(*[self._queue(p) for p in payloads])
+
+    def _queue(self, payload: dict) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((dict(payload, id=self.next_id), future))
+        self.next_id += 1
+        if len(self.pending) == 1:
+            loop.call_soon(lambda: asyncio.ensure_future(self.flush()))
+        return future
+
+    async def flush(self):
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+        try:
+            await self._flush(pending)
+        except Exception as e:
+            # Nobody awaits this task, so the callers get the error instead of waiting forever
+            for _, future in pending:
+                _set(future, exception=IconRPCError(f"Request to {self.url} failed: {e!r}"))
+
+    async def _flush(self, pending: List[Tuple[dict, asyncio.Future]]):
+        if len(pending) == 1 or not self.supports_batch:
+            await asyncio.gather(*[self._call_single(payload, future) for payload, future in pending])
+            return
+
+        try:
+            responses = await self._post([payload for payload, _ in pending])
+        except IconRPCError as e:
+            for _, future in pending:
+                _set(future, exception=e)
+            return
+
+        if isinstance(responses, dict):
+            error = responses.get('error')
+            if not isinstance(error, dict) or error.get('code') not in BATCH_UNSUPPORTED_CODES:
+                raise IconRPCError(f"Batch request to {self.url} returned {responses}")
+        if not isinstance(responses, list):
+            print(f"{self.url} does not support batch requests, sending requests one by one")
+            self.supports_batch = False
+            await asyncio.gather(*[self._call_single(payload, future) for payload, future in pending])
+            return
+
+        by_id = {r.get('id'): r for r in responses if isinstance(r, dict)}
+        for payload, future in pending:
+            response = by_id.get(payload['id'])
+            if response is None:
+                _set(future, exception=IconRPCError(f"No response for {payload['method']} in batch from {self.url}"))
+            elif 'result' not in response:
+                _set(future, exception=IconRPCError(
+                    f"{payload['method']} request to {self.url} returned {response.get('error', response)}"))
+            else:
+                _set(future, result=response['result'])
+
+    async def _call_single(self, payload: dict, future: asyncio.Future):
+        try:
+            _set(future, result=await post_rpc(self.session, self.url, payload, self.timeout))
+        except IconRPCError as e:
+            _set(future, exception=e)
+
+    async def _post(self, payload: list):
+        try:
+            async with self.session.post(url=self.url, json=payload,
+                                         timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                return loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise IconRPCError(f"Batch request to {self.url} failed: {e!r}")
+
+
+def _set(future: asyncio.Future, result=None, exception: Optional[Exception] = None):
+    # The caller may have been cancelled while the batch was in flight
+    if future.done():
+        return
+    if exception:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
@@ -0,0 +1,58 @@
+from typing import Dict, Iterable, Set
+
+import numpy as np
+from prometheus_client import Gauge
+
+from icon_network_exporter.registry import PRep
+
+
+class LabelLifecycle:
+    # Removes the children of the per node gauges for P-Reps that left the list or
+    # stopped responding so their last values are not exported forever.
+    def __init__(self, gauges: Dict[str, Gauge], network_name: str, keep: Iterable[str] = ('rank',)):
+        self.gauges = gauges
+        self.network_name = network_name
+        # Gauges that stay while the P-Rep is registered, even when it is not responding
+        self.keep = set(keep)
+        self.evicted: Set[str] = set()
+
+    def _remove(self, name: str, keys: Iterable[str]):
+        for k in keys:
+            try:
+                self.gauges[k].remove(name, self.network_name)
+            except KeyError:
+                pass
+
+    def _detach(self, prep: PRep):
+        # Values set while the node is evicted go to children that are no longer exported
+        keys = set(self.gauges) - self.keep
+        for k in keys:
+            prep.gauges[k] = self.gauges[k].labels(prep.name, self.network_name)
+        self._remove(prep.name, keys)
+
+    def refresh(self, old_preps: Iterable[PRep], new_preps: Iterable[PRep]):
+        # Called after a P-Rep list refresh. Renamed P-Reps show up as a departed name.
+        # New and renamed P-Reps stay evicted until the node responds.
+        names = {p.name for p in new_preps}
+        old_names = {p.name for p in old_preps}
+        for name in old_names - names:
+            self._remove(name, self.gauges)
+
+        self.evicted = (self.evicted & names) | (names - old_names)
+        for prep in new_preps:
+            if prep.name in self.evicted:
+                self._detach(prep)
+
+    def update(self, preps: Iterable[PRep], responded: np.ndarray, stale: np.ndarray):
+        # Both indexed by registry index; stale is True when the node missed every poll in
+        # the eviction window
+        for prep in preps:
+            if responded[prep.index]:
+                if prep.name in self.evicted:
+                    # Children are looked up again as the node's values are set
+                    for k in set(self.gauges) - self.keep:
+                        prep.gauges.pop(k, None)
+                    self.evicted.discard(prep.name)
+            elif stale[prep.index] and prep.name not in self.evicted:
+                self._detach(prep)
+                self.evicted.add(prep.name)
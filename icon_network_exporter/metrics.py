@@ -0,0 +1,163 @@
+from prometheus_client import Gauge, Histogram, Counter, REGISTRY, CollectorRegistry
+
+LATENCY_BUCKETS = (.01, .025, .05, .1, .25, .5, 1, 2, 5)
+
+
+class Metrics:
+    # Gauges shared by every network an exporter process scrapes, all series are
+    # labelled by network_name
+    def __init__(self, registry: CollectorRegistry = REGISTRY, latency_buckets: tuple = None):
+        self.registry = registry
+
+        self.gauge_prep_node_block_height = Gauge('icon_prep_node_block_height',
+                                                  'Node block height',
+                                                  ['name', 'network_name'], registry=registry)
+        self.gauge_prep_node_state = Gauge('icon_prep_node_state', 'Number to indicate node state - ie Vote=1, Watch=2',
+                                           ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_rank = Gauge('icon_prep_node_rank', 'Rank of the node', ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_block_time = Gauge('icon_prep_node_block_time', 'Time in seconds per block for a node',
+                                                ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_latency = Gauge('icon_prep_node_latency', 'Time in ms of the last peer status request to node',
+                                             ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_up = Gauge('icon_prep_node_up',
+                                        'Whether the node answered the last poll - 0 when it failed or is backed off',
+                                        ['name', 'network_name'], registry=registry)
+
+        self.histogram_prep_node_latency = Histogram('icon_prep_node_latency_seconds',
+                                                     'Time in seconds of successful peer status requests to node',
+                                                     ['name', 'network_name'], registry=registry,
+                                                     buckets=latency_buckets or LATENCY_BUCKETS)
+
+        self.gauge_prep_node_block_lag = Gauge('icon_prep_node_block_lag',
+                                               'Number of blocks the node is behind the reference node',
+                                               ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_latency_mean = Gauge('icon_prep_node_latency_mean',
+                                                  'Mean latency in ms of get requests to node over the window',
+                                                  ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_latency_p95 = Gauge('icon_prep_node_latency_p95',
+                                                 '95th percentile latency in ms of get requests to node over the window',
+                                                 ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_reference_block_height = Gauge('icon_prep_reference_block_height',
+                                                       'Block height of reference node', ['network_name'], registry=registry)
+
+        self.gauge_prep_reference_block_time = Gauge('icon_prep_reference_block_time',
+                                                     'Time in seconds per block', ['network_name'], registry=registry)
+
+        self.gauge_total_tx = Gauge('icon_total_tx',
+                                    'Total number of transactions', ['network_name'], registry=registry)
+
+        self.gauge_last_block_height = Gauge('icon_last_block_height',
+                                             'Height of the last block of the main API endpoint', ['network_name'],
+                                             registry=registry)
+
+        self.gauge_total_supply = Gauge('icon_total_supply', 'Total supply of ICX', ['network_name'], registry=registry)
+
+        self.gauge_blocks_left_in_term = Gauge('icon_blocks_left_in_term',
+                                               'Number of blocks left in term', ['network_name'], registry=registry)
+
+        self.gauge_total_active_main_preps = Gauge('icon_total_active_main_preps',
+                                                   'Total number of active nodes above rank 22', ['network_name'], registry=registry)
+
+        self.gauge_total_active_sub_preps = Gauge('icon_total_active_sub_preps',
+                                                  'Total number of active validators - (Watch / Vote / BlockGenerate)',
+                                                  ['network_name'], registry=registry)
+
+        self.gauge_total_inactive_sub_preps = Gauge('icon_total_inactive_sub_preps',
+                                                    'Total number of inactive validators - (nodes off / in blocksync)',
+                                                    ['network_name'], registry=registry)
+
+        self.gauge_prep_node_delegated = Gauge('icon_prep_node_delegated', 'ICX delegated to the P-Rep',
+                                               ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_stake = Gauge('icon_prep_node_stake', 'ICX staked by the P-Rep',
+                                           ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_penalty = Gauge('icon_prep_node_penalty',
+                                             'Penalty of the P-Rep - 0 none / 1 disqualified / 2 low productivity / '
+                                             '3 block validation', ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_validation_rate = Gauge('icon_prep_node_validation_rate',
+                                                     'Share of its blocks the P-Rep validated between the last two '
+                                                     'P-Rep lists', ['name', 'network_name'], registry=registry)
+
+        self.gauge_prep_node_missed_blocks_rate = Gauge('icon_prep_node_missed_blocks_rate',
+                                                        'Blocks per second the P-Rep failed to validate between the '
+                                                        'last two P-Rep lists', ['name', 'network_name'],
+                                                        registry=registry)
+
+        self.gauge_prep_node_delegation_change = Gauge('icon_prep_node_delegation_change',
+                                                       'Change of the ICX delegated to the P-Rep between the last '
+                                                       'two P-Rep lists', ['name', 'network_name'], registry=registry)
+
+        # Exporter self instrumentation
+        self.histogram_phase_duration = Histogram('icon_exporter_phase_duration_seconds',
+                                                  'Time in seconds spent in each phase of an iteration',
+                                                  ['phase', 'network_name'], registry=registry,
+                                                  buckets=(.01, .05, .1, .25, .5, 1, 2, 3, 5, 10, 30))
+
+        self.histogram_request_duration = Histogram('icon_exporter_request_duration_seconds',
+                                                    'Time in seconds of successful peer status requests',
+                                                    ['network_name'], registry=registry,
+                                                    buckets=LATENCY_BUCKETS)
+
+        self.counter_request_failures = Counter('icon_exporter_request_failures',
+                                                'Number of failed peer status requests by type - '
+                                                'timeout / connect / decode / http / deadline / worker / other',
+                                                ['type', 'network_name'], registry=registry)
+
+        self.counter_hedged_requests = Counter('icon_exporter_hedged_requests',
+                                               'Number of second peer status requests sent to nodes slower '
+                                               'than their recent latency', ['network_name'], registry=registry)
+
+        self.gauge_backed_off_nodes = Gauge('icon_exporter_backed_off_nodes',
+                                            'Number of unreachable nodes not polled this iteration',
+                                            ['network_name'], registry=registry)
+
+        self.gauge_assigned_nodes = Gauge('icon_exporter_assigned_nodes',
+                                          'Number of nodes scraped by this replica', ['network_name'], registry=registry)
+
+        self.counter_push_batches = Counter('icon_exporter_push_batches',
+                                            'Number of batches pushed by outcome - sent / retried / rejected',
+                                            ['status'], registry=registry)
+
+        self.counter_push_dropped = Counter('icon_exporter_push_dropped_batches',
+                                            'Number of batches dropped from the full push queue',
+                                            registry=registry)
+
+        self.gauge_pool_connections_in_use = Gauge('icon_exporter_pool_connections_in_use',
+                                                   'Number of connections of the shared pool in use',
+                                                   registry=registry)
+
+        self.gauge_pool_connection_limit = Gauge('icon_exporter_pool_connection_limit',
+                                                 'Max number of connections of the shared pool', registry=registry)
+
+        self.gauge_event_loop_lag = Gauge('icon_exporter_event_loop_lag_seconds',
+                                          'Delay in seconds of a timer on the event loop', registry=registry)
+
+    def node_gauges(self) -> dict:
+        # Metrics labelled by ('name', 'network_name') keyed by the name used in PRep.gauges
+        return {
+            'block_height': self.gauge_prep_node_block_height,
+            'state': self.gauge_prep_node_state,
+            'rank': self.gauge_prep_node_rank,
+            'block_time': self.gauge_prep_node_block_time,
+            'latency': self.gauge_prep_node_latency,
+            'up': self.gauge_prep_node_up,
+            'block_lag': self.gauge_prep_node_block_lag,
+            'latency_mean': self.gauge_prep_node_latency_mean,
+            'latency_p95': self.gauge_prep_node_latency_p95,
+            'latency_seconds': self.histogram_prep_node_latency,
+            'delegated': self.gauge_prep_node_delegated,
+            'stake': self.gauge_prep_node_stake,
+            'penalty': self.gauge_prep_node_penalty,
+            'validation_rate': self.gauge_prep_node_validation_rate,
+            'missed_blocks_rate': self.gauge_prep_node_missed_blocks_rate,
+            'delegation_change': self.gauge_prep_node_delegation_change,
+        }
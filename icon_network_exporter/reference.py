@@ -0,0 +1,46 @@
+# Reference block height the nodes are compared against. Taken over the configured reference
+# nodes, or the main P-Reps when none are configured, as the highest block at least a quorum
+# of the responding candidates reached. Falls back to the main API's last block when none of
+# the candidates responded.
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from icon_network_exporter.registry import PRepRegistry
+
+NUM_MAIN_PREPS = 22
+
+
+def get_candidates(registry: PRepRegistry, reference_nodes: List[str] = None) -> np.ndarray:
+    # Registry indexes of the candidates, resolved once per P-Rep list refresh. Reference
+    # nodes are given by address or name.
+    if not reference_nodes:
+        return np.array([p.index for p in registry if p.rank < NUM_MAIN_PREPS], dtype=int)
+
+    by_name = {p.name: p for p in registry}
+    candidates = []
+    for node in reference_nodes:
+        prep = registry.get_by_address(node) or by_name.get(node)
+        if prep:
+            candidates.append(prep.index)
+        else:
+            print(f"Reference node {node} is not in the P-Rep list of {registry.network_name}")
+    return np.array(sorted(candidates), dtype=int)
+
+
+def get_reference(heights: np.ndarray, candidates: np.ndarray, quorum: float,
+                  fallback_height: Optional[int] = None) -> Tuple[Optional[int], Optional[int]]:
+    # heights is the latest block height of every node, NaN for nodes that did not respond.
+    # Returns the reference height and the index of the candidate at that height, None when
+    # it is the fallback.
+    candidate_heights = heights[candidates]
+    responded = ~np.isnan(candidate_heights)
+    if not responded.any():
+        return fallback_height, None
+
+    # quorum .5 is the median, 0 the highest block any candidate reached
+    ordered = np.sort(candidate_heights[responded])[::-1]
+    k = min(max(int(np.ceil(quorum * len(ordered))), 1), len(ordered))
+    height = ordered[k - 1]
+    node_index = candidates[responded][np.argmax(candidate_heights[responded] == height)]
+    return int(height), int(node_index)
@@ -0,0 +1,96 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+from prometheus_client import Gauge
+
+from icon_network_exporter.decoding import PREP_NUMBERS
+from icon_network_exporter.utils import get_api_endpoint
+
+
+class NodeGauges(dict):
+    # Gauge children for one node's labels, looked up the first time a value is set so
+    # that the series of values that were never set are not exported as 0
+    __slots__ = ('metrics', 'labels')
+
+    def __init__(self, metrics: Dict[str, Gauge], *labels: str):
+        super().__init__()
+        self.metrics = metrics
+        self.labels = labels
+
+    def __missing__(self, key: str) -> Gauge:
+        child = self[key] = self.metrics[key].labels(*self.labels)
+        return child
+
+
+class PRep:
+    __slots__ = ('index', 'name', 'address', 'rank', 'api_endpoint', 'p2p_endpoint', 'gauges')
+
+    def __init__(self, index: int, name: str, address: str, rank: int, api_endpoint: str, p2p_endpoint: str = None):
+        self.index = index
+        self.name = name
+        self.address = address
+        self.rank = rank
+        self.api_endpoint = api_endpoint
+        self.p2p_endpoint = p2p_endpoint
+        # Gauge children for this node's labels, kept while the P-Rep keeps its name
+        self.gauges: Dict[str, Gauge] = {}
+
+    def __repr__(self):
+        return f"PRep({self.rank}, {self.name!r}, {self.api_endpoint!r})"
+
+
+class PRepRegistry:
+    def __init__(self, network_name: str, gauges: Dict[str, Gauge] = None, peer_api_port: int = 9000):
+        self.network_name = network_name
+        self.peer_api_port = peer_api_port
+        # Per node gauges labelled by ('name', 'network_name')
+        self.gauges = gauges or {}
+
+        self.preps: List[PRep] = []
+        self.by_endpoint: Dict[str, PRep] = {}
+        self.by_address: Dict[str, PRep] = {}
+        # getPReps numbers by field indexed by the P-Rep's index, NaN when missing
+        self.columns: Dict[str, np.ndarray] = {f: np.full(0, np.nan) for f in PREP_NUMBERS}
+
+    def __len__(self):
+        return len(self.preps)
+
+    def __iter__(self):
+        return iter(self.preps)
+
+    def __getitem__(self, index: int) -> PRep:
+        return self.preps[index]
+
+    def rebuild(self, prep_list: list) -> List[Optional[int]]:
+        # prep_list is the getPReps result which is ordered by rank, entries carry their rank
+        # when the list is a replica's share of it. Returns the index each
+        # P-Rep had before the rebuild, None for new ones, so per node state can follow it.
+        # Records of P-Reps that kept their name are reused along with their gauge children.
+        preps = []
+        previous_index = []
+        for i, v in enumerate(prep_list):
+            rank = v.get('rank', i)
+            api_endpoint = get_api_endpoint(v['p2pEndpoint'], self.peer_api_port)
+            previous = self.by_address.get(v['address'])
+            previous_index.append(previous.index if previous else None)
+            if previous and previous.name == v['name']:
+                prep = previous
+                prep.index, prep.rank = i, rank
+                prep.api_endpoint = api_endpoint
+                prep.p2p_endpoint = v['p2pEndpoint']
+            else:
+                prep = PRep(i, v['name'], v['address'], rank, api_endpoint, v['p2pEndpoint'])
+                prep.gauges = NodeGauges(self.gauges, prep.name, self.network_name)
+            preps.append(prep)
+
+        self.preps = preps
+        self.columns = {f: np.array([v.get(f, np.nan) for v in prep_list], dtype=float) for f in PREP_NUMBERS}
+        self.by_endpoint = {p.api_endpoint: p for p in preps}
+        self.by_address = {p.address: p for p in preps}
+        return previous_index
+
+    def get_by_endpoint(self, api_endpoint: str) -> Optional[PRep]:
+        return self.by_endpoint.get(api_endpoint)
+
+    def get_by_address(self, address: str) -> Optional[PRep]:
+        return self.by_address.get(address)
@@ -0,0 +1,192 @@
+# Pushes the metrics after every poll for exporters prometheus can't scrape, either as a
+# prometheus remote write request or as text to a Pushgateway. Remote write batches carry the
+# series of the network that was polled, per node series with the time their node's response
+# came in rather than the time of the push. Batches wait in a
+# bounded queue while the receiver is unreachable, the oldest are dropped when it is full.
+import asyncio
+import struct
+from collections import deque
+from time import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+from prometheus_client import CollectorRegistry, generate_latest
+
+from icon_network_exporter.config import Config
+from icon_network_exporter.metrics import Metrics
+
+try:
+    # pip install icon-network-exporter[remote_write]
+    from snappy import compress as snappy_compress
+except ImportError:
+    snappy_compress = None
+
+REMOTE_WRITE_HEADERS = {
+    'Content-Encoding': 'snappy',
+    'Content-Type': 'application/x-protobuf',
+    'X-Prometheus-Remote-Write-Version': '0.1.0',
+}
+
+
+def varint(n: int) -> bytes:
+    out = bytearray()
+    while n > 0x7f:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def length_delimited(field: int, data: bytes) -> bytes:
+    return varint(field << 3 | 2) + varint(len(data)) + data
+
+
+def encode_labels(labels: Iterable[Tuple[str, str]]) -> bytes:
+    # TimeSeries.labels, field 1 of repeated Label {string name = 1; string value = 2;}
+    return b''.join(length_delimited(1, length_delimited(1, k.encode()) + length_delimited(2, v.encode()))
+                    for k, v in sorted(labels))
+
+
+def encode_sample(value: float, timestamp_ms: int) -> bytes:
+    # TimeSeries.samples, field 2 of repeated Sample {double value = 1; int64 timestamp = 2;}
+    return length_delimited(2, b'\x09' + struct.pack('<d', value) + b'\x10' + varint(timestamp_ms))
+
+
+def encode_write_request(series: List[Tuple[bytes, float, int]]) -> bytes:
+    # WriteRequest {repeated TimeSeries timeseries = 1;} from encoded labels, value and timestamp
+    return b''.join(length_delimited(1, labels + encode_sample(value, timestamp_ms))
+                    for labels, value, timestamp_ms in series)
+
+
+def snappy_literal(data: bytes) -> bytes:
+    # Valid snappy block made of literals only, for when python-snappy isn't installed.
+    # Uncompressed but accepted by any snappy decoder.
+    out = [varint(len(data))]
+    for start in range(0, len(data), 65536):
+        chunk = data[start:start + 65536]
+        n = len(chunk) - 1
+        if n < 60:
+            out.append(bytes([n << 2]))
+        elif n < 256:
+            out.append(bytes([60 << 2, n]))
+        else:
+            out.append(bytes([61 << 2]) + n.to_bytes(2, 'little'))
+        out.append(chunk)
+    return b''.join(out)
+
+
+class Pusher:
+    def __init__(self, session: aiohttp.ClientSession, config: Config, metrics: Metrics, exporters: list):
+        self.session = session
+        self.registry: CollectorRegistry = metrics.registry
+        self.metrics = metrics
+        self.exporters = exporters
+        self.url = config.push_url
+        self.format = config.push_format
+        self.timeout = aiohttp.ClientTimeout(total=config.push_timeout)
+        self.retry_max_interval = config.push_retry_max_interval
+        self.external_labels = sorted((config.push_labels or {}).items())
+
+        self.queue = deque(maxlen=config.push_queue_size)
+        self.ready = asyncio.Event()
+        # Encoded labels and the last timestamp sent in ms by series, pruned when series
+        # come and go
+        self.label_cache: Dict[Tuple, bytes] = {}
+        self.last_sent: Dict[Tuple, int] = {}
+
+    def node_timestamps(self, network_name: str = None) -> Dict[Tuple[str, str], float]:
+        # (name, network_name) -> time the node's last response came in
+        timestamps = {}
+        for e in self.exporters:
+            if network_name is not None and e.config.network_name.value != network_name:
+                continue
+            for prep, r in zip(e.registry, e.responses):
+                if r:
+                    timestamps[(prep.name, e.config.network_name.value)] = r.timestamp
+        return timestamps
+
+    def collect(self, network_name: str = None) -> bytes:
+        # The series of network_name, which just finished a poll, and those of the process.
+        # The responses of other networks may be halfway through their poll.
+        if self.format == 'pushgateway':
+            # The Pushgateway rejects samples with timestamps
+            return generate_latest(self.registry)
+
+        now = time()
+        node_timestamps = self.node_timestamps(network_name)
+        series = []
+        seen = set()
+        for family in self.registry.collect():
+            for s in family.samples:
+                # Label names are fixed per sample name
+                key = (s.name, tuple(s.labels.values()))
+                seen.add(key)
+                if network_name is not None and s.labels.get('network_name', network_name) != network_name:
+                    continue
+                timestamp = node_timestamps.get((s.labels.get('name'), s.labels.get('network_name')), now)
+                timestamp_ms = int(timestamp * 1000)
+                # A response carried over from the previous poll can be older than the last push,
+                # receivers reject samples that go back in time
+                if timestamp_ms <= self.last_sent.get(key, -1):
+                    continue
+                self.last_sent[key] = timestamp_ms
+                labels = self.label_cache.get(key)
+                if labels is None:
+                    labels = self.label_cache[key] = encode_labels(
+                        [('__name__', s.name), *s.labels.items(), *self.external_labels])
+                series.append((labels, s.value, timestamp_ms))
+        if len(self.last_sent) > 2 * len(seen):
+            self.label_cache = {k: v for k, v in self.label_cache.items() if k in seen}
+            self.last_sent = {k: v for k, v in self.last_sent.items() if k in seen}
+        return (snappy_compress or snappy_literal)(encode_write_request(series))
+
+    async def enqueue(self, network_name: str = None):
+        # Called after each poll of network_name, encodes the batch off the loop
+        loop = asyncio.get_running_loop()
+        batch = await loop.run_in_executor(None, self.collect, network_name)
+        if len(self.queue) == self.queue.maxlen:
+            self.metrics.counter_push_dropped.inc()
+        self.queue.append(batch)
+        self.ready.set()
+
+    async def send(self, batch: bytes) -> bool:
+        # True when the batch is done with, False when it should be retried
+        if self.format == 'pushgateway':
+            request = self.session.put(self.url, data=batch, timeout=self.timeout,
+                                       headers={'Content-Type': 'text/plain; version=0.0.4'})
+        else:
+            request = self.session.post(self.url, data=batch, timeout=self.timeout, headers=REMOTE_WRITE_HEADERS)
+        try:
+            async with request as response:
+                if response.status < 300:
+                    self.metrics.counter_push_batches.labels('sent').inc()
+                    return True
+                if response.status == 429 or response.status >= 500:
+                    print(f"Push to {self.url} failed with {response.status}, retrying")
+                    self.metrics.counter_push_batches.labels('retried').inc()
+                    return False
+                # Anything else won't get better by sending it again
+                print(f"Push to {self.url} rejected with {response.status}: {await response.text()}")
+                self.metrics.counter_push_batches.labels('rejected').inc()
+                return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Push to {self.url} failed: {e!r}, retrying")
+            self.metrics.counter_push_batches.labels('retried').inc()
+            return False
+
+    async def run(self, stop: Optional[asyncio.Event] = None):
+        retry_interval = .5
+        while stop is None or not stop.is_set():
+            if not self.queue:
+                self.ready.clear()
+                await self.ready.wait()
+                continue
+            batch = self.queue[0]
+            if await self.send(batch):
+                # The batch may have been dropped for a newer one while it was sent
+                if self.queue and self.queue[0] is batch:
+                    self.queue.popleft()
+                retry_interval = .5
+            else:
+                await asyncio.sleep(retry_interval)
+                retry_interval = min(retry_interval * 2, self.retry_max_interval)
@@ -0,0 +1,23 @@
+# Splits the nodes of a network between exporter replicas without any coordination. Every
+# node goes to the replica_overlap replicas with the highest rendezvous hash of replica and
+# node address, so each replica works out its own share from the P-Rep list alone and only
+# the nodes of a removed replica move when replica_count changes. The chain level gauges are
+# assigned the same way, keyed by network name.
+import hashlib
+from typing import List
+
+
+def score(replica_index: int, key: str) -> int:
+    # Same on every replica and across restarts unlike hash()
+    return int.from_bytes(hashlib.blake2b(f'{replica_index}:{key}'.encode(), digest_size=8).digest(), 'big')
+
+
+def owners(key: str, replica_count: int, overlap: int = 1) -> List[int]:
+    return sorted(range(replica_count), key=lambda r: score(r, key), reverse=True)[:overlap]
+
+
+def select(prep_list: list, replica_index: int, replica_count: int, overlap: int = 1) -> list:
+    # The P-Reps of prep_list assigned to replica_index, with their rank in the full list.
+    # Lists that already went through select keep their ranks.
+    return [dict(v, rank=v.get('rank', i)) for i, v in enumerate(prep_list)
+            if replica_index in owners(v['address'], replica_count, overlap)]
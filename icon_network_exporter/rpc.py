@@ -28,6 +28,28 @@ def get_iiss_info():
                    }
     }
 
+def get_last_block():
+    return {
+        "jsonrpc": "2.0",
+        "id": 1234,
+        "method": "icx_getLastBlock"
+    }
+
+def get_block_by_height(height: int):
+    return {
+        "jsonrpc": "2.0",
+        "id": 1234,
+        "method": "icx_getBlockByHeight",
+        "params": {"height": hex(height)}
+    }
+
+def get_total_supply():
+    return {
+        "jsonrpc": "2.0",
+        "id": 1234,
+        "method": "icx_getTotalSupply"
+    }
+
 if __name__ == '__main__':
     import requests
     term_change_block = requests.post('https://ctz.solidwallet.io/api/v3',
@@ -0,0 +1,128 @@
+import asyncio
+from typing import Callable, Dict, List, Optional, Sequence
+
+import aiohttp
+
+from icon_network_exporter.config import Config
+from icon_network_exporter.decoding import PeerStatus
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.registry import PRep
+from icon_network_exporter.utils import get, get_failure_type
+
+
+def publish(prep: PRep, on_result: Callable[[PRep, PeerStatus], None]):
+    def done(task: asyncio.Future):
+        if not task.cancelled() and task.result():
+            on_result(prep, task.result())
+    return done
+
+
+class Scraper:
+    def __init__(self, session: aiohttp.ClientSession, config: Config, metrics: Metrics = None):
+        self.session = session
+        self.metrics = metrics
+        self.network_name = config.network_name.value
+        # Must be created from within the running loop
+        self.semaphore = asyncio.Semaphore(config.parallelism)
+        self.timeout = aiohttp.ClientTimeout(total=config.poll_timeout,
+                                             sock_connect=config.poll_connect_timeout,
+                                             sock_read=config.poll_read_timeout)
+        self.deadline = config.iteration_deadline
+        # scrape returns at the soft deadline, requests still in flight carry on into the
+        # next poll until the deadline
+        self.soft_deadline = min(config.soft_deadline or self.deadline, self.deadline)
+        self.request_duration = metrics.histogram_request_duration.labels(self.network_name) if metrics else None
+
+        self.in_flight: Dict[str, asyncio.Future] = {}
+
+    def record_failure(self, failure_type: str):
+        if self.metrics:
+            self.metrics.counter_request_failures.labels(failure_type, self.network_name).inc()
+
+    def count(self, counter: str):
+        if self.metrics:
+            getattr(self.metrics, counter).labels(self.network_name).inc()
+
+    async def get(self, prep: PRep) -> Optional[PeerStatus]:
+        resp = await get(self.session, prep.api_endpoint, prep.name, self.timeout,
+                         on_error=lambda e: self.record_failure(get_failure_type(e)))
+        if resp and self.request_duration:
+            self.request_duration.observe(resp.latency / 1000)
+        return resp
+
+    async def attempt(self, prep: PRep, started: asyncio.Event = None) -> Optional[PeerStatus]:
+        # Every request, hedged ones included, takes one of the parallelism slots
+        async with self.semaphore:
+            if started:
+                started.set()
+            return await self.get(prep)
+
+    async def fetch(self, prep: PRep, hedge_after: float = None) -> Optional[PeerStatus]:
+        # A second request goes out when the first one is slower than hedge_after seconds,
+        # counted from when it got its slot, whichever answers first is used
+        started = asyncio.Event()
+        attempts = [asyncio.ensure_future(self.attempt(prep, started))]
+        try:
+            if hedge_after is not None:
+                await started.wait()
+                done, _ = await asyncio.wait(attempts, timeout=hedge_after)
+                if not done:
+                    self.count('counter_hedged_requests')
+                    attempts.append(asyncio.ensure_future(self.attempt(prep)))
+
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.result():
+                        return attempt.result()
+            return None
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    def expire(self, api_endpoint: str, task: asyncio.Future):
+        # Responses that came in before the deadline wait for the next scrape
+        if task.done():
+            return
+        task.cancel()
+        self.record_failure('deadline')
+        if self.in_flight.get(api_endpoint) is task:
+            del self.in_flight[api_endpoint]
+
+    async def scrape(self, preps: List[PRep], hedge_after: Sequence[Optional[float]] = None,
+                     on_result: Callable[[PRep, PeerStatus], None] = None) -> List[Optional[PeerStatus]]:
+        # Responses line up with preps. on_result is called as each response comes in.
+        # Requests not back by the soft deadline are left running and picked up by the next
+        # scrape, anything not back by the deadline is None.
+        loop = asyncio.get_running_loop()
+        endpoints = {p.api_endpoint for p in preps}
+        for api_endpoint in [e for e in self.in_flight if e not in endpoints]:
+            self.in_flight.pop(api_endpoint).cancel()
+
+        tasks = []
+        for i, prep in enumerate(preps):
+            task = self.in_flight.get(prep.api_endpoint)
+            if task is None:
+                task = asyncio.ensure_future(self.fetch(prep, hedge_after[i] if hedge_after is not None else None))
+                if on_result:
+                    task.add_done_callback(publish(prep, on_result))
+                self.in_flight[prep.api_endpoint] = task
+                loop.call_later(self.deadline, self.expire, prep.api_endpoint, task)
+            tasks.append(task)
+        if not tasks:
+            return []
+
+        await asyncio.wait(tasks, timeout=self.soft_deadline)
+        responses = []
+        for prep, task in zip(preps, tasks):
+            if task.done():
+                self.in_flight.pop(prep.api_endpoint, None)
+                responses.append(None if task.cancelled() else task.result())
+            else:
+                responses.append(None)
+        return responses
+
+    def close(self):
+        # The session is shared and closed by its owner
+        pass
@@ -0,0 +1,170 @@
+# Scraping split across worker processes for very large sets of nodes. Each worker runs
+# its own event loop, connection pool and Scraper over its shard of the registry and sends
+# back the results as one array per shard, the parent keeps the registry and the gauges.
+import asyncio
+import multiprocessing
+from collections import Counter
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from icon_network_exporter.config import Config
+from icon_network_exporter.decoding import PeerStatus
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.registry import PRep
+from icon_network_exporter.scraper import Scraper
+from icon_network_exporter.utils import create_session
+
+# Columns of the array a worker sends back for its shard, NaN when a node did not respond
+COLUMNS = ('block_height', 'total_tx', 'timestamp', 'latency')
+
+
+class ShardScraper(Scraper):
+    # Failures are counted and sent back to the parent which owns the metrics
+    def __init__(self, session, config: Config):
+        super().__init__(session, config)
+        self.failures = Counter()
+
+    def record_failure(self, failure_type: str):
+        self.failures[failure_type] += 1
+
+
+def encode_results(responses: List[Optional[PeerStatus]]) -> Tuple[np.ndarray, List[Optional[str]]]:
+    columns = np.full((len(responses), len(COLUMNS)), np.nan)
+    states = [None] * len(responses)
+    for i, r in enumerate(responses):
+        if r:
+            columns[i] = (r.block_height, r.total_tx, r.timestamp, r.latency)
+            states[i] = r.state
+    return columns, states
+
+
+def decode_results(shard: List[PRep], columns: np.ndarray, states: List[Optional[str]]) -> List[Optional[PeerStatus]]:
+    responses = []
+    for prep, (block_height, total_tx, timestamp, latency), state in zip(shard, columns.tolist(), states):
+        if state is None:
+            responses.append(None)
+        else:
+            responses.append(PeerStatus(prep.api_endpoint, int(block_height), state, int(total_tx),
+                                        timestamp, latency))
+    return responses
+
+
+def shard_config(config: Config, num_shards: int) -> Config:
+    # parallelism and the connection limit stay totals across the workers
+    return config.copy(update={'parallelism': max(-(-config.parallelism // num_shards), 1),
+                               'connection_limit': max(-(-config.connection_limit // num_shards), 1)})
+
+
+def worker_main(conn, config: Config):
+    asyncio.run(serve_shard(conn, config))
+
+
+async def serve_shard(conn, config: Config):
+    loop = asyncio.get_running_loop()
+    session = create_session(config.connection_limit,
+                             config.connection_limit_per_host,
+                             config.dns_cache_ttl,
+                             config.keepalive_timeout)
+    scraper = ShardScraper(session, config)
+    try:
+        while True:
+            message = await loop.run_in_executor(None, conn.recv)
+            if message is None:
+                break
+            seq, shard, hedge_after = message
+            preps = [PRep(i, name, None, i, api_endpoint) for i, (name, api_endpoint) in enumerate(shard)]
+            scraper.failures.clear()
+            columns, states = encode_results(await scraper.scrape(preps, hedge_after))
+            conn.send((seq, columns, states, dict(scraper.failures)))
+    finally:
+        await session.close()
+
+
+class ShardedScraper:
+    def __init__(self, config: Config, metrics: Metrics = None):
+        self.config = config
+        self.metrics = metrics
+        self.network_name = config.network_name.value
+        self.num_shards = config.scrape_workers
+        self.request_duration = metrics.histogram_request_duration.labels(self.network_name) if metrics else None
+        self.worker_config = shard_config(config, self.num_shards)
+        # Workers are given the deadline plus this long to send back their shard
+        self.timeout = config.iteration_deadline + config.poll_timeout
+        # spawn, forking a process with a running loop and the http server thread is unsafe
+        self.context = multiprocessing.get_context('spawn')
+        self.workers = [self.start_worker() for _ in range(self.num_shards)]
+        self.seq = 0
+
+    def start_worker(self):
+        conn, child_conn = self.context.Pipe()
+        process = self.context.Process(target=worker_main, args=(child_conn, self.worker_config), daemon=True)
+        process.start()
+        child_conn.close()
+        return process, conn
+
+    def record_failure(self, failure_type: str, count: int = 1):
+        if self.metrics:
+            self.metrics.counter_request_failures.labels(failure_type, self.network_name).inc(count)
+
+    def exchange(self, worker: int, seq: int, shard: List[PRep], hedge_after: Optional[list]):
+        # Runs in a thread, the pipe calls block
+        process, conn = self.workers[worker]
+        try:
+            conn.send((seq, [(p.name, p.api_endpoint) for p in shard], hedge_after))
+            while conn.poll(self.timeout):
+                result = conn.recv()
+                # Results of a shard that came back after its timeout are dropped
+                if result[0] == seq:
+                    return result
+        except (EOFError, OSError):
+            print(f"Scrape worker {worker} on {self.network_name} died, restarting it")
+            conn.close()
+            process.join(0)
+            self.workers[worker] = self.start_worker()
+        return None
+
+    async def scrape(self, preps: List[PRep], hedge_after: Sequence[Optional[float]] = None,
+                     on_result: Callable[[PRep, PeerStatus], None] = None) -> List[Optional[PeerStatus]]:
+        # Same contract as Scraper.scrape, responses line up with preps. Responses come back
+        # a shard at a time and the workers keep their own late requests.
+        self.seq += 1
+        loop = asyncio.get_running_loop()
+        # Shard i gets every num_shards-th node starting at i
+        shards = [(i, preps[i::self.num_shards]) for i in range(self.num_shards)]
+        shards = [(i, shard) for i, shard in shards if shard]
+        results = await asyncio.gather(*[
+            loop.run_in_executor(None, self.exchange, i, self.seq, shard,
+                                 None if hedge_after is None else list(hedge_after[i::self.num_shards]))
+            for i, shard in shards])
+
+        responses: List[Optional[PeerStatus]] = [None] * len(preps)
+        for (i, shard), result in zip(shards, results):
+            if result is None:
+                self.record_failure('worker', len(shard))
+                continue
+            _, columns, states, failures = result
+            for failure_type, count in failures.items():
+                self.record_failure(failure_type, count)
+            shard_responses = decode_results(shard, columns, states)
+            responses[i::self.num_shards] = shard_responses
+            for prep, r in zip(shard, shard_responses):
+                if r:
+                    if self.request_duration:
+                        self.request_duration.observe(r.latency / 1000)
+                    if on_result:
+                        on_result(prep, r)
+        return responses
+
+    def close(self):
+        for process, conn in self.workers:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for process, conn in self.workers:
+            process.join(1)
+            if process.is_alive():
+                process.terminate()
+            conn.close()
+        self.workers = []
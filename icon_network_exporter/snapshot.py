@@ -0,0 +1,87 @@
+# On disk snapshot of an exporter's P-Rep list and recent samples so that a restarted
+# exporter picks up where it left off instead of starting cold
+import os
+from time import time
+from typing import Optional
+
+import numpy as np
+
+from icon_network_exporter.decoding import PREP_NUMBERS
+from icon_network_exporter.registry import PRepRegistry
+from icon_network_exporter.store import SampleStore, FIELDS
+
+
+def snapshot_file(snapshot_dir: str, network_name: str) -> str:
+    return os.path.join(snapshot_dir, f'{network_name}.npz')
+
+
+def save(path: str, registry: PRepRegistry, samples: SampleStore, term_change_block: Optional[int],
+         prep_list_time: Optional[float] = None):
+    # Written next to the target and moved over it so readers never see a partial file
+    preps = registry.preps
+    arrays = {
+        'saved_at': np.array(time()),
+        'network_name': np.array(registry.network_name),
+        'term_change_block': np.array(-1 if term_change_block is None else term_change_block),
+        'prep_list_time': np.array(np.nan if prep_list_time is None else prep_list_time),
+        'names': np.array([p.name for p in preps], dtype=str),
+        'addresses': np.array([p.address for p in preps], dtype=str),
+        'p2p_endpoints': np.array([p.p2p_endpoint for p in preps], dtype=str),
+        'ranks': np.array([p.rank for p in preps], dtype=int),
+    }
+    for f in PREP_NUMBERS:
+        arrays[f'prep_{f}'] = registry.columns[f]
+    for f in FIELDS:
+        arrays[f] = samples.window(f)
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+        # On disk before it replaces the previous snapshot, a crash leaves either one whole
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load(path: str, network_name: str, max_age: float) -> Optional[dict]:
+    # None when there is no usable snapshot, one older than max_age seconds is ignored. Any
+    # file that fails to parse, ie truncated or missing fields, is ignored too so that it
+    # never keeps the exporter from starting.
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return parse({k: data[k] for k in data.files}, network_name, max_age)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable snapshot {path}: {e!r}")
+        return None
+
+
+def parse(snapshot: dict, network_name: str, max_age: float) -> Optional[dict]:
+    age = time() - float(snapshot['saved_at'])
+    if str(snapshot['network_name']) != network_name or age > max_age or len(snapshot['names']) == 0:
+        return None
+
+    num_nodes = len(snapshot['names'])
+    for f in FIELDS:
+        if snapshot[f].ndim != 2 or snapshot[f].shape[1] != num_nodes:
+            raise ValueError(f"{f} samples of shape {snapshot[f].shape} for {num_nodes} P-Reps")
+
+    term_change_block = int(snapshot['term_change_block'])
+    # Snapshots from before ranks were saved hold the full list
+    ranks = snapshot.get('ranks', range(num_nodes))
+    prep_list = [{'name': str(n), 'address': str(a), 'p2pEndpoint': str(e), 'rank': int(r)}
+                 for n, a, e, r in zip(snapshot['names'], snapshot['addresses'], snapshot['p2p_endpoints'], ranks)]
+    for f in PREP_NUMBERS:
+        for prep, value in zip(prep_list, snapshot.get(f'prep_{f}', np.zeros(0)).tolist()):
+            if not np.isnan(value):
+                prep[f] = value
+    prep_list_time = float(snapshot.get('prep_list_time', np.nan))
+    return {
+        'age': age,
+        'term_change_block': None if term_change_block < 0 else term_change_block,
+        'prep_list': prep_list,
+        'prep_list_time': None if np.isnan(prep_list_time) else prep_list_time,
+        # Samples ordered oldest to newest
+        'samples': {f: snapshot[f] for f in FIELDS},
+    }
@@ -0,0 +1,49 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+FIELDS = ('block_height', 'timestamp', 'latency', 'total_tx', 'state')
+
+
+class SampleStore:
+    # Fixed capacity ring buffer of per node samples. Each field is a preallocated
+    # (capacity, num_nodes) array indexed by the node's registry index. Row head - 1 is
+    # the latest poll and a node that did not respond in a poll holds NaN in that row.
+
+    def __init__(self, capacity: int, num_nodes: int = 0):
+        self.capacity = capacity
+        self.num_nodes = num_nodes
+        self.head = 0
+        self.count = 0
+        self.data: Dict[str, np.ndarray] = {f: np.full((capacity, num_nodes), np.nan) for f in FIELDS}
+
+    def __len__(self):
+        return self.count
+
+    def append(self, columns: Dict[str, np.ndarray]):
+        for f, a in self.data.items():
+            a[self.head] = columns.get(f, np.nan)
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _rows(self, n: int) -> np.ndarray:
+        return (self.head - n + np.arange(n)) % self.capacity
+
+    def window(self, field: str, n: int = None) -> np.ndarray:
+        # Last n polls ordered oldest to newest
+        n = self.count if n is None else min(n, self.count)
+        return self.data[field][self._rows(n)]
+
+    def latest(self, field: str) -> np.ndarray:
+        return self.data[field][(self.head - 1) % self.capacity]
+
+    def remap(self, previous_index: List[Optional[int]]):
+        # Called when the node set changes; previous_index[i] is the column node i had
+        # before or None for a new node. Only done on a P-Rep list refresh.
+        index = np.array([-1 if i is None else i for i in previous_index], dtype=int)
+        known = index >= 0
+        for f, a in self.data.items():
+            remapped = np.full((self.capacity, len(index)), np.nan)
+            remapped[:, known] = a[:, index[known]]
+            self.data[f] = remapped
+        self.num_nodes = len(index)
@@ -1,63 +1,84 @@
-
 import aiohttp
 import asyncio
-import json
-from datetime import datetime
-from prometheus_client import Counter
+from time import time, perf_counter
+from typing import Callable, Optional, Union
+
+from icon_network_exporter.decoding import PeerStatus, decode_peer_status, loads
+from icon_network_exporter.exceptions import IconRPCError
+
+
+def get_api_endpoint(p2p_endpoint: str, port: int = 9000) -> str:
+    return ''.join(['http://', p2p_endpoint.split(':')[0], f':{port}/api/v1/status/peer'])
+
+
+def create_session(connection_limit: int = 100, connection_limit_per_host: int = 2,
+                   dns_cache_ttl: int = 300, keepalive_timeout: float = 30) -> aiohttp.ClientSession:
+    # Needs to be called from within the event loop the session will be used on
+    connector = aiohttp.TCPConnector(limit=connection_limit,
+                                     limit_per_host=connection_limit_per_host,
+                                     ttl_dns_cache=dns_cache_ttl,
+                                     use_dns_cache=True,
+                                     keepalive_timeout=keepalive_timeout)
+    return aiohttp.ClientSession(connector=connector)
+
 
-async def get(url, name, timeout: int = 2):
+def connections_in_use(connector: aiohttp.BaseConnector) -> Optional[int]:
+    # aiohttp has no public count of the connections handed out by a connector, this reads
+    # the private set of acquired connections (aiohttp 3.x, see tests/test_utils.py). None
+    # when a later version dropped it.
+    acquired = getattr(connector, '_acquired', None)
+    return None if acquired is None else len(acquired)
+
+
+async def get(session: aiohttp.ClientSession, url, name, timeout: Union[float, aiohttp.ClientTimeout] = 2,
+              on_error: Callable[[Exception], None] = None) -> Optional[PeerStatus]:
     try:
-        timeout = aiohttp.ClientTimeout(total=timeout)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            request_start = datetime.now()
-            async with session.get(url=url) as response:
-                resp = await response.read()
-                resp = json.loads(resp)
-
-                # Insert this so that we can look it up later
-                resp.update({'apiEndpoint': url})
-                resp.update({'timestamp': datetime.now()})
-                resp.update({'latency': (datetime.now() - request_start).total_seconds()*1000})
-
-                # print("Successfully got url {} with response of length {}.".format(url, len(resp)))
-                return resp
+        if not isinstance(timeout, aiohttp.ClientTimeout):
+            timeout = aiohttp.ClientTimeout(total=timeout)
+        request_start = perf_counter()
+        async with session.get(url=url, timeout=timeout) as response:
+            # An error page is not a sample, even one with the expected fields
+            response.raise_for_status()
+            body = await response.read()
+        latency = perf_counter() - request_start
+        resp = decode_peer_status(body, url)
+        resp.timestamp = time()
+        resp.latency = latency * 1000
+
+        # print("Successfully got url {} with response of length {}.".format(url, len(resp)))
+        return resp
     except Exception as e:
-        pass
         # print("Unable to get url {} due to {}.".format(url, e.__class__))
-        # c = Counter('icon_prep_dropped_request',
-        #       'Node ', )
-        # c.inc()
-
+        if on_error:
+            on_error(e)
 
-async def get_prep_list_async(prep_list: list, timeout: int = 2):
-    resp = await asyncio.gather(*[get(v['apiEndpoint'], v['name'], timeout) for i, v in enumerate(prep_list)])
-    return resp
 
+def get_failure_type(e: Exception) -> str:
+    if isinstance(e, asyncio.TimeoutError):
+        return 'timeout'
+    if isinstance(e, (aiohttp.ClientConnectionError, OSError)):
+        return 'connect'
+    if isinstance(e, (ValueError, KeyError, TypeError)):
+        # Includes json.JSONDecodeError
+        return 'decode'
+    if isinstance(e, aiohttp.ClientResponseError):
+        return 'http'
+    return 'other'
 
-def get_highest_block(prep_list: list, responses: list) -> (int, str):
-    highest_block = 0
-    reference_node_api_endpoint = ''
 
-    # block_height = next(item for item in responses if item['apiEndpoint'] == v['apiEndpoint'])['block_height']
-    for i, v in enumerate(prep_list[0:5]):
-        for r in responses:
-            if r['apiEndpoint'] == v['apiEndpoint']:
-                if r['block_height'] > highest_block:
-                    highest_block = r['block_height']
-                    reference_node_api_endpoint = v['apiEndpoint']
-
-    # This might not be a good idea but a fallback unless there is
-    if highest_block == 0:
-        highest_block, reference_node_api_endpoint = get_highest_block(prep_list, responses)
+async def post_rpc(session: aiohttp.ClientSession, url: str, payload: dict, timeout: float = 10):
+    try:
+        async with session.post(url=url, json=payload, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            resp = loads(await response.read())
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        raise IconRPCError(f"{payload.get('method')} request to {url} failed: {e!r}")
 
-    return highest_block, reference_node_api_endpoint
+    if not isinstance(resp, dict) or 'result' not in resp:
+        # An error, or anything else answering in front of the node like a rate limiter
+        error = resp.get('error', resp) if isinstance(resp, dict) else resp
+        raise IconRPCError(f"{payload.get('method')} request to {url} returned {error}")
+    return resp['result']
 
 
 def get_rpc_attributes():
     pass
-
-# prep_list = [{'address': 'hx0b047c751658f7ce1b2595da34d57a0e7dad357d', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'ICON Foundation', 'country': 'CHE', 'city': 'Zug', 'stake': '0x0', 'delegated': '0x2835528b4ddedca63f37b2', 'totalBlocks': '0xdf8d46', 'validatedBlocks': '0xdf09c2', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12a8eb8', 'lastGenerateBlockHeight': '0x180d010', 'blockHeight': '0x9d87b3', 'txIndex': '0x0', 'nodeAddress': 'hx9c63f73d3c564a54d0eed84f90718b1ebed16f09', 'email': 'hello@icon.foundation', 'website': 'https://icon.foundation', 'details': 'https://icon.foundation/prep/details.json', 'p2pEndpoint': '210.180.69.101:7100', 'apiEndpoint': 'http://210.180.69.101:9000/api/v1/status/peer'}, {'address': 'hxfba37e91ccc13ec1dab115811f73e429cde44d48', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'ICX_Station', 'country': 'USA', 'city': 'San Francisco', 'stake': '0x0', 'delegated': '0x10c363f0a00971dcaf40ab', 'totalBlocks': '0xe0ddd5', 'validatedBlocks': '0xe08dd6', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x127b07f', 'lastGenerateBlockHeight': '0x180d01a', 'blockHeight': '0x73f414', 'txIndex': '0x1', 'nodeAddress': 'hx81719dcfe8f58ca07044b7bede49cecd61f9bd3f', 'email': '2infiniti@icon.foundation', 'website': 'https://www.icxstation.com', 'details': 'https://icxstation.com/json/prepdetails.json', 'p2pEndpoint': '3.14.196.215:7100', 'apiEndpoint': 'http://3.14.196.215:9000/api/v1/status/peer'}, {'address': 'hxd0d9b0fee857de26fd1e8b15209ca15b14b851b2', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'VELIC', 'country': 'SGP', 'city': 'Singapore', 'stake': '0x0', 'delegated': '0xeccfe86128bf244dd85fc', 'totalBlocks': '0xe2ae7f', 'validatedBlocks': '0xe26bcc', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12b3400', 'lastGenerateBlockHeight': '0x180d024', 'blockHeight': '0x73faa1', 'txIndex': '0x0', 'nodeAddress': 'hx406c9d6fa4b8a51dba98797610fe5935f613fb07', 'email': 'support@velic.io', 'website': 'https://www.velic.io', 'details': 'https://www.velic.io/cexp/v1/marketing/staving/info', 'p2pEndpoint': '3.114.212.239:7100', 'apiEndpoint': 'http://3.114.212.239:9000/api/v1/status/peer'}, {'address': 'hx54d6f19c3d16b2ef23c09c885ca1ba776aaa80e2', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'Ubik Capital', 'country': 'USA', 'city': 'Detroit', 'stake': '0x0', 'delegated': '0xbe73a06e32d5803b8d1b9', 'totalBlocks': '0xe20df2', 'validatedBlocks': '0xe1fd40', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x15077a0', 'lastGenerateBlockHeight': '0x180d02e', 'blockHeight': '0x73f441', 'txIndex': '0x0', 'nodeAddress': 'hx54d6f19c3d16b2ef23c09c885ca1ba776aaa80e2', 'email': 'icon@ubik.capital', 'website': 'https://ubik.capital', 'details': 'https://theuc.xyz/ubikprep/json/ubikprep.json', 'p2pEndpoint': '13.58.103.19:7100', 'apiEndpoint': 'http://13.58.103.19:9000/api/v1/status/peer'}, {'address': 'hx262afdeda4eba10fe41fa5ef21796ac2bdcc6629', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'ICONation', 'country': 'FRA', 'city': 'Paris', 'stake': '0x0', 'delegated': '0xbd4c291eef66874a85af5', 'totalBlocks': '0xe244df', 'validatedBlocks': '0xe20f3f', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12e09aa', 'lastGenerateBlockHeight': '0x180d038', 'blockHeight': '0x73ff14', 'txIndex': '0x0', 'nodeAddress': 'hx262afdeda4eba10fe41fa5ef21796ac2bdcc6629', 'email': 'iconation.team@gmail.com', 'website': 'https://iconation.team', 'details': 'https://iconation.team/prep_mainnet.json', 'p2pEndpoint': '52.47.90.20:7100', 'apiEndpoint': 'http://52.47.90.20:9000/api/v1/status/peer'}, {'address': 'hx4a43790d44b07909d20fbcc233548fc80f7a4067', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'RHIZOME', 'country': 'JPN', 'city': 'Tokyo', 'stake': '0x0', 'delegated': '0xa20188cb429c71241f956', 'totalBlocks': '0xe1d78b', 'validatedBlocks': '0xe1bc63', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x32d26d12e980b600000', 'irepUpdateBlockHeight': '0x153f093', 'lastGenerateBlockHeight': '0x180d042', 'blockHeight': '0x73f3df', 'txIndex': '0x0', 'nodeAddress': 'hxda4e0b39fb6df66af8a4e39942c49662a890f320', 'email': 'hello@rhizomeicx.com', 'website': 'https://rhizomeicx.com', 'details': 'https://storage.googleapis.com/rhizome-public-storage/prep/json/rhizome-usa.json', 'p2pEndpoint': '35.231.14.204:7100', 'apiEndpoint': 'http://35.231.14.204:9000/api/v1/status/peer'}, {'address': 'hxd5059fec8665bc7b769f4893aef65cf00049377a', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'ICON Hyperconnect', 'country': 'KOR', 'city': 'Seoul', 'stake': '0x0', 'delegated': '0x99b3fa94700acce2654ea', 'totalBlocks': '0x7c0f82', 'validatedBlocks': '0x7bd5e5', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12cab1b', 'lastGenerateBlockHeight': '0x180d04c', 'blockHeight': '0xf7e0ae', 'txIndex': '0x1', 'nodeAddress': 'hxd5059fec8665bc7b769f4893aef65cf00049377a', 'email': 'iconhyperconnect@gmail.com', 'website': 'https://www.iconhyperconnect.com', 'details': 'https://jsonkeeper.com/b/U06Q', 'p2pEndpoint': '3.137.75.159:7100', 'apiEndpoint': 'http://3.137.75.159:9000/api/v1/status/peer'}, {'address': 'hxb11448743cbb63fcf29609401cdc5782793be211', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'ICONbet Community', 'country': 'USA', 'city': 'Las Vegas', 'stake': '0x43c33c1937564800000', 'delegated': '0x7a93e8316578b6b7b328e', 'totalBlocks': '0x63dc9c', 'validatedBlocks': '0x6388a3', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12bcf19', 'lastGenerateBlockHeight': '0x180d056', 'blockHeight': '0xdf57c4', 'txIndex': '0x1', 'nodeAddress': 'hxb11448743cbb63fcf29609401cdc5782793be211', 'email': 'iconbetcommunity@protonmail.com', 'website': 'https://iconbet.io', 'details': 'http://prep-registration-hip-crow.s3-website-sa-east-1.amazonaws.com/details.json', 'p2pEndpoint': '18.230.33.207:7100', 'apiEndpoint': 'http://18.230.33.207:9000/api/v1/status/peer'}, {'address': 'hxab751d4e83b6fda412a38cb5f7f96860396b1327', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'Symmetry SLC', 'country': 'USA', 'city': 'Salt Lake City', 'stake': '0x0', 'delegated': '0x776311af27f4247d097b6', 'totalBlocks': '0xdef091', 'validatedBlocks': '0xde9bb5', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12c72c6', 'lastGenerateBlockHeight': '0x180d060', 'blockHeight': '0x99e2d4', 'txIndex': '0x0', 'nodeAddress': 'hxab751d4e83b6fda412a38cb5f7f96860396b1327', 'email': 'ICON@SymmetrySLC.com', 'website': 'https://SymmetrySLC.com', 'details': 'https://symmetry-icon-json-data.s3.amazonaws.com/prod-dc.json', 'p2pEndpoint': '169.48.79.54:7100', 'apiEndpoint': 'http://169.48.79.54:9000/api/v1/status/peer'}, {'address': 'hx099b1e6b271bc6cd67d930a1c62ee5f3ed0e2c7d', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'NEOPLY', 'country': 'KOR', 'city': 'Seoul', 'stake': '0x0', 'delegated': '0x7034624b30411ba5ad3af', 'totalBlocks': '0x2bca22', 'validatedBlocks': '0x2bbe83', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f1108d2eca3ca17340', 'irepUpdateBlockHeight': '0x14b4691', 'lastGenerateBlockHeight': '0x180d06a', 'blockHeight': '0x14b4691', 'txIndex': '0x1', 'nodeAddress': 'hx099b1e6b271bc6cd67d930a1c62ee5f3ed0e2c7d', 'email': 'developer@neoply.com', 'website': 'https://neoply.io', 'details': 'https://neoply.io/bp_info/icon.json', 'p2pEndpoint': '13.115.105.184:7100', 'apiEndpoint': 'http://13.115.105.184:9000/api/v1/status/peer'}, {'address': 'hxdc35f82a3a943e040ae2b9ab2baa2118781b2bc9', 'status': '0x0', 'penalty': '0x3', 'grade': '0x2', 'name': 'Mineable', 'country': 'GBR', 'city': 'London', 'stake': '0x0', 'delegated': '0x5f5b2ba669cee1f060872', 'totalBlocks': '0xc14342', 'validatedBlocks': '0xc1273a', 'unvalidatedSequenceBlocks': '0x295', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x135514c', 'lastGenerateBlockHeight': '0x1809a7c', 'blockHeight': '0xaa4bfc', 'txIndex': '0x2', 'nodeAddress': 'hxdc35f82a3a943e040ae2b9ab2baa2118781b2bc9', 'email': 'admin@mineable.com', 'website': 'https://www.youtube.com/icontvofficial', 'details': 'https://mineablecom.s3.eu-north-1.amazonaws.com/details.json', 'p2pEndpoint': '34.239.57.162:7100', 'apiEndpoint': 'http://34.239.57.162:9000/api/v1/status/peer'}, {'address': 'hx8e6dcffdf06f850af5d372ac96389135e17d56d3', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'Everstake', 'country': 'UKR', 'city': 'Kyiv', 'stake': '0x0', 'delegated': '0x5635cf802be9c7e89485b', 'totalBlocks': '0xdfb401', 'validatedBlocks': '0xdf607e', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x133d5a4', 'lastGenerateBlockHeight': '0x180d07e', 'blockHeight': '0x740f7e', 'txIndex': '0x0', 'nodeAddress': 'hx8e6dcffdf06f850af5d372ac96389135e17d56d3', 'email': 'inbox@everstake.one', 'website': 'https://everstake.one', 'details': 'https://everstake.one/icon.json', 'p2pEndpoint': '159.69.63.222:7100', 'apiEndpoint': 'http://159.69.63.222:9000/api/v1/status/peer'}, {'address': 'hxf75bfd0df8d96ee0963965135af2485cee6d5000', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'weBloc asia', 'country': 'KOR', 'city': 'Jeju', 'stake': '0x0', 'delegated': '0x541c50187fcda320a8b9f', 'totalBlocks': '0xe20e18', 'validatedBlocks': '0xe1e23c', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x1352ccb', 'lastGenerateBlockHeight': '0x180d088', 'blockHeight': '0x7497bc', 'txIndex': '0x0', 'nodeAddress': 'hxf75bfd0df8d96ee0963965135af2485cee6d5000', 'email': 'steve@webloc.io', 'website': 'https://www.webloc.io', 'details': 'http://static.webloc.io/prep/json/webloc-details.json', 'p2pEndpoint': '13.125.155.171:7100', 'apiEndpoint': 'http://13.125.155.171:9000/api/v1/status/peer'}, {'address': 'hx3d5c3ce7554f4d762f6396e53b2c5de07074ec39', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'ICON DAO', 'country': 'SGP', 'city': 'Singapore', 'stake': '0x0', 'delegated': '0x53e0ddbe650632d9d343d', 'totalBlocks': '0xcc74f8', 'validatedBlocks': '0xcc516e', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x13505da', 'lastGenerateBlockHeight': '0x180d092', 'blockHeight': '0x84c1b4', 'txIndex': '0x0', 'nodeAddress': 'hx3d5c3ce7554f4d762f6396e53b2c5de07074ec39', 'email': 'icondao@canfoundation.io', 'website': 'https://twitter.com/icondao', 'details': 'https://icondao.s3-ap-southeast-1.amazonaws.com/icondao.json', 'p2pEndpoint': '18.140.186.29:7100', 'apiEndpoint': 'http://18.140.186.29:9000/api/v1/status/peer'}, {'address': 'hx9780bfcd8d33c50f56e37f5b27313433c28eb8d8', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'Stakin', 'country': 'GBR', 'city': 'London', 'stake': '0x1c965d5aa35866600000', 'delegated': '0x4ed0718766add8e0f49cc', 'totalBlocks': '0xe23bd4', 'validatedBlocks': '0xe18daa', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2e141ea081ca0800000', 'irepUpdateBlockHeight': '0x12cade4', 'lastGenerateBlockHeight': '0x180d09c', 'blockHeight': '0x73fda9', 'txIndex': '0x0', 'nodeAddress': 'hx9780bfcd8d33c50f56e37f5b27313433c28eb8d8', 'email': 'hello@stakin.com', 'website': 'https://stakin.com/', 'details': 'https://stakin.com/icon.json', 'p2pEndpoint': '3.8.92.147:7100', 'apiEndpoint': 'http://3.8.92.147:9000/api/v1/status/peer'}, {'address': 'hxe4c008b838e8a9a7c065f20f393974de4c86f917', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'ReliantNode', 'country': 'AUS', 'city': 'Wollongong', 'stake': '0x0', 'delegated': '0x472676cd2dd811596d0f4', 'totalBlocks': '0x88e012', 'validatedBlocks': '0x88502b', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12c6aa7', 'lastGenerateBlockHeight': '0x180d0a4', 'blockHeight': '0x8d8e41', 'txIndex': '0x0', 'nodeAddress': 'hxe4c008b838e8a9a7c065f20f393974de4c86f917', 'email': 'team@reliantnode.com', 'website': 'https://www.reliantnode.com', 'details': 'https://faucet.reliantnode.com/static/details.json', 'p2pEndpoint': '185.172.110.74:7100', 'apiEndpoint': 'http://185.172.110.74:9000/api/v1/status/peer'}, {'address': 'hx231a795d1c719b9edf35c46b9daa4e0b5a1e83aa', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'iBriz - ICONOsphere', 'country': 'USA', 'city': 'San Francisco', 'stake': '0x0', 'delegated': '0x4685c196b12b2db1bf339', 'totalBlocks': '0xac4779', 'validatedBlocks': '0xac0e99', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6d546136addf80000', 'irepUpdateBlockHeight': '0x1308117', 'lastGenerateBlockHeight': '0x180cfd4', 'blockHeight': '0x740814', 'txIndex': '0x1', 'nodeAddress': 'hx95248f3757afcb50efa99f529183ba401a82273c', 'email': 'prep@iconosphere.io', 'website': 'https://iconosphere.io', 'details': 'https://iconosphere.io/json/', 'p2pEndpoint': '52.36.75.189:7100', 'apiEndpoint': 'http://52.36.75.189:9000/api/v1/status/peer'}, {'address': 'hx863e16bd18ceaa7d498b4b275e36cd58818b1f25', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'ICONVIET', 'country': 'VNM', 'city': 'Ho Chi Minh', 'stake': '0x2a5a0590787c0df48000', 'delegated': '0x45590c2f3c9ce4293400e', 'totalBlocks': '0xe13969', 'validatedBlocks': '0xe0fa6b', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12d38a3', 'lastGenerateBlockHeight': '0x180cfde', 'blockHeight': '0x73f2c1', 'txIndex': '0x0', 'nodeAddress': 'hxb38860401c2b845668682be057b42dff22c27c0f', 'email': 'tomnuen@iconviet.io', 'website': 'https://iconviet.io', 'details': 'https://raw.githubusercontent.com/iconviet/public/master/iconviet.json', 'p2pEndpoint': '95.179.230.6:7100', 'apiEndpoint': 'http://95.179.230.6:9000/api/v1/status/peer'}, {'address': 'hx168d2cfe6d73acb8cb690d3abda54d3af266addf', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'block42', 'country': 'AUT', 'city': 'Vienna', 'stake': '0x0', 'delegated': '0x4361298866ca9829249dd', 'totalBlocks': '0xabb98e', 'validatedBlocks': '0xab62ec', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x1309719', 'lastGenerateBlockHeight': '0x180cfe8', 'blockHeight': '0x7403b8', 'txIndex': '0x0', 'nodeAddress': 'hx168d2cfe6d73acb8cb690d3abda54d3af266addf', 'email': 'office@block42.tech', 'website': 'https://block42.tech', 'details': 'https://files.b42.tech/icon/config.json', 'p2pEndpoint': '52.34.9.60:7100', 'apiEndpoint': 'http://52.34.9.60:9000/api/v1/status/peer'}, {'address': 'hxd6f20327d135cb0227230ab98792173a5c97b03e', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'ICONPLUS', 'country': 'GBR', 'city': 'London', 'stake': '0x0', 'delegated': '0x4322029aeaa7112026037', 'totalBlocks': '0x1ab753', 'validatedBlocks': '0x1aabd9', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12f60a6', 'lastGenerateBlockHeight': '0x180cff2', 'blockHeight': '0xee60f2', 'txIndex': '0x2', 'nodeAddress': 'hxd6f20327d135cb0227230ab98792173a5c97b03e', 'email': 'Teamiconplus@gmail.com', 'website': 'https://www.ICON-PLUS.org', 'details': 'http://prep-registration-shining-redfish.s3-website.eu-west-3.amazonaws.com/details.json', 'p2pEndpoint': '15.188.240.233:7100', 'apiEndpoint': 'http://15.188.240.233:9000/api/v1/status/peer'}, {'address': 'hx5b97bbec2e555289351806103833a465b7fbbd47', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'Blockmove', 'country': 'CZE', 'city': 'Brno', 'stake': '0x2368083e035c7cbd8000', 'delegated': '0x3c14f8b53f7c10b8a1bb4', 'totalBlocks': '0xae6f40', 'validatedBlocks': '0xad9c62', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x21e19e0c9bab2400000', 'irepUpdateBlockHeight': '0x12ce3eb', 'lastGenerateBlockHeight': '0x180cffc', 'blockHeight': '0x73f79f', 'txIndex': '0x0', 'nodeAddress': 'hx5b97bbec2e555289351806103833a465b7fbbd47', 'email': 'hello@blockmove.eu', 'website': 'https://blockmove.eu', 'details': 'https://blockmove.eu/prepinfo/info.json', 'p2pEndpoint': '51.159.17.38:7100', 'apiEndpoint': 'http://51.159.17.38:9000/api/v1/status/peer'}, {'address': 'hx3aa778e1f00c77d3490e9e625f1f83ed26f90133', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'Citadel.one', 'country': 'CAN', 'city': 'Montreal', 'stake': '0x262883fe2c261374000', 'delegated': '0x3a721dec669e6edabe9af', 'totalBlocks': '0xdf7dc2', 'validatedBlocks': '0xded007', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x140f257', 'lastGenerateBlockHeight': '0x180d006', 'blockHeight': '0x742aba', 'txIndex': '0x0', 'nodeAddress': 'hx3aa778e1f00c77d3490e9e625f1f83ed26f90133', 'email': 'partners@paradigmfund.io', 'website': 'https://citadel.one/', 'details': 'https://citadel.one/icx_regjson.json', 'p2pEndpoint': '84.201.175.163:7100', 'apiEndpoint': 'http://84.201.175.163:9000/api/v1/status/peer'}, {'address': 'hx28c08b299995a88756af64374e13db2240bc3142', 'status': '0x0', 'penalty': '0x0', 'grade': '0x0', 'name': 'PARROT9', 'country': 'NZL', 'city': 'Dunedin', 'stake': '0x152d02c7e14af6800000', 'delegated': '0x3a69aafdd9e74787a4679', 'totalBlocks': '0x5c58d8', 'validatedBlocks': '0x5bd118', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12da997', 'lastGenerateBlockHeight': '0x180d074', 'blockHeight': '0x938ddd', 'txIndex': '0x0', 'nodeAddress': 'hx28c08b299995a88756af64374e13db2240bc3142', 'email': 'hello@parrot9.com', 'website': 'https://parrot9.com', 'details': 'https://parrot9.com/PARROT91.json', 'p2pEndpoint': '155.138.134.222:7100', 'apiEndpoint': 'http://155.138.134.222:9000/api/v1/status/peer'}, {'address': 'hx0a72c03881451a6270d4895f756085470fc311e4', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Icon Pilipinas', 'country': 'PHL', 'city': 'Manila', 'stake': '0x5c6275992fd5c8000', 'delegated': '0x30452ab9aa6c9985268ed', 'totalBlocks': '0x295', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12be215', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe910e0', 'txIndex': '0x3', 'nodeAddress': 'hx0a72c03881451a6270d4895f756085470fc311e4', 'email': 'iconpilipinas@gmail.com', 'website': 'https://medium.com/@iconpilipinas', 'details': 'http://prep-registration-stirred-eel.s3-website.ca-central-1.amazonaws.com/details.json', 'p2pEndpoint': '15.222.213.224:7100', 'apiEndpoint': 'http://15.222.213.224:9000/api/v1/status/peer'}, {'address': 'hxc453700b9bd823d7f7175808a0986c0e3a45f2b4', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'InterBlock', 'country': 'DEU', 'city': 'Munich', 'stake': '0x0', 'delegated': '0x2ebd2b1348fa6d0c3693f', 'totalBlocks': '0x3dd4b3', 'validatedBlocks': '0x3dbf98', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xc00450', 'lastGenerateBlockHeight': '0x10f47a4', 'blockHeight': '0xbf6a3a', 'txIndex': '0x1', 'nodeAddress': 'hxbf6b8faf021972ae542b8552aa082b794d391fc0', 'email': 'support@interblock.tech', 'website': 'http://www.interblock.tech', 'details': 'https://interblock-mainnet-aws-us-west-2.s3-us-west-2.amazonaws.com/details.json', 'p2pEndpoint': '44.238.34.143:7100', 'apiEndpoint': 'http://44.238.34.143:9000/api/v1/status/peer'}, {'address': 'hx6f89b2c25c15f6294c79810221753131067ed3f8', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Sharpn', 'country': 'FRA', 'city': 'Paris', 'stake': '0x6c0d6ed056626ec0000', 'delegated': '0x296221019985d9796d999', 'totalBlocks': '0xb228e0', 'validatedBlocks': '0xb1a0b4', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x1333163', 'lastGenerateBlockHeight': '0x16772c2', 'blockHeight': '0x73f47d', 'txIndex': '0x1', 'nodeAddress': 'hx6f89b2c25c15f6294c79810221753131067ed3f8', 'email': 'hello@sharpn.tech', 'website': 'https://sharpn.tech', 'details': 'https://sharpn.tech/cdn/prepsdetails.json', 'p2pEndpoint': '167.71.4.34:7100', 'apiEndpoint': 'http://167.71.4.34:9000/api/v1/status/peer'}, {'address': 'hxfc56203484921c3b7a4dee9579d8614d8c8daaf5', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Insight', 'country': 'USA', 'city': 'San Francisco', 'stake': '0x0', 'delegated': '0x28290a45966a30af2acb7', 'totalBlocks': '0x508862', 'validatedBlocks': '0x505e37', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x137bab8', 'lastGenerateBlockHeight': '0x16186b4', 'blockHeight': '0x742b48', 'txIndex': '0x0', 'nodeAddress': 'hx88de92cb7e91c19d4d376f68b7f1b5fef641ecbd', 'email': 'rob.cannon@insightdatascience.com', 'website': 'http://insight-infrastructure.com', 'details': 'https://insight-main-mainnet-aws-us-east-1.s3-website-us-east-1.amazonaws.com/details.json/details.json', 'p2pEndpoint': '3.218.194.233:7100', 'apiEndpoint': 'http://3.218.194.233:9000/api/v1/status/peer'}, {'address': 'hx4adc5a79b2fb3631790f6dca22d7b6e4912e6e85', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Deblock with STAYGE', 'country': 'KOR', 'city': 'Seoul', 'stake': '0x0', 'delegated': '0x27becbe7276c7a5dd7430', 'totalBlocks': '0x4a8905', 'validatedBlocks': '0x4a78d5', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x878678326eac9000000', 'irepUpdateBlockHeight': '0x1597831', 'lastGenerateBlockHeight': '0x160de2b', 'blockHeight': '0x748fc5', 'txIndex': '0x0', 'nodeAddress': 'hx4adc5a79b2fb3631790f6dca22d7b6e4912e6e85', 'email': 'info@stayge.io', 'website': 'https://stayge.io/en/p-rep', 'details': 'http://static.stayge.io/prep/json/deblock-stayge-details.json', 'p2pEndpoint': '13.124.127.40:7100', 'apiEndpoint': 'http://13.124.127.40:9000/api/v1/status/peer'}, {'address': 'hx70f9a54bccc5295e4adecbe98d9a291bef4ff9a9', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON Forge', 'country': 'EST', 'city': 'Tallinn', 'stake': '0x2c42e7a60e5f29bc000', 'delegated': '0x2500db69665b0db14cbee', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2d4ca05e2b43ca80000', 'irepUpdateBlockHeight': '0x12daba4', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x125d059', 'txIndex': '0x1', 'nodeAddress': 'hx70f9a54bccc5295e4adecbe98d9a291bef4ff9a9', 'email': 'hello@iconforge.io', 'website': 'https://www.iconforge.io/', 'details': 'https://icon-forge.github.io/P-Rep/mainnet_config.json', 'p2pEndpoint': '13.49.93.73:7100', 'apiEndpoint': 'http://13.49.93.73:9000/api/v1/status/peer'}, {'address': 'hxa224bb59e9ba930f3919b57feef7656f1139d24b', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Catalyst', 'country': 'USA', 'city': 'Puerto Rico', 'stake': '0x0', 'delegated': '0x241cc2820b8e2f807aee0', 'totalBlocks': '0x6499f3', 'validatedBlocks': '0x6484cb', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x132f95d', 'lastGenerateBlockHeight': '0x11f12a2', 'blockHeight': '0x9eacc0', 'txIndex': '0x1', 'nodeAddress': 'hxa224bb59e9ba930f3919b57feef7656f1139d24b', 'email': 'node@catalystnode.com', 'website': 'https://www.catalystnode.com', 'details': 'https://www.catalystnode.com/icon/details.json', 'p2pEndpoint': '3.233.34.53:7100', 'apiEndpoint': 'http://3.233.34.53:9000/api/v1/status/peer'}, {'address': 'hx30af89a52479d8ce8ac6682651203750d639a20f', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICONologist', 'country': 'DEU', 'city': 'Kassel', 'stake': '0x0', 'delegated': '0x1dfc2c87a11417f71601a', 'totalBlocks': '0x295', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa4b66e7ed77bb7af02e', 'irepUpdateBlockHeight': '0xab46b2', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xab46b2', 'txIndex': '0x1', 'nodeAddress': 'hx30af89a52479d8ce8ac6682651203750d639a20f', 'email': 'info@iconologist.eu', 'website': 'https://www.iconologist.eu/', 'details': 'https://www.iconologist.eu/node/config.json', 'p2pEndpoint': '159.69.136.250:7100', 'apiEndpoint': 'http://159.69.136.250:9000/api/v1/status/peer'}, {'address': 'hxec5e4136ddbf8e9aa119694b95d1baeecf947ee9', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Transform Group', 'country': 'PRI', 'city': 'San Juan', 'stake': '0x0', 'delegated': '0x1b8d13ac82f1e050a30a8', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f4add6ae4f410b597a', 'irepUpdateBlockHeight': '0x162a600', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x162a600', 'txIndex': '0x2', 'nodeAddress': 'hx7e5e9f2e59941e30cd2fef605ef8e232daac6dbc', 'email': 'info@transformgroup.com', 'website': 'https://transformgroup.com', 'details': 'http://prep-registration-cute-gull.s3-website.us-east-2.amazonaws.com/details.json', 'p2pEndpoint': '3.128.245.157:7100', 'apiEndpoint': 'http://3.128.245.157:9000/api/v1/status/peer'}, {'address': 'hxe8767c80a009c7bb8344d81c430144463cbb325e', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICONTROL', 'country': 'KOR', 'city': 'Seoul', 'stake': '0x5ecff6051e82dd8f2', 'delegated': '0x1b4fe00835a733caec24c', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x31086fcc73979a39645', 'irepUpdateBlockHeight': '0x1331f83', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x1331f83', 'txIndex': '0x2', 'nodeAddress': 'hxe8767c80a009c7bb8344d81c430144463cbb325e', 'email': 'icontrol.b@gmail.com', 'website': 'https://icontrol.webflow.io', 'details': 'https://icontrol-team.github.io/public-page/json/detail.json', 'p2pEndpoint': '13.230.106.222:7100', 'apiEndpoint': 'http://13.230.106.222:9000/api/v1/status/peer'}, {'address': 'hxfbddc0f1c0ab85e59578de4b883cdcf94ab33694', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Bara-Node', 'country': 'ARE', 'city': 'Dubai', 'stake': '0x0', 'delegated': '0x1903a239d66e2c12b37d7', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xd03f6d', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xccea5a', 'txIndex': '0x6', 'nodeAddress': 'hxfbddc0f1c0ab85e59578de4b883cdcf94ab33694', 'email': 'mekkahmaddeenah@gmail.com', 'website': 'https://twitter.com/BaraNode', 'details': 'https://icon.oaknode.com/p-rep/bara-node.json', 'p2pEndpoint': '35.224.139.66:7100', 'apiEndpoint': 'http://35.224.139.66:9000/api/v1/status/peer'}, {'address': 'hxbc9c73670c79e8f6f8060551a792c2cf29a8c491', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'MouseBelt | Multi.io', 'country': 'USA', 'city': 'San Francisco', 'stake': '0xde0b6b3a7640000', 'delegated': '0x183c6f5910275fde72c31', 'totalBlocks': '0x49f06e', 'validatedBlocks': '0x49d40a', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x581767ba6189c400000', 'irepUpdateBlockHeight': '0x1422d4f', 'lastGenerateBlockHeight': '0x10ff05f', 'blockHeight': '0x7481f1', 'txIndex': '0x1', 'nodeAddress': 'hxbc9c73670c79e8f6f8060551a792c2cf29a8c491', 'email': 'markus@mousebelt.com', 'website': 'https://mousebelt.com', 'details': 'https://multi-prep.s3.amazonaws.com/p-rep.json', 'p2pEndpoint': '54.81.151.142:7100', 'apiEndpoint': 'http://54.81.151.142:9000/api/v1/status/peer'}, {'address': 'hx55d5b995fca77274cab59c850803f9ec3e00421f', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Orangebloc', 'country': 'USA', 'city': 'Oregon', 'stake': '0x0', 'delegated': '0x17889368975886d86df5c', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x1017cd2', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x100fd22', 'txIndex': '0x1', 'nodeAddress': 'hx55d5b995fca77274cab59c850803f9ec3e00421f', 'email': 'orangebloc@protonmail.com', 'website': 'https://google.com', 'details': 'https://orangebloc-prep.s3-us-west-2.amazonaws.com/details.json', 'p2pEndpoint': '54.203.40.175:7100', 'apiEndpoint': 'http://54.203.40.175:9000/api/v1/status/peer'}, {'address': 'hxdb0266079cb558e14b41ad7125b729c2c96b2d36', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Midos', 'country': 'BGR', 'city': 'Varna', 'stake': '0x0', 'delegated': '0x17708f2fbcf26e62dff51', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x21e19e0c9bab2400000', 'irepUpdateBlockHeight': '0x131ae93', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xcbcfcd', 'txIndex': '0x1', 'nodeAddress': 'hxc72e9e857255d10cbc4ed97e06e4b3e7c8d55f65', 'email': 'nodelikethis@gmail.com', 'website': 'https://twitter.com/IconMidos', 'details': 'https://midos-mainnet-aws-us-west-2.s3-us-west-2.amazonaws.com/details.json', 'p2pEndpoint': '54.71.216.101:7100', 'apiEndpoint': 'http://54.71.216.101:9000/api/v1/status/peer'}, {'address': 'hxfac9169f5ee9d3c85c190cfa1208ca45540dcf38', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'MinerGate', 'country': 'FRA', 'city': 'Paris', 'stake': '0x15bc88d49927b5dd4000', 'delegated': '0x1766a59b01d1437fa0c9c', 'totalBlocks': '0x33623f', 'validatedBlocks': '0x330b76', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x9d0e5f', 'lastGenerateBlockHeight': '0xee6238', 'blockHeight': '0x9d0e5f', 'txIndex': '0x0', 'nodeAddress': 'hxfac9169f5ee9d3c85c190cfa1208ca45540dcf38', 'email': 'contact@minergate.com', 'website': 'https://minergate.com/icon-public-representative', 'details': 'http://51.15.244.139/details.json', 'p2pEndpoint': '51.38.62.198:7100', 'apiEndpoint': 'http://51.38.62.198:9000/api/v1/status/peer'}, {'address': 'hxaf6f61827901d7c4674cf5d2ddbbca2bdae72faf', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICONoscope', 'country': 'USA', 'city': 'Los Angeles', 'stake': '0x5150ae84a8cdf00000', 'delegated': '0x16629ea19f5deb922b000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x9d6fd7cefee841b5579', 'irepUpdateBlockHeight': '0xc4a827', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xc4a827', 'txIndex': '0x1', 'nodeAddress': 'hx9799064f00bd7f95299e3f3a291f2ebcd0d16de8', 'email': 'iconoscope.prep@gmail.com', 'website': 'https://google.com', 'details': 'https://iconoscope-mainnet-aws-us-west-2.s3-us-west-2.amazonaws.com/details.json', 'p2pEndpoint': '44.239.209.49:7100', 'apiEndpoint': 'http://44.239.209.49:9000/api/v1/status/peer'}, {'address': 'hxfa6714e4ec784ae2176c416c46dc2c98b6ec9074', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Piconbello { You Pick We Build }', 'country': 'GBR', 'city': 'London', 'stake': '0x0', 'delegated': '0x162d5dd3204398cd110d4', 'totalBlocks': '0x295', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x73fd8c', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x73fd8c', 'txIndex': '0x1', 'nodeAddress': 'hxb20299f6fec4f43acdce9c6bb279e653a30703fd', 'email': 'contact@piconbello.com', 'website': 'https://piconbello.com', 'details': 'https://www.piconbello.com/preptools.json', 'p2pEndpoint': '34.74.79.223:7100', 'apiEndpoint': 'http://34.74.79.223:9000/api/v1/status/peer'}, {'address': 'hx352a4b557e9035f89b237fe85d6bb92f517fdbd7', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Hourglass', 'country': 'SGP', 'city': 'Singapore', 'stake': '0x0', 'delegated': '0x15026864b1cd6735a8000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x1055924', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x102cbf6', 'txIndex': '0x1', 'nodeAddress': 'hx352a4b557e9035f89b237fe85d6bb92f517fdbd7', 'email': 'hourglass@mailfence.com', 'website': 'https://google.com', 'details': 'https://hourglass-prep.s3-ap-southeast-1.amazonaws.com/details.json', 'p2pEndpoint': '54.169.49.247:7100', 'apiEndpoint': 'http://54.169.49.247:9000/api/v1/status/peer'}, {'address': 'hxc7a057d0cbb75606352ec8cc698267b7247cc100', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Cardinal', 'country': 'USA', 'city': 'Virginia', 'stake': '0x0', 'delegated': '0x1492a4d8f4e612ea08048', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x1021fd4', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x1018d2a', 'txIndex': '0x1', 'nodeAddress': 'hxc7a057d0cbb75606352ec8cc698267b7247cc100', 'email': 'cardina1@tutanota.com', 'website': 'https://google.com', 'details': 'https://cardinal-prep.s3.amazonaws.com/details.json', 'p2pEndpoint': '52.44.216.243:7100', 'apiEndpoint': 'http://52.44.216.243:9000/api/v1/status/peer'}, {'address': 'hx1cb5883939f2fd478e92da1260438aa1f03440ca', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON Sweden', 'country': 'SWE', 'city': 'Stockholm', 'stake': '0x36554bf5b3f1f0c4000', 'delegated': '0x141a7cfa3b93835713790', 'totalBlocks': '0xe552', 'validatedBlocks': '0xdc52', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x7405d6', 'lastGenerateBlockHeight': '0xabed67', 'blockHeight': '0x7405d6', 'txIndex': '0x1', 'nodeAddress': 'hx1cb5883939f2fd478e92da1260438aa1f03440ca', 'email': 'eossweden@gmail.com', 'website': 'https://eossweden.eu', 'details': 'https://eossweden.eu/prep-api.json', 'p2pEndpoint': '95.217.62.85:7100', 'apiEndpoint': 'http://95.217.62.85:9000/api/v1/status/peer'}, {'address': 'hxa92cb92cf29a2e4a7433ebd9103c15b7e71cbafd', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'DEMOS', 'country': 'JPN', 'city': 'Tokyo', 'stake': '0x0', 'delegated': '0x123703b4f95adebbd75c3', 'totalBlocks': '0x2cbdc0', 'validatedBlocks': '0x2cb60d', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12c7ad8', 'lastGenerateBlockHeight': '0x1021f37', 'blockHeight': '0xb8877c', 'txIndex': '0x2', 'nodeAddress': 'hxa92cb92cf29a2e4a7433ebd9103c15b7e71cbafd', 'email': 'contact@deblock.co.jp', 'website': 'https://www.deblock.co.jp/', 'details': 'http://static.deblock.co.jp/prep/details.json', 'p2pEndpoint': '18.177.179.71:7100', 'apiEndpoint': 'http://18.177.179.71:9000/api/v1/status/peer'}, {'address': 'hx21a916b7a01b900861ca3f3b7ac76ba316169f8c', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'OneLife 9to5', 'country': 'SVN', 'city': 'Ljubljana', 'stake': '0x0', 'delegated': '0x10503022043536c931420', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12f72a5', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x930180', 'txIndex': '0x0', 'nodeAddress': 'hx21a916b7a01b900861ca3f3b7ac76ba316169f8c', 'email': 'onelife9to5@gmail.com', 'website': 'https://github.com/onelife9to5', 'details': 'https://raw.githubusercontent.com/onelife9to5/icon-prep-about/master/details.json', 'p2pEndpoint': '116.203.207.222:7100', 'apiEndpoint': 'http://116.203.207.222:9000/api/v1/status/peer'}, {'address': 'hx958eb3e5e9e41e53d000f684af78fd7384f2fe12', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Yudus Lab', 'country': 'SGP', 'city': 'SGP', 'stake': '0x0', 'delegated': '0xfc7001738b107bfa0000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x309702cd2b97bae4831', 'irepUpdateBlockHeight': '0x1354e0a', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x1354e0a', 'txIndex': '0x4', 'nodeAddress': 'hx958eb3e5e9e41e53d000f684af78fd7384f2fe12', 'email': 'duyyudus@gmail.com', 'website': 'https://yudus.dev', 'details': 'https://yudus.dev/info', 'p2pEndpoint': '149.28.130.174:7100', 'apiEndpoint': 'http://149.28.130.174:9000/api/v1/status/peer'}, {'address': 'hx19ccfc00b5af79ac75aaae9676b1f9ed5c9b5ca3', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'StakingTeam', 'country': 'ITA', 'city': 'Milan', 'stake': '0x43cee59e05e216714000', 'delegated': '0xe2fc312ef261f1f08bbe', 'totalBlocks': '0x10dd7', 'validatedBlocks': '0x10b71', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x752166', 'lastGenerateBlockHeight': '0xb86dd5', 'blockHeight': '0x752166', 'txIndex': '0x1', 'nodeAddress': 'hx19ccfc00b5af79ac75aaae9676b1f9ed5c9b5ca3', 'email': 'info@stakingteam.com', 'website': 'https://stakingteam.com', 'details': 'https://icon.stakingteam.com/citizen2.json', 'p2pEndpoint': '116.203.209.7:7100', 'apiEndpoint': 'http://116.203.209.7:9000/api/v1/status/peer'}, {'address': 'hxc97bc2b6863b5f0094de7f0e5bcf82a404c4199b', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Silicon Valley ICON', 'country': 'USA', 'city': 'San Jose', 'stake': '0x7156bf5f5f524a40000', 'delegated': '0xdf1f6dedc00863c898cf', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x1594c38', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xca12c5', 'txIndex': '0x1', 'nodeAddress': 'hxc97bc2b6863b5f0094de7f0e5bcf82a404c4199b', 'email': 'siliconvalleyicon@gmail.com', 'website': 'http://siliconvalleyicon.com', 'details': 'https://raw.githubusercontent.com/siliconvalleyicon/siliconvalleyicon.github.io/master/prep/json/svi.json', 'p2pEndpoint': '138.68.63.35:7100', 'apiEndpoint': 'http://138.68.63.35:9000/api/v1/status/peer'}, {'address': 'hx50040d39a04b7bc9197e9784779f07f9a6887811', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON Labs', 'country': 'USA', 'city': 'Houston', 'stake': '0x0', 'delegated': '0xde990ecf1308252280e1', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x9f7163863e7096102c3', 'irepUpdateBlockHeight': '0xd071a7', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xd071a7', 'txIndex': '0x1', 'nodeAddress': 'hx50040d39a04b7bc9197e9784779f07f9a6887811', 'email': 'contact@iconlabs.dev', 'website': 'https://iconlabs.dev', 'details': 'http://prep-registration-close-stallion.s3-website.us-east-2.amazonaws.com/details.json', 'p2pEndpoint': '3.20.115.13:7100', 'apiEndpoint': 'http://3.20.115.13:9000/api/v1/status/peer'}, {'address': 'hx9571df0bd727ce18adc177e8fd6bc45f885b3382', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Newroad', 'country': 'NLD', 'city': 'Amsterdam', 'stake': '0x0', 'delegated': '0xcb3fd533e55a1fe0af8c', 'totalBlocks': '0x11eb6', 'validatedBlocks': '0x11bba', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x13471b3', 'lastGenerateBlockHeight': '0xabede9', 'blockHeight': '0x73fc52', 'txIndex': '0x0', 'nodeAddress': 'hx9571df0bd727ce18adc177e8fd6bc45f885b3382', 'email': 'info@newroad.capital', 'website': 'https://newroad.network/', 'details': 'https://newroad.network/PrepDetails.json', 'p2pEndpoint': '5.189.170.65:7100', 'apiEndpoint': 'http://5.189.170.65:9000/api/v1/status/peer'}, {'address': 'hxd2de5d155251ff62bf2f6c2aa616da6472886165', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Chainode Tech', 'country': 'CHE', 'city': 'Zug', 'stake': '0x3f21c6a214342578000', 'delegated': '0xcb05304a87b044466a07', 'totalBlocks': '0x42dd4', 'validatedBlocks': '0x41c84', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x13431a3', 'lastGenerateBlockHeight': '0xabed53', 'blockHeight': '0x740233', 'txIndex': '0x0', 'nodeAddress': 'hxd2de5d155251ff62bf2f6c2aa616da6472886165', 'email': 'contact@chainode.tech', 'website': 'https://chainode.tech', 'details': 'https://chainode.tech/icnmain/details.json', 'p2pEndpoint': '144.91.102.161:7100', 'apiEndpoint': 'http://144.91.102.161:9000/api/v1/status/peer'}, {'address': 'hxf08bd5835fdb53dc7c764a5f4dd4e2e6359324e8', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Metanyx', 'country': 'GBR', 'city': 'London', 'stake': '0x0', 'delegated': '0xc465ac6c200c925047d0', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x4563918244f40000000', 'irepUpdateBlockHeight': '0x1309697', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x7bb84e', 'txIndex': '0x1', 'nodeAddress': 'hxf08bd5835fdb53dc7c764a5f4dd4e2e6359324e8', 'email': 'hello@metanyx.io', 'website': 'https://metanyx.com', 'details': 'https://metanyx.com/json', 'p2pEndpoint': '35.226.38.115:7100', 'apiEndpoint': 'http://35.226.38.115:9000/api/v1/status/peer'}, {'address': 'hx3571351614f64721081996247e53f6436ed05e55', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICONNECT-Global', 'country': 'KEN', 'city': 'Nairobi', 'stake': '0x1d930e0d8aa7e8000', 'delegated': '0xc3038b7f25d1c5ee3e17', 'totalBlocks': '0xa870', 'validatedBlocks': '0xa5d5', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x743366', 'lastGenerateBlockHeight': '0x9ec490', 'blockHeight': '0x743366', 'txIndex': '0x1', 'nodeAddress': 'hx3571351614f64721081996247e53f6436ed05e55', 'email': '254prep@gmail.com', 'website': 'http://iconnect.global', 'details': 'http://adaf.io/json', 'p2pEndpoint': '213.136.68.22:7100', 'apiEndpoint': 'http://213.136.68.22:9000/api/v1/status/peer'}, {'address': 'hx2cf560d42b3b505314c526336dad5d1f624bdb1f', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Blockchain at Berkeley', 'country': 'USA', 'city': 'Berkeley', 'stake': '0x1adb248f99a65ca00000', 'delegated': '0xc271e27fbe18e3b9c504', 'totalBlocks': '0xa202b', 'validatedBlocks': '0xa1235', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x7470eb', 'lastGenerateBlockHeight': '0xb86dcb', 'blockHeight': '0x7470eb', 'txIndex': '0x0', 'nodeAddress': 'hx2cf560d42b3b505314c526336dad5d1f624bdb1f', 'email': 'external@blockchain.berkeley.edu', 'website': 'https://blockchain.berkeley.edu/', 'details': 'https://blockchain.berkeley.edu/wp-content/uploads/details.json', 'p2pEndpoint': '95.168.177.48:7100', 'apiEndpoint': 'http://95.168.177.48:9000/api/v1/status/peer'}, {'address': 'hx3ec5c0c906e857de231a7ae16e49ab92c5708699', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICX_Stratos', 'country': 'ZAF', 'city': 'Johannesburg', 'stake': '0x0', 'delegated': '0xbcfc37743f347a744000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x117eae4', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe7d5cb', 'txIndex': '0x5', 'nodeAddress': 'hx3ec5c0c906e857de231a7ae16e49ab92c5708699', 'email': 'icxsa@protonmail.com', 'website': 'https://google.com', 'details': 'http://prep-registration-uncommon-jaguar.s3-website-ap-southeast-1.amazonaws.com/details.json', 'p2pEndpoint': '3.0.105.131:7100', 'apiEndpoint': 'http://3.0.105.131:9000/api/v1/status/peer'}, {'address': 'hx040b667627bbd02619e89439fab48b053e71c666', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICX Australia', 'country': 'AUS', 'city': 'Melbourne and Adelaide', 'stake': '0x0', 'delegated': '0xb39b2a3137a462491a68', 'totalBlocks': '0x52a', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x7422d6', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x7422d6', 'txIndex': '0x0', 'nodeAddress': 'hx040b667627bbd02619e89439fab48b053e71c666', 'email': 'team@icxaustralia.com', 'website': 'https://icxaustralia.com', 'details': 'https://s3-ap-southeast-2.amazonaws.com/static.icxaustralia.com/icxaustraliajson.json', 'p2pEndpoint': 'pubnode.icxaustralia.com:7100', 'apiEndpoint': 'http://pubnode.icxaustralia.com:9000/api/v1/status/peer'}, {'address': 'hxa615b432cb84c3f2ed22194b32df317b474ec2c9', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'HOLA ICON', 'country': 'ESP', 'city': 'Malaga', 'stake': '0x7419585220cab4c8000', 'delegated': '0xa62a7836f0d4c58f59bd', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x134b167', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x8ecb76', 'txIndex': '0x1', 'nodeAddress': 'hxa615b432cb84c3f2ed22194b32df317b474ec2c9', 'email': 'contacto@holaicon.com', 'website': 'http://www.holaicon.com', 'details': 'http://www.holaicon.com/json/details.json', 'p2pEndpoint': '88.99.216.112:7100', 'apiEndpoint': 'http://88.99.216.112:9000/api/v1/status/peer'}, {'address': 'hx9a20bc2de732aad6de56dcaabb800c24aab86c28', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICX Belgium', 'country': 'BEL', 'city': 'Mechelen', 'stake': '0x0', 'delegated': '0xa10a44a426307a8a2123', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x88ec9074f94b48fbf72', 'irepUpdateBlockHeight': '0xecce82', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xecce82', 'txIndex': '0x3', 'nodeAddress': 'hx9a20bc2de732aad6de56dcaabb800c24aab86c28', 'email': 'ICXBelgium@outlook.be', 'website': 'https://twitter.com/Lucky8Steven', 'details': 'http://meta.icon.oaknode.com/iconnode.icon.oaknode.com', 'p2pEndpoint': '35.223.9.223:7100', 'apiEndpoint': 'http://35.223.9.223:9000/api/v1/status/peer'}, {'address': 'hx48b3ed0161c639a4b9ec8f2277cc5ab338af7c9a', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Alice', 'country': 'RUS', 'city': 'Moscow', 'stake': '0x0', 'delegated': '0xa02e357e4524b4fb4a09', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xa342d6', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xa342d6', 'txIndex': '0x3', 'nodeAddress': 'hx48b3ed0161c639a4b9ec8f2277cc5ab338af7c9a', 'email': 'alice.prep@gmail.com', 'website': 'https://aliceone.online', 'details': 'https://aliceone.online/json', 'p2pEndpoint': 'aliceone.online:7100', 'apiEndpoint': 'http://aliceone.online:9000/api/v1/status/peer'}, {'address': 'hx18a807c44b0efdc2e02ea503d7bc011cc4242318', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'RHYTHM (Australia)', 'country': 'AUS', 'city': 'Brisbane', 'stake': '0x0', 'delegated': '0x9eb8f0c6df74d99a4000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xe60329', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe2d3e9', 'txIndex': '0x1', 'nodeAddress': 'hxede3590816c42131570cf4caa5ee3bce250511fe', 'email': 'rhythmnode@gmail.com', 'website': 'https://google.com', 'details': 'https://rhythm-mainnet-aws-us-west-2.s3-us-west-2.amazonaws.com/details.json', 'p2pEndpoint': '44.230.104.155:7100', 'apiEndpoint': 'http://44.230.104.155:9000/api/v1/status/peer'}, {'address': 'hx2f8b9e265975bd6d99c6ea45219105174e8674d8', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'iconic innovation', 'country': 'NLD', 'city': 'Heerlen', 'stake': '0x0', 'delegated': '0x94e0c3bd0ce393ce2d03', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x9bc882', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x9bc882', 'txIndex': '0x1', 'nodeAddress': 'hx2f8b9e265975bd6d99c6ea45219105174e8674d8', 'email': 'iconblockchain@gmail.com', 'website': 'https://iconblockchain.eu', 'details': 'http://88.99.165.21/details.json', 'p2pEndpoint': '88.99.165.21:7100', 'apiEndpoint': 'http://88.99.165.21:9000/api/v1/status/peer'}, {'address': 'hx5ac1e54766ae2e3340e0a6579c2ccde8b766cd76', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Progression', 'country': 'CAN', 'city': 'Sudbury', 'stake': '0x0', 'delegated': '0x920c0b97bb8a5d250000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xd04082', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xcc5702', 'txIndex': '0x3', 'nodeAddress': 'hx5ac1e54766ae2e3340e0a6579c2ccde8b766cd76', 'email': 'jordz26@gmail.com', 'website': 'https://twitter.com/wkwwwwk', 'details': 'https://icon.oaknode.com/p-rep/progression.json', 'p2pEndpoint': '35.193.191.249:7100', 'apiEndpoint': 'http://35.193.191.249:9000/api/v1/status/peer'}, {'address': 'hx704cf476389a2e3ab13ca33eeea9480ee172cf60', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON Russia', 'country': 'RUS', 'city': 'Saint-Petersburg', 'stake': '0x0', 'delegated': '0x8ef85407fa2f924f2bfc', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x915b303287052d6b8f6', 'irepUpdateBlockHeight': '0xfec3be', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xfec3be', 'txIndex': '0x1', 'nodeAddress': 'hx704cf476389a2e3ab13ca33eeea9480ee172cf60', 'email': 'alex.k@ossuan.com', 'website': 'http://ossuan.com', 'details': 'http://ossuan.com/oss.json', 'p2pEndpoint': '185.151.241.71:7100', 'apiEndpoint': 'http://185.151.241.71:9000/api/v1/status/peer'}, {'address': 'hxc93a0be07e8a74d9a86d8b12e569b91154681bc8', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Signal9', 'country': 'KOR', 'city': 'Seoul', 'stake': '0x618d7873974a188000', 'delegated': '0x8c1694c8f7f1ad3963ac', 'totalBlocks': '0x7af6a2', 'validatedBlocks': '0x7adc0c', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x878678326eac9000000', 'irepUpdateBlockHeight': '0xebf653', 'lastGenerateBlockHeight': '0x11f1270', 'blockHeight': '0x73f47e', 'txIndex': '0x1', 'nodeAddress': 'hxc93a0be07e8a74d9a86d8b12e569b91154681bc8', 'email': 'support@signal9.io', 'website': 'https://www.signal9.io/en/', 'details': 'https://signal9-prep-assets.s3.ap-northeast-2.amazonaws.com/prep_detail.json', 'p2pEndpoint': '13.209.183.179:7100', 'apiEndpoint': 'http://13.209.183.179:9000/api/v1/status/peer'}, {'address': 'hxf6672e670d2b5816061da22231f3a90f0b5955b5', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON Chicago', 'country': 'USA', 'city': 'Chicago', 'stake': '0x42470d475e06e15e607', 'delegated': '0x84d34b918120f36f1d6d', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x9be95f29fc8426147f6', 'irepUpdateBlockHeight': '0xdc076c', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xdc076c', 'txIndex': '0x1', 'nodeAddress': 'hxf6672e670d2b5816061da22231f3a90f0b5955b5', 'email': 'iconchicagoteam@gmail.com', 'website': 'http://iconchicago.team', 'details': 'https://prep-details.s3-us-west-1.amazonaws.com/json', 'p2pEndpoint': '165.227.49.93:7100', 'apiEndpoint': 'http://165.227.49.93:9000/api/v1/status/peer'}, {'address': 'hxd243919468353a59250114d3ea891de8486f37c0', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Iconserve', 'country': 'NLD', 'city': 'Amsterdam', 'stake': '0x0', 'delegated': '0x841690a2853e0a5e8000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xe54e71', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xc46c3b', 'txIndex': '0x1', 'nodeAddress': 'hxd243919468353a59250114d3ea891de8486f37c0', 'email': 'admin@iconserve.eu', 'website': 'https://iconserve.eu', 'details': 'https://raw.githubusercontent.com/Iconserve/Iconserve/master/prepdetails.json', 'p2pEndpoint': '85.214.207.194:7100', 'apiEndpoint': 'http://85.214.207.194:9000/api/v1/status/peer'}, {'address': 'hxd17cc393d0b0a59f0a03e4fb4ac1ab196743162f', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Hermes Greece', 'country': 'GRC', 'city': 'Thessaloniki', 'stake': '0x0', 'delegated': '0x8258255b64972acf7462', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x28a857425466f800000', 'irepUpdateBlockHeight': '0x12cb39f', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe82b19', 'txIndex': '0x4', 'nodeAddress': 'hxd17cc393d0b0a59f0a03e4fb4ac1ab196743162f', 'email': 'iconhermes@gmail.com', 'website': 'https://hermesicon.wordpress.com', 'details': 'http://prep-registration-relieved-gazelle.s3-website.us-east-2.amazonaws.com/details.json', 'p2pEndpoint': '3.20.144.125:7100', 'apiEndpoint': 'http://3.20.144.125:9000/api/v1/status/peer'}, {'address': 'hxab1b04e7975ed14074bbbd530333e815c4f36340', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'The Iconist', 'country': 'KOR', 'city': 'Seoul', 'stake': '0x2793460a81fb4000', 'delegated': '0x7fc9351586e88805af0c', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x94d267a8d1b758ed82a', 'irepUpdateBlockHeight': '0x10b38ab', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x10b38ab', 'txIndex': '0x1', 'nodeAddress': 'hxab1b04e7975ed14074bbbd530333e815c4f36340', 'email': 'hello@theicon.ist', 'website': 'https://theicon.ist', 'details': 'http://prep-registration-chief-fowl.s3-website.us-east-2.amazonaws.com/details.json', 'p2pEndpoint': '3.128.114.157:7100', 'apiEndpoint': 'http://3.128.114.157:9000/api/v1/status/peer'}, {'address': 'hxc5e0b88cb9092bbd8b004a517996139334752f62', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Foundry Box Media', 'country': 'USA', 'city': 'Albuquerque', 'stake': '0x0', 'delegated': '0x7a36b672ce9d75511ecb', 'totalBlocks': '0x295', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12dd5b0', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x74186e', 'txIndex': '0x0', 'nodeAddress': 'hxc5e0b88cb9092bbd8b004a517996139334752f62', 'email': 'admin@foundryboxmedia.com', 'website': 'https://foundryboxmedia.com', 'details': 'https://foundryboxmedia.com/prep/info', 'p2pEndpoint': '13.86.179.194:7100', 'apiEndpoint': 'http://13.86.179.194:9000/api/v1/status/peer'}, {'address': 'hxe886f81684bbecddd69a608093fb88624c94d20a', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'POCKET / FIGMENT', 'country': 'CAN', 'city': 'Montreal', 'stake': '0x0', 'delegated': '0x75f0eb30ea4c36b51858', 'totalBlocks': '0x3bda3', 'validatedBlocks': '0x3a225', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x73faa9', 'lastGenerateBlockHeight': '0xac95d2', 'blockHeight': '0x73faa9', 'txIndex': '0x0', 'nodeAddress': 'hxe886f81684bbecddd69a608093fb88624c94d20a', 'email': 'contact@figment.network', 'website': 'https://p-rep.community/candidates/pocket-figment/', 'details': 'https://p-rep.community/pocket-figment.json', 'p2pEndpoint': '66.70.178.32:7100', 'apiEndpoint': 'http://66.70.178.32:9000/api/v1/status/peer'}, {'address': 'hx9fa9d224306b0722099d30471b3c2306421aead7', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Espanicon', 'country': 'VEN', 'city': 'Caracas', 'stake': '0x0', 'delegated': '0x721c7369a4e81c3ae074', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12cd758', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe14638', 'txIndex': '0x7', 'nodeAddress': 'hx9fa9d224306b0722099d30471b3c2306421aead7', 'email': 'info@espanicon.team', 'website': 'https://espanicon.team/', 'details': 'http://prep-registration-good-reindeer.s3-website-us-east-1.amazonaws.com/details.json', 'p2pEndpoint': '52.44.15.210:7100', 'apiEndpoint': 'http://52.44.15.210:9000/api/v1/status/peer'}, {'address': 'hx05493cc93caf332f46715411e12c927750d210b6', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICX Malta', 'country': 'MLT', 'city': 'Valletta', 'stake': '0x28f256929b78ae0c000', 'delegated': '0x716104679caa0d9ae806', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x3224f42723d45400000', 'irepUpdateBlockHeight': '0x13714bf', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x1147434', 'txIndex': '0x1', 'nodeAddress': 'hx05493cc93caf332f46715411e12c927750d210b6', 'email': 'icxmalta@gmail.com', 'website': 'https://icxmalta.com', 'details': 'http://3.23.2.225/icxmalta.json', 'p2pEndpoint': '3.23.2.225:7100', 'apiEndpoint': 'http://3.23.2.225:9000/api/v1/status/peer'}, {'address': 'hx54ebaf568d1d3e61a4ff7d648d3e5cb7ff6179ce', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON Spark', 'country': 'USA', 'city': 'ICON', 'stake': '0x4e61b9e032aebb3c000', 'delegated': '0x6637aead7f39bc45b25d', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x26f6a8f4e6380300000', 'irepUpdateBlockHeight': '0x12c73d7', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe6a2e5', 'txIndex': '0x1', 'nodeAddress': 'hx54ebaf568d1d3e61a4ff7d648d3e5cb7ff6179ce', 'email': 'support@iconspark.net', 'website': 'http://www.iconspark.net', 'details': 'https://iconspark.s3.amazonaws.com/iconspark.json', 'p2pEndpoint': '52.86.97.71:7100', 'apiEndpoint': 'http://52.86.97.71:9000/api/v1/status/peer'}, {'address': 'hxd00b8fe10deb49aa291a9b2cb460779fc622fa12', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON4Education', 'country': 'USA', 'city': 'San Francisco', 'stake': '0x0', 'delegated': '0x64d9666a436787faffde', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x21e19e0c9bab2400000', 'irepUpdateBlockHeight': '0xf57504', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xbcfe35', 'txIndex': '0x1', 'nodeAddress': 'hxd00b8fe10deb49aa291a9b2cb460779fc622fa12', 'email': 'ICON4Education@gmail.com', 'website': 'https://twitter.com/ICON4Education', 'details': 'https://gist.githubusercontent.com/Icon4Education/723f6e34ce304083f53ae13cce7192fb/raw/b9a663a2e4640092734d55edd74765e93a13e96c/details.json', 'p2pEndpoint': '206.189.75.250:7100', 'apiEndpoint': 'http://206.189.75.250:9000/api/v1/status/peer'}, {'address': 'hx554ea6c0c56e6f30682dcaa79a326da3a364899f', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'UNBLOCK {ICX GROWTH INCUBATOR}', 'country': 'JPN', 'city': 'Tokyo', 'stake': '0xb50def61ec1815a4000', 'delegated': '0x6025a9119626b99f017d', 'totalBlocks': '0x149a0', 'validatedBlocks': '0x143fc', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x28a857425466f800000', 'irepUpdateBlockHeight': '0x12cbdb6', 'lastGenerateBlockHeight': '0xabed8f', 'blockHeight': '0x7c311a', 'txIndex': '0x1', 'nodeAddress': 'hx554ea6c0c56e6f30682dcaa79a326da3a364899f', 'email': 'unblockicon@protonmail.com', 'website': 'https://unblock.casa', 'details': 'https://unblock.casa/json', 'p2pEndpoint': '144.76.203.165:7100', 'apiEndpoint': 'http://144.76.203.165:9000/api/v1/status/peer'}, {'address': 'hx0315df35eef97e1e73f1a72b1e78ff7f28ba3176', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Blockheads Development', 'country': 'USA', 'city': 'Fresno', 'stake': '0x7f31762b69e2cc94000', 'delegated': '0x5f3642d2eed7360e122e', 'totalBlocks': '0x219cb9', 'validatedBlocks': '0x217f4b', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x4563918244f40000000', 'irepUpdateBlockHeight': '0x1304304', 'lastGenerateBlockHeight': '0xc4ee89', 'blockHeight': '0x740bea', 'txIndex': '0x2', 'nodeAddress': 'hx0315df35eef97e1e73f1a72b1e78ff7f28ba3176', 'email': 'Jennifer@marketingiq.club', 'website': 'https://weareblockheads.tech', 'details': 'https://weareblockheads.tech/details.json', 'p2pEndpoint': '52.7.201.167:7100', 'apiEndpoint': 'http://52.7.201.167:9000/api/v1/status/peer'}, {'address': 'hx2f3fb9a9ff98df2145936d2bfcaa3837a289496b', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Transcranial Solutions', 'country': 'SWE', 'city': 'Karlshamn', 'stake': '0x0', 'delegated': '0x5c2461ff8a24724f4f49', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x130a3cd', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe9de6e', 'txIndex': '0x3', 'nodeAddress': 'hxf8ad0f684e2a907ea33ec482ea4184c07ad27ec5', 'email': 'transcranial.solutions@gmail.com', 'website': 'https://twitter.com/TranscranialSol/', 'details': 'https://raw.githubusercontent.com/Transcranial-Solutions/Node/master/prep_details.json', 'p2pEndpoint': '31.208.165.65:7100', 'apiEndpoint': 'http://31.208.165.65:9000/api/v1/status/peer'}, {'address': 'hxbf0f9646b09b0e0943ed768795c0d6c32a758d35', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON USA', 'country': 'USA', 'city': 'Brooklyn', 'stake': '0x0', 'delegated': '0x59ef82689bfe7605c758', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x97004caa1539ec28cea', 'irepUpdateBlockHeight': '0xe68aba', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe68aba', 'txIndex': '0x4', 'nodeAddress': 'hxbf0f9646b09b0e0943ed768795c0d6c32a758d35', 'email': 'iconusaprep@gmail.com', 'website': 'https://google.com', 'details': 'http://prep-registration-unique-katydid.s3-website.us-east-2.amazonaws.com/details.json', 'p2pEndpoint': '3.16.177.23:7100', 'apiEndpoint': 'http://3.16.177.23:9000/api/v1/status/peer'}, {'address': 'hxe36c036b294cd8a7dc511d7f58c541cdc93704bb', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICONSG', 'country': 'SGP', 'city': 'Singapore', 'stake': '0x0', 'delegated': '0x547d50a041dce941c000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x91a56492fce72e59247', 'irepUpdateBlockHeight': '0xfa4f4b', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xfa4f4b', 'txIndex': '0x2', 'nodeAddress': 'hxe36c036b294cd8a7dc511d7f58c541cdc93704bb', 'email': 'iconsg10@gmail.com', 'website': 'https://insight-icon.net', 'details': 'http://prep-registration-grown-chamois.s3-website-ap-southeast-1.amazonaws.com/details.json', 'p2pEndpoint': '3.0.140.226:7100', 'apiEndpoint': 'http://3.0.140.226:9000/api/v1/status/peer'}, {'address': 'hxf49551380a26055a26f4dffd3aa837e66877571b', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Wetez', 'country': 'CHN', 'city': 'Bei Jing', 'stake': '0x0', 'delegated': '0x53d6448eb10f93328000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x748901', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x748901', 'txIndex': '0x0', 'nodeAddress': 'hxf49551380a26055a26f4dffd3aa837e66877571b', 'email': 'kamiesheep@gmail.com', 'website': 'https://www.wetez.io', 'details': 'https://api.wetez.io/blossom/v4/webapi/ext/iconjson', 'p2pEndpoint': '13.228.38.77:7100', 'apiEndpoint': 'http://13.228.38.77:9000/api/v1/status/peer'}, {'address': 'hxf85e4d956f1dfad8d713421ab58b24863c28b28a', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'DRAICON BALL', 'country': 'KOR', 'city': 'Seoul', 'stake': '0x0', 'delegated': '0x53c6a3c3deab031c0899', 'totalBlocks': '0xa0b1', 'validatedBlocks': '0x9da2', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x740ad4', 'lastGenerateBlockHeight': '0x9ec4ea', 'blockHeight': '0x740ad4', 'txIndex': '0x0', 'nodeAddress': 'hxf85e4d956f1dfad8d713421ab58b24863c28b28a', 'email': 'renov.jung@gmail.com', 'website': 'https://www.iconworld.io', 'details': 'https://www.iconworld.io/draiconball_detail.json', 'p2pEndpoint': '52.78.0.124:7100', 'apiEndpoint': 'http://52.78.0.124:9000/api/v1/status/peer'}, {'address': 'hx42c103859f2cc380bacb5b0ad3b058d7fe57f430', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON Oasis', 'country': 'USA', 'city': 'San Diego', 'stake': '0x401e93f9c894278000', 'delegated': '0x51e7a86a4538cece2000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xe7d544', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xdadad9', 'txIndex': '0x1', 'nodeAddress': 'hx42c103859f2cc380bacb5b0ad3b058d7fe57f430', 'email': 'icon.oasis.prep@gmail.com', 'website': 'https://prep-registration-assured-haddock.s3-us-west-2.amazonaws.com/index.html', 'details': 'http://prep-registration-assured-haddock.s3-website-us-west-2.amazonaws.com/details.json', 'p2pEndpoint': '44.232.106.11:7100', 'apiEndpoint': 'http://44.232.106.11:9000/api/v1/status/peer'}, {'address': 'hx9121c5914ce34f59de52fe15efd6f7982c2ab8ae', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON-NYC', 'country': 'USA', 'city': 'New York City', 'stake': '0x12c8fdeb655525f940d', 'delegated': '0x506cd62e5f4590b46edd', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xe93c54', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xcbd9e9', 'txIndex': '0x4', 'nodeAddress': 'hx9121c5914ce34f59de52fe15efd6f7982c2ab8ae', 'email': 'icon.nyc.prep@gmail.com', 'website': 'http://prep-registration-wanted-bonefish.s3-website.us-east-2.amazonaws.com', 'details': 'http://prep-registration-wanted-bonefish.s3-website.us-east-2.amazonaws.com/details.json', 'p2pEndpoint': '3.19.25.206:7100', 'apiEndpoint': 'http://3.19.25.206:9000/api/v1/status/peer'}, {'address': 'hxff6437443e7ed76d2d7f97f0d28d7ae1071bd0bb', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Icon-4-Business', 'country': 'USA', 'city': 'Chattanooga', 'stake': '0x1c083715e1ee50000', 'delegated': '0x4e05264aa30588d1f060', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x3635c9adc5dea000000', 'irepUpdateBlockHeight': '0x145f605', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xdb2150', 'txIndex': '0x2', 'nodeAddress': 'hxff6437443e7ed76d2d7f97f0d28d7ae1071bd0bb', 'email': '1guitar6strings@gmail.com', 'website': 'http://www.tokenup.io', 'details': 'http://keekee.io/node.json', 'p2pEndpoint': '134.122.40.114:7100', 'apiEndpoint': 'http://134.122.40.114:9000/api/v1/status/peer'}, {'address': 'hxdcff7a1ab76ba34a9e3c85b0f1e7b2bf436ac024', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Staked', 'country': 'USA', 'city': 'Boston', 'stake': '0x444ae76d6bb28000', 'delegated': '0x4238244b4a0be1026c88', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x109fad4', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x75b2dc', 'txIndex': '0x0', 'nodeAddress': 'hxdcff7a1ab76ba34a9e3c85b0f1e7b2bf436ac024', 'email': 'devops@staked.us', 'website': 'https://icon.staked.us', 'details': 'https://storage.googleapis.com/icon-json-data/prod.json', 'p2pEndpoint': '3.225.16.37:7100', 'apiEndpoint': 'http://3.225.16.37:9000/api/v1/status/peer'}, {'address': 'hx55f2cc3244350085734f4e405f761ecf3d2095b3', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Staked Tech', 'country': 'HRV', 'city': 'Zagreb', 'stake': '0x0', 'delegated': '0x4106e4a3a76310fb50fa', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2c0bb3dd30c4e200000', 'irepUpdateBlockHeight': '0x12cea2d', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xd97c64', 'txIndex': '0x2', 'nodeAddress': 'hx55f2cc3244350085734f4e405f761ecf3d2095b3', 'email': 'staked.tech@protonmail.com', 'website': 'https://www.staked.tech/', 'details': 'https://raw.githubusercontent.com/iCONsolidation/Icon-P-Rep/master/setPRep.json', 'p2pEndpoint': '49.12.5.98:7100', 'apiEndpoint': 'http://49.12.5.98:9000/api/v1/status/peer'}, {'address': 'hx34f817bad3d0554da6c6642b06056bda32b06396', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'GagarinCrypto', 'country': 'RUS', 'city': 'Moscow', 'stake': '0x0', 'delegated': '0x40e424eb73fd5db64000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x9533cf701ddf5d6df66', 'irepUpdateBlockHeight': '0x11a2d8e', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x11a2d8e', 'txIndex': '0x1', 'nodeAddress': 'hx34f817bad3d0554da6c6642b06056bda32b06396', 'email': 'youremail@gmail.com', 'website': 'https://insight-icon.net', 'details': 'http://prep-registration-renewing-mongrel.s3-website.eu-north-1.amazonaws.com/details.json', 'p2pEndpoint': '13.53.33.45:7100', 'apiEndpoint': 'http://13.53.33.45:9000/api/v1/status/peer'}, {'address': 'hxaf33a0c15dbf52b76590422cbb7e2d835034cdf6', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Plan-P', 'country': 'KOR', 'city': 'Seoul', 'stake': '0x2056a3441b0467ac000', 'delegated': '0x405d25e6fa36b56ab1e1', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x9b546a1084036b509c1', 'irepUpdateBlockHeight': '0xe1da0a', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe1da0a', 'txIndex': '0x1', 'nodeAddress': 'hxaf33a0c15dbf52b76590422cbb7e2d835034cdf6', 'email': 'master@plan-p.io', 'website': 'http://plan-p.io', 'details': 'http://icon.plan-p.io/config_mainnet.json', 'p2pEndpoint': '15.164.138.240:7100', 'apiEndpoint': 'http://15.164.138.240:9000/api/v1/status/peer'}, {'address': 'hx02645148d0887cd1daf345e3eabf8871780398e5', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICONLEO', 'country': 'LVA', 'city': 'Riga', 'stake': '0x0', 'delegated': '0x3bb69cfb079b071dacad', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x12ef93c', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xdbf836', 'txIndex': '0x1', 'nodeAddress': 'hx02645148d0887cd1daf345e3eabf8871780398e5', 'email': 'v@inbox.eu', 'website': 'https://twitter.com/iconleo5', 'details': 'http://meta.icon.oaknode.com/vladimirs.icon.oaknode.com', 'p2pEndpoint': '34.69.198.198:7100', 'apiEndpoint': 'http://34.69.198.198:9000/api/v1/status/peer'}, {'address': 'hx135d9c1b6ad2b7750f153d1649b676f8625e470c', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON Guide Star', 'country': 'GBR', 'city': 'London', 'stake': '0x5aa3a9455d4520000', 'delegated': '0x3b6fcbcea03c0d8d5540', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x2f6f10780d22cc00000', 'irepUpdateBlockHeight': '0x1302b5d', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe9e2e6', 'txIndex': '0x10', 'nodeAddress': 'hx135d9c1b6ad2b7750f153d1649b676f8625e470c', 'email': 'iconguidestar@gmail.com', 'website': 'https://medium.com/@iconguidestar', 'details': 'http://prep-registration-exact-cougar.s3-website.eu-west-2.amazonaws.com/details.json', 'p2pEndpoint': '3.10.31.249:7100', 'apiEndpoint': 'http://3.10.31.249:9000/api/v1/status/peer'}, {'address': 'hx800853ad662997466bd41653329ba97a2ed1f838', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON Econ', 'country': 'USA', 'city': 'San Francisco', 'stake': '0x0', 'delegated': '0x38cfc4a297f0a3fa7ec2', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x8a43a8b7af792fec7f6', 'irepUpdateBlockHeight': '0x11c1b0b', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x11c1b0b', 'txIndex': '0x1', 'nodeAddress': 'hx800853ad662997466bd41653329ba97a2ed1f838', 'email': 'nanaisback@protonmail.com', 'website': 'https://insight-icon.net', 'details': 'http://prep-registration-immune-crawfish.s3-website.us-east-2.amazonaws.com/details.json', 'p2pEndpoint': '3.130.56.105:7100', 'apiEndpoint': 'http://3.130.56.105:9000/api/v1/status/peer'}, {'address': 'hx6deee24065b8fa75298b0a22c5a221e2587ba09d', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Sunrise', 'country': 'CAN', 'city': 'Vancouver', 'stake': '0x0', 'delegated': '0x342f8fdfdb64b767cf97', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x9ec8923dd9175fad52d', 'irepUpdateBlockHeight': '0xdae809', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xdae809', 'txIndex': '0x1', 'nodeAddress': 'hx6deee24065b8fa75298b0a22c5a221e2587ba09d', 'email': 'hellosunrise18@gmail.com', 'website': 'https://twitter.com/hellosunrise18', 'details': 'http://meta.icon.oaknode.com/wayneliang.icon.oaknode.com.json', 'p2pEndpoint': '35.222.254.39:7100', 'apiEndpoint': 'http://35.222.254.39:9000/api/v1/status/peer'}, {'address': 'hxd4f3fc3fbdc475874285abf9459119f8dede31dd', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Sicko Node', 'country': 'AUS', 'city': 'Sydney', 'stake': '0x0', 'delegated': '0x3052e90b9208fad25c00', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xe165dc', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xdd78cd', 'txIndex': '0x1', 'nodeAddress': 'hxd4f3fc3fbdc475874285abf9459119f8dede31dd', 'email': 'sickonode@aussiebb.com.au', 'website': 'https://twitter.com/sickonode', 'details': 'http://meta.icon.oaknode.com/sickonode.icon.oaknode.com', 'p2pEndpoint': '35.239.154.121:7100', 'apiEndpoint': 'http://35.239.154.121:9000/api/v1/status/peer'}, {'address': 'hx11434d1fce3edecf0e84a9c992a712f0cebf6992', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'icon-node-NL', 'country': 'NLD', 'city': 'Dronten', 'stake': '0x2c36398e6e74eb20000', 'delegated': '0x2e7f2a6f992951550ed5', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x88ca3b77f10a1e0c29b', 'irepUpdateBlockHeight': '0xf2f3ff', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xf2f3ff', 'txIndex': '0x1', 'nodeAddress': 'hx11434d1fce3edecf0e84a9c992a712f0cebf6992', 'email': 'nocadmin@pm.me', 'website': 'https://www.node-icon.web.hosting-russia.ru/', 'details': 'https://www.node-icon.web.hosting-russia.ru/prep/details.json', 'p2pEndpoint': '194.147.115.11:7100', 'apiEndpoint': 'http://194.147.115.11:9000/api/v1/status/peer'}, {'address': 'hx004783f10b0bd56764535cf931650dfe6d42cd9e', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'DELIGHT', 'country': 'KOR', 'city': 'Seoul', 'stake': '0x575ecdff3aad2574000', 'delegated': '0x2d515bafe6e713a46db0', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0x73f234', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0x73f234', 'txIndex': '0x1', 'nodeAddress': 'hx004783f10b0bd56764535cf931650dfe6d42cd9e', 'email': 'contact@de-light.io', 'website': 'https://de-light.io', 'details': 'https://de-light.io/icon/de-light_icon.json', 'p2pEndpoint': 'node.icon.de-light.io:7100', 'apiEndpoint': 'http://node.icon.de-light.io:9000/api/v1/status/peer'}, {'address': 'hx5ccbcb12e2248acfd420b9adb79ceb8f324107d6', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'Frontlines Media', 'country': 'USA', 'city': 'San Juan', 'stake': '0x0', 'delegated': '0x2c857e119e66d55acb8f', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x9f7163863e7096102c3', 'irepUpdateBlockHeight': '0xd09c7c', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xd09c7c', 'txIndex': '0x2', 'nodeAddress': 'hx5ccbcb12e2248acfd420b9adb79ceb8f324107d6', 'email': 'brett@frontlines.io', 'website': 'https://www.frontlines.io', 'details': 'http://prep-registration-clever-muskrat.s3-website-us-west-2.amazonaws.com/details.json', 'p2pEndpoint': '44.232.97.114:7100', 'apiEndpoint': 'http://44.232.97.114:9000/api/v1/status/peer'}, {'address': 'hxd19d4bc5a9eef4e044d83abc82d903ac80504ac8', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON BOOM', 'country': 'GBR', 'city': 'London', 'stake': '0x19852909415318c8000', 'delegated': '0x2a8928d36ce7e7332e0d', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x9b597abf94462383846', 'irepUpdateBlockHeight': '0xe0bbc5', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xe0bbc5', 'txIndex': '0x1', 'nodeAddress': 'hxd19d4bc5a9eef4e044d83abc82d903ac80504ac8', 'email': 'youremail@gmail.com', 'website': 'https://iconboom.co.uk', 'details': 'http://prep-registration-comic-pup.s3-website.eu-west-2.amazonaws.com/details.json', 'p2pEndpoint': '3.11.156.255:7100', 'apiEndpoint': 'http://3.11.156.255:9000/api/v1/status/peer'}, {'address': 'hx475e37c2decf56f5bf678060e3937c944921ccba', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICON London', 'country': 'GBR', 'city': 'London', 'stake': '0x0', 'delegated': '0x26b383075efdd5536596', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x9f73b5824ed71a423d4', 'irepUpdateBlockHeight': '0xd19948', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xd19948', 'txIndex': '0x1', 'nodeAddress': 'hx475e37c2decf56f5bf678060e3937c944921ccba', 'email': 'jackamasterson@hotmail.co.uk', 'website': 'http://prep-registration-ideal-bluebird.s3-website-eu-west-1.amazonaws.com/', 'details': 'http://prep-registration-ideal-bluebird.s3-website-eu-west-1.amazonaws.com/details.json', 'p2pEndpoint': '34.240.58.101:7100', 'apiEndpoint': 'http://34.240.58.101:9000/api/v1/status/peer'}, {'address': 'hx29fbc9cfb184d75d74cab33c70820a696998b596', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'ICONIST VOTE WISELY - twitter.com/info_prep', 'country': 'GRD', 'city': 'Grenada', 'stake': '0x0', 'delegated': '0x24e4e4e428b1fe2c8000', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0x21e19e0c9bab2400000', 'irepUpdateBlockHeight': '0x128f2d9', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xde21d7', 'txIndex': '0x1', 'nodeAddress': 'hx29fbc9cfb184d75d74cab33c70820a696998b596', 'email': 'iconnode@gmail.com', 'website': 'https://twitter.com/info_prep', 'details': 'http://prep-registration-charmed-goose.s3-website-eu-west-1.amazonaws.com/details.json', 'p2pEndpoint': '34.255.37.220:7100', 'apiEndpoint': 'http://34.255.37.220:9000/api/v1/status/peer'}, {'address': 'hx35a0a985a9abd8cbbc71bec1aba74ca204369c8a', 'status': '0x0', 'penalty': '0x0', 'grade': '0x1', 'name': 'RemICX', 'country': 'THA', 'city': 'Bangkok', 'stake': '0x0', 'delegated': '0x240a760f2c90794a41d4', 'totalBlocks': '0x0', 'validatedBlocks': '0x0', 'unvalidatedSequenceBlocks': '0x0', 'irep': '0xa968163f0a57b400000', 'irepUpdateBlockHeight': '0xdfeb15', 'lastGenerateBlockHeight': '-0x1', 'blockHeight': '0xdf4247', 'txIndex': '0x6', 'nodeAddress': 'hx35a0a985a9abd8cbbc71bec1aba74ca204369c8a', 'email': 'remicx.net@gmail.com', 'website': 'https://www.remicx.net', 'details': 'https://www.remicx.net/conf/config.json', 'p2pEndpoint': '138.201.137.189:7100', 'apiEndpoint': 'http://138.201.137.189:9000/api/v1/status/peer'}]
-# preps = ['http://210.180.69.101:9000/api/v1/status/peer', 'http://3.14.196.215:9000/api/v1/status/peer', 'http://3.114.212.239:9000/api/v1/status/peer', 'http://13.58.103.19:9000/api/v1/status/peer', 'http://52.47.90.20:9000/api/v1/status/peer', 'http://35.231.14.204:9000/api/v1/status/peer', 'http://3.137.75.159:9000/api/v1/status/peer', 'http://18.230.33.207:9000/api/v1/status/peer', 'http://169.48.79.54:9000/api/v1/status/peer', 'http://13.115.105.184:9000/api/v1/status/peer', 'http://34.239.57.162:9000/api/v1/status/peer', 'http://159.69.63.222:9000/api/v1/status/peer', 'http://13.125.155.171:9000/api/v1/status/peer', 'http://18.140.186.29:9000/api/v1/status/peer', 'http://3.8.92.147:9000/api/v1/status/peer', 'http://185.172.110.74:9000/api/v1/status/peer', 'http://52.36.75.189:9000/api/v1/status/peer', 'http://95.179.230.6:9000/api/v1/status/peer', 'http://52.34.9.60:9000/api/v1/status/peer', 'http://15.188.240.233:9000/api/v1/status/peer', 'http://51.159.17.38:9000/api/v1/status/peer', 'http://84.201.175.163:9000/api/v1/status/peer', 'http://155.138.134.222:9000/api/v1/status/peer', 'http://15.222.213.224:9000/api/v1/status/peer', 'http://44.238.34.143:9000/api/v1/status/peer', 'http://167.71.4.34:9000/api/v1/status/peer', 'http://3.218.194.233:9000/api/v1/status/peer', 'http://13.124.127.40:9000/api/v1/status/peer', 'http://13.49.93.73:9000/api/v1/status/peer', 'http://3.233.34.53:9000/api/v1/status/peer', 'http://159.69.136.250:9000/api/v1/status/peer', 'http://3.128.245.157:9000/api/v1/status/peer', 'http://13.230.106.222:9000/api/v1/status/peer', 'http://35.224.139.66:9000/api/v1/status/peer', 'http://54.81.151.142:9000/api/v1/status/peer', 'http://54.203.40.175:9000/api/v1/status/peer', 'http://54.71.216.101:9000/api/v1/status/peer', 'http://51.38.62.198:9000/api/v1/status/peer', 'http://44.239.209.49:9000/api/v1/status/peer', 'http://34.74.79.223:9000/api/v1/status/peer', 'http://54.169.49.247:9000/api/v1/status/peer', 'http://52.44.216.243:9000/api/v1/status/peer', 'http://95.217.62.85:9000/api/v1/status/peer', 'http://18.177.179.71:9000/api/v1/status/peer', 'http://116.203.207.222:9000/api/v1/status/peer', 'http://149.28.130.174:9000/api/v1/status/peer', 'http://116.203.209.7:9000/api/v1/status/peer', 'http://138.68.63.35:9000/api/v1/status/peer', 'http://3.20.115.13:9000/api/v1/status/peer', 'http://5.189.170.65:9000/api/v1/status/peer', 'http://144.91.102.161:9000/api/v1/status/peer', 'http://35.226.38.115:9000/api/v1/status/peer', 'http://213.136.68.22:9000/api/v1/status/peer', 'http://95.168.177.48:9000/api/v1/status/peer', 'http://3.0.105.131:9000/api/v1/status/peer', 'http://pubnode.icxaustralia.com:9000/api/v1/status/peer', 'http://88.99.216.112:9000/api/v1/status/peer', 'http://35.223.9.223:9000/api/v1/status/peer', 'http://aliceone.online:9000/api/v1/status/peer', 'http://44.230.104.155:9000/api/v1/status/peer', 'http://88.99.165.21:9000/api/v1/status/peer', 'http://35.193.191.249:9000/api/v1/status/peer', 'http://185.151.241.71:9000/api/v1/status/peer', 'http://13.209.183.179:9000/api/v1/status/peer', 'http://165.227.49.93:9000/api/v1/status/peer', 'http://85.214.207.194:9000/api/v1/status/peer', 'http://3.20.144.125:9000/api/v1/status/peer', 'http://3.128.114.157:9000/api/v1/status/peer', 'http://13.86.179.194:9000/api/v1/status/peer', 'http://66.70.178.32:9000/api/v1/status/peer', 'http://52.44.15.210:9000/api/v1/status/peer', 'http://3.23.2.225:9000/api/v1/status/peer', 'http://52.86.97.71:9000/api/v1/status/peer', 'http://206.189.75.250:9000/api/v1/status/peer', 'http://144.76.203.165:9000/api/v1/status/peer', 'http://52.7.201.167:9000/api/v1/status/peer', 'http://31.208.165.65:9000/api/v1/status/peer', 'http://3.16.177.23:9000/api/v1/status/peer', 'http://3.0.140.226:9000/api/v1/status/peer', 'http://13.228.38.77:9000/api/v1/status/peer', 'http://52.78.0.124:9000/api/v1/status/peer', 'http://44.232.106.11:9000/api/v1/status/peer', 'http://3.19.25.206:9000/api/v1/status/peer', 'http://134.122.40.114:9000/api/v1/status/peer', 'http://3.225.16.37:9000/api/v1/status/peer', 'http://49.12.5.98:9000/api/v1/status/peer', 'http://13.53.33.45:9000/api/v1/status/peer', 'http://15.164.138.240:9000/api/v1/status/peer', 'http://34.69.198.198:9000/api/v1/status/peer', 'http://3.10.31.249:9000/api/v1/status/peer', 'http://3.130.56.105:9000/api/v1/status/peer', 'http://35.222.254.39:9000/api/v1/status/peer', 'http://35.239.154.121:9000/api/v1/status/peer', 'http://194.147.115.11:9000/api/v1/status/peer', 'http://node.icon.de-light.io:9000/api/v1/status/peer', 'http://44.232.97.114:9000/api/v1/status/peer', 'http://3.11.156.255:9000/api/v1/status/peer', 'http://34.240.58.101:9000/api/v1/status/peer', 'http://34.255.37.220:9000/api/v1/status/peer', 'http://138.201.137.189:9000/api/v1/status/peer']
-#
-# if __name__ == '__main__':
-#     asyncio.run(get_prep_list_async(prep_list, 10))
@@ -19,8 +19,13 @@ setup(
         'requests>=2,<3',
         'prometheus_client',
         'pydantic',
-        'aiohttp'
+        'aiohttp',
+        'numpy'
     ],
+    extras_require={
+        'fast': ['orjson'],
+        'remote_write': ['python-snappy'],
+    },
     include_package_data=True,
     author="Rob Cannon",
     author_email="rob.cannon@insightdatascience.com",
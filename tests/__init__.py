@@ -5,6 +5,7 @@ import shutil
 import tempfile
 
 import pytest
+from aiohttp import web
 
 _HERE = os.path.dirname(__file__)
 
@@ -39,3 +40,14 @@ def local_tmp_dir_fixture(request):
     def teardown():
         shutil.rmtree(d)
     return d
+
+
+async def start_server(routes, host='127.0.0.1', port=0):
+    """Serve aiohttp routes locally, returns the runner and the base url."""
+    app = web.Application()
+    app.router.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    return runner, f"http://{host}:{runner.addresses[0][1]}"
@@ -0,0 +1,35 @@
+import numpy as np
+
+from icon_network_exporter import analytics
+
+
+def test_block_rate_uses_timestamps_and_skips_missing():
+    timestamps = np.array([[0., 0.], [5., 5.], [10., np.nan], [16., 15.]])
+    heights = np.array([[100., 50.], [102.5, np.nan], [105., np.nan], [108., 56.]])
+    rate = analytics.block_rate(heights, timestamps)
+    assert np.isclose(rate[0], .5)
+    assert np.isclose(rate[1], .4)
+
+
+def test_summarize():
+    timestamps = np.array([[0., np.nan], [2., np.nan], [4., 4.]])
+    heights = np.array([[10., np.nan], [11., np.nan], [12., 9.]])
+    latencies = np.array([[10., np.nan], [20., np.nan], [30., 5.]])
+    summary = analytics.summarize(heights, timestamps, latencies, 12)
+    np.testing.assert_allclose(summary['block_time'], [2., np.nan])
+    np.testing.assert_allclose(summary['block_lag'], [0., 3.])
+    np.testing.assert_allclose(summary['latency_mean'], [20., 5.])
+    assert summary['latency_p95'][0] > 28
+
+
+def test_productivity_between_prep_lists():
+    previous = {'totalBlocks': np.array([100., 100., 50., np.nan]),
+                'validatedBlocks': np.array([90., 100., 50., np.nan]),
+                'delegated': np.array([10., 20., 30., np.nan])}
+    current = {'totalBlocks': np.array([200., 100., 60., 10.]),
+               'validatedBlocks': np.array([180., 100., 60., 10.]),
+               'delegated': np.array([15., 20., 25., 5.])}
+    result = analytics.productivity(previous, current, 10)
+    np.testing.assert_allclose(result['validation_rate'], [.9, np.nan, 1, np.nan])
+    np.testing.assert_allclose(result['missed_blocks_rate'], [1, np.nan, 0, np.nan])
+    np.testing.assert_allclose(result['delegation_change'], [5, 0, -5, np.nan])
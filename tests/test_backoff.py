@@ -0,0 +1,41 @@
+import numpy as np
+
+from icon_network_exporter.backoff import NodeBackoff
+
+
+def test_backs_off_exponentially_and_recovers():
+    backoff = NodeBackoff(poll_interval=5, factor=2, max_interval=30, after_failures=2)
+    backoff.remap([None, None])
+    ok, down = np.array([True, False]), np.array([True, True])
+
+    now = 0
+    backoff.update(now, down, ok)
+    assert backoff.due(now + 5).all()
+
+    # Second failure in a row starts the backoff
+    backoff.update(now, down, ok)
+    np.testing.assert_array_equal(backoff.due(now + 4.9), [True, False])
+    assert backoff.due(now + 5)[1]
+
+    now = 5
+    backoff.update(now, backoff.due(now), ok)
+    assert not backoff.due(now + 9.9)[1]
+    assert backoff.due(now + 10)[1]
+
+    for now in (15, 35, 65):
+        backoff.update(now, backoff.due(now), ok)
+    assert backoff.next_attempt[1] == 65 + 30
+
+    # Probe succeeds
+    now = 95
+    backoff.update(now, backoff.due(now), np.array([True, True]))
+    assert backoff.failures[1] == 0
+    assert backoff.due(now + 5).all()
+
+
+def test_remap_keeps_state_by_node():
+    backoff = NodeBackoff(poll_interval=5, after_failures=1)
+    backoff.remap([None, None])
+    backoff.update(0, np.array([True, True]), np.array([True, False]))
+    backoff.remap([1, None])
+    np.testing.assert_array_equal(backoff.due(1), [False, True])
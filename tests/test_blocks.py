@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+from prometheus_client import CollectorRegistry
+from prometheus_client.parser import text_string_to_metric_families
+
+from benchmarks.fleet import FakeFleet
+from benchmarks.run import free_port
+from icon_network_exporter import Exporter, exposition
+from icon_network_exporter.blocks import BlockSubscriber, get_websocket_url
+from icon_network_exporter.config import Config
+from icon_network_exporter.jsonrpc import JsonRpcClient
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.utils import create_session
+
+
+def run_subscriber(fleet: FakeFleet, duration: float):
+    metrics = Metrics(CollectorRegistry())
+
+    async def run():
+        port = await fleet.start()
+        session = create_session()
+        config = Config(main_api_endpoint=f'http://127.0.0.1:{port}/api/v3', block_poll_interval=.02)
+        subscriber = BlockSubscriber(session, config, metrics, JsonRpcClient(session, config.main_api_endpoint))
+        subscriber.term_change_block = fleet.start_height + 1000
+        task = asyncio.ensure_future(subscriber.run(asyncio.Event()))
+        try:
+            await asyncio.sleep(duration / 2)
+            seeded_height = subscriber.height - 2
+            subscriber.seed_total_tx(seeded_height, 1000)
+            await asyncio.sleep(duration / 2)
+            return subscriber, seeded_height, fleet.height()
+        finally:
+            task.cancel()
+            await session.close()
+            await fleet.stop()
+
+    subscriber, seeded_height, height = asyncio.run(run())
+
+    def value(metric):
+        return metrics.registry.get_sample_value(metric, {'network_name': 'mainnet'})
+
+    assert height - 1 <= subscriber.height <= height
+    assert value('icon_last_block_height') == value('icon_prep_reference_block_height') == subscriber.height
+    assert value('icon_prep_reference_block_time') == pytest.approx(fleet.block_time, abs=1e-5)
+    assert value('icon_blocks_left_in_term') == fleet.start_height + 1000 - subscriber.height
+    assert value('icon_total_tx') == 1000 + (subscriber.height - seeded_height) * fleet.total_tx_per_block
+    return subscriber
+
+
+def test_blocks_from_websocket():
+    fleet = FakeFleet(1, block_time=.05)
+    subscriber = run_subscriber(fleet, .6)
+    assert subscriber.use_websocket
+    assert fleet.ws_connections == 1
+
+
+def test_blocks_polled_without_websocket():
+    fleet = FakeFleet(1, block_time=.05)
+    fleet.block_websocket = False
+    subscriber = run_subscriber(fleet, .6)
+    assert not subscriber.use_websocket
+
+
+def test_websocket_url():
+    assert get_websocket_url('https://ctz.solidwallet.io/api/v3') == 'wss://ctz.solidwallet.io/api/v3/icon_dex/block'
+    assert get_websocket_url('http://127.0.0.1:9000/api/v3/') == 'ws://127.0.0.1:9000/api/v3/icon_dex/block'
+
+
+def test_metrics_follow_blocks_between_polls():
+    fleet = FakeFleet(5, latency=.001, jitter=0, block_time=.05)
+    metrics = Metrics(CollectorRegistry())
+
+    async def scrape(session, url) -> float:
+        async with session.get(url) as response:
+            for family in text_string_to_metric_families(await response.text()):
+                if family.name == 'icon_last_block_height':
+                    return family.samples[0].value
+
+    async def run():
+        port = await fleet.start()
+        session = create_session()
+        config = Config(main_api_endpoint=f'http://127.0.0.1:{port}/api/v3', end_ranking=hex(5), peer_api_port=port,
+                        poll_interval=60, block_subscription=True, metrics_update_interval=.05)
+        exporter = Exporter(config, metrics)
+        cache = exposition.MetricsCache(metrics.registry, min_update_interval=config.metrics_update_interval)
+        exporter.on_change = cache.invalidate
+        metrics_port = free_port()
+        runner = await exposition.start_server(cache, metrics_port, '127.0.0.1')
+        stop = asyncio.Event()
+        try:
+            await exporter.open(session)
+            await exporter.poll()
+            await cache.update()
+            task = asyncio.ensure_future(exporter.blocks.run(stop))
+            url = f'http://127.0.0.1:{metrics_port}/metrics'
+            first = await scrape(session, url)
+            await asyncio.sleep(.5)
+            second = await scrape(session, url)
+            task.cancel()
+            return first, second
+        finally:
+            await runner.cleanup()
+            await session.close()
+            await fleet.stop()
+
+    first, second = asyncio.run(run())
+    # No poll in between, the blocks got to /metrics by themselves
+    assert second >= first + 5
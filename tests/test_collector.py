@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+from prometheus_client import CollectorRegistry, generate_latest
+
+from icon_network_exporter.collector import OnDemandCollector
+from icon_network_exporter.metrics import Metrics
+
+
+class FakeExporter:
+    def __init__(self, metrics: Metrics):
+        self.metrics = metrics
+        self.polls = 0
+
+    async def poll(self):
+        self.polls += 1
+        await asyncio.sleep(.1)
+        self.metrics.gauge_total_tx.labels('mainnet').set(self.polls)
+
+
+def test_scrapes_share_one_poll_and_honour_staleness():
+    metrics = Metrics(CollectorRegistry())
+    exporter = FakeExporter(metrics)
+    collector = OnDemandCollector([exporter], metrics, max_staleness=60, timeout=5)
+    registry = CollectorRegistry()
+    registry.register(collector)
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    collector.loop = loop
+    try:
+        scrapes = [threading.Thread(target=generate_latest, args=(registry,)) for _ in range(5)]
+        for t in scrapes:
+            t.start()
+        for t in scrapes:
+            t.join()
+        assert exporter.polls == 1
+
+        # Still fresh, served from the snapshot
+        assert b'icon_total_tx{network_name="mainnet"} 1.0' in generate_latest(registry)
+        assert exporter.polls == 1
+
+        collector.max_staleness = 0
+        assert b'icon_total_tx{network_name="mainnet"} 2.0' in generate_latest(registry)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
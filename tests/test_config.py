@@ -0,0 +1,17 @@
+from icon_network_exporter.config import Config, NetworksEnum, RPC_URL_MAP
+
+
+def test_single_network_config():
+    config = Config(network_name='zicon')
+    assert config.network_configs() == [config]
+    assert config.main_api_endpoint == RPC_URL_MAP['zicon']['main_api_endpoint']
+
+
+def test_network_configs():
+    configs = Config(networks='mainnet, bicon', poll_interval=10).network_configs()
+    assert [c.network_name for c in configs] == [NetworksEnum.mainnet, NetworksEnum.bicon]
+    assert configs[1].main_api_endpoint == RPC_URL_MAP['bicon']['main_api_endpoint']
+    assert configs[1].end_ranking == RPC_URL_MAP['bicon']['end_ranking']
+    assert all(c.poll_interval == 10 for c in configs)
+
+    assert len(Config(networks='all').network_configs()) == len(RPC_URL_MAP)
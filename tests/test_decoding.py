@@ -0,0 +1,26 @@
+import json
+import os
+
+from icon_network_exporter.decoding import PREP_FIELDS, PREP_NUMBERS, decode_peer_status, decode_preps
+
+_HERE = os.path.dirname(__file__)
+
+
+def test_decode_peer_status_keeps_used_fields():
+    body = json.dumps({'block_height': 12, 'state': 'Vote', 'total_tx': 30, 'peer_id': 'hx1',
+                       'status': 'Service is online: 1'}).encode()
+    status = decode_peer_status(body, 'http://127.0.0.1:9000/api/v1/status/peer')
+    assert (status.block_height, status.state, status.total_tx) == (12, 'Vote', 30)
+    assert not hasattr(status, '__dict__')
+
+
+def test_decode_preps():
+    with open(os.path.join(_HERE, 'output.json')) as f:
+        result = json.load(f)['result']
+    preps = decode_preps(result)
+    assert len(preps) == len(result['preps'])
+    assert all(set(p) == set(PREP_FIELDS + PREP_NUMBERS) for p in preps)
+    assert preps[0]['name'] == result['preps'][0]['name']
+    assert preps[0]['validatedBlocks'] == 0xded646
+    assert preps[0]['penalty'] == 0
+    assert int(preps[0]['delegated']) == 48608368
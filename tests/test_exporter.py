@@ -0,0 +1,269 @@
+import asyncio
+from time import time
+
+from prometheus_client import CollectorRegistry
+from prometheus_client.parser import text_string_to_metric_families
+
+from benchmarks.fleet import FakeFleet
+from benchmarks.run import free_port
+from icon_network_exporter import Exporter, exposition
+from icon_network_exporter.config import Config
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.utils import create_session
+
+
+def run_exporter(fleet: FakeFleet, iterations: int, on_change=None, metrics: Metrics = None, **config):
+    metrics = metrics or Metrics(CollectorRegistry())
+
+    async def run():
+        port = await fleet.start()
+        session = create_session(connection_limit_per_host=4)
+        try:
+            exporter = Exporter(Config(main_api_endpoint=f'http://127.0.0.1:{port}/api/v3',
+                                       end_ranking=hex(len(fleet.preps)), peer_api_port=port, **config), metrics)
+            exporter.on_change = on_change
+            await exporter.open(session)
+            for _ in range(iterations):
+                await exporter.poll()
+            return exporter
+        finally:
+            await session.close()
+            await fleet.stop()
+
+    return asyncio.run(run()), metrics.registry
+
+
+def test_iterations_against_fake_fleet():
+    fleet = FakeFleet(30, latency=.001, jitter=0, block_time=.01)
+    exporter, registry = run_exporter(fleet, 3, poll_interval=1)
+
+    assert len(exporter.registry) == 30
+    assert all(exporter.responses)
+
+    def value(metric, **labels):
+        return registry.get_sample_value(metric, {'network_name': 'mainnet', **labels})
+
+    name = fleet.preps[25]['name']
+    assert value('icon_prep_node_rank', name=name) == 25
+    assert value('icon_prep_node_state', name=name) == 2
+    # Polls can finish within one block, the node trails the chain by its lag
+    assert value('icon_prep_node_block_height', name=name) >= fleet.start_height - fleet.lag[25]
+    assert value('icon_prep_node_block_time', name=fleet.preps[0]['name']) > 0
+    assert value('icon_prep_node_latency_seconds_count', name=name) == 3
+    assert value('icon_total_active_main_preps') == 22
+    assert value('icon_total_active_sub_preps') == 8
+    main_heights = exporter.samples.latest('block_height')[:22]
+    assert main_heights.min() <= value('icon_prep_reference_block_height') <= main_heights.max()
+    assert 0 < value('icon_blocks_left_in_term') <= 43120
+    assert value('icon_last_block_height') >= fleet.start_height
+    assert value('icon_total_supply') > 8e8
+    # getPReps, then getIISSInfo, getLastBlock and getTotalSupply batched per iteration
+    assert fleet.rpc_requests == 1 + 3
+
+
+def test_responses_within_the_poll_are_rendered_with_it():
+    fleet = FakeFleet(10, latency=.001, jitter=0, block_time=.01)
+    changes = []
+    run_exporter(fleet, 3, on_change=lambda: changes.append(1), poll_interval=1)
+    assert changes == []
+
+
+def test_latency_histogram_buckets_are_configurable():
+    fleet = FakeFleet(5, latency=.001, jitter=0, block_time=.01)
+    config = Config(latency_buckets=[.005, .05])
+    _, registry = run_exporter(fleet, 1, metrics=Metrics(CollectorRegistry(), config.latency_buckets))
+
+    labels = {'name': fleet.preps[0]['name'], 'network_name': 'mainnet'}
+    buckets = [s.labels['le'] for m in registry.collect() if m.name == 'icon_prep_node_latency_seconds'
+               for s in m.samples if s.name.endswith('_bucket') and s.labels['name'] == labels['name']]
+    assert buckets == ['0.005', '0.05', '+Inf']
+    # Observed in seconds, the latency gauge is in ms
+    latency = registry.get_sample_value('icon_prep_node_latency', labels)
+    assert registry.get_sample_value('icon_prep_node_latency_seconds_sum', labels) == latency / 1000
+    assert registry.get_sample_value('icon_prep_node_latency_seconds_bucket', {'le': '0.05', **labels}) == 1
+
+
+def test_values_never_set_are_not_exported():
+    fleet = FakeFleet(10, latency=.001, jitter=0, block_time=.01)
+    exporter, registry = run_exporter(fleet, 1, poll_interval=1)
+
+    labels = {'name': fleet.preps[0]['name'], 'network_name': 'mainnet'}
+    assert registry.get_sample_value('icon_prep_node_block_height', labels) > 0
+    # Summaries need two polls
+    for metric in ('block_time', 'block_lag', 'latency_mean', 'latency_p95'):
+        assert registry.get_sample_value(f'icon_prep_node_{metric}', labels) is None
+
+
+def test_failed_main_api_call_keeps_the_scrape():
+    fleet = FakeFleet(30, latency=.01, jitter=0, block_time=.01)
+    rpc_result = fleet.rpc_result
+
+    def failing_rpc_result(request):
+        if request.get('method') == 'icx_getTotalSupply':
+            raise KeyError('icx_getTotalSupply')
+        return rpc_result(request)
+
+    fleet.rpc_result = failing_rpc_result
+    exporter, registry = run_exporter(fleet, 2, poll_interval=1)
+
+    # Both scrapes finished within their poll and were processed
+    assert len(exporter.samples) == 2 and all(exporter.responses)
+    assert registry.get_sample_value('icon_total_active_main_preps', {'network_name': 'mainnet'}) == 22
+    assert registry.get_sample_value('icon_prep_reference_block_height', {'network_name': 'mainnet'}) > 0
+    assert registry.get_sample_value('icon_total_supply', {'network_name': 'mainnet'}) is None
+
+
+def test_unexpected_replies_do_not_stop_the_polls():
+    fleet = FakeFleet(30, latency=.001, jitter=0, block_time=.01)
+    fleet.states = {0: 'Unknown'}
+    rpc_result = fleet.rpc_result
+
+    def changed_rpc_result(request):
+        if request.get('method') == 'icx_call' and request['params']['data']['method'] == 'getIISSInfo':
+            return {}
+        return rpc_result(request)
+
+    fleet.rpc_result = changed_rpc_result
+    exporter, registry = run_exporter(fleet, 2, poll_interval=1)
+
+    assert len(exporter.samples) == 2 and all(exporter.responses)
+    name = fleet.preps[0]['name']
+    assert registry.get_sample_value('icon_prep_node_block_height', {'name': name, 'network_name': 'mainnet'}) > 0
+    # Counted as inactive
+    assert registry.get_sample_value('icon_total_active_main_preps', {'network_name': 'mainnet'}) == 21
+
+
+def test_unreachable_nodes_are_backed_off():
+    fleet = FakeFleet(10, latency=.001, jitter=0, block_time=.05)
+    fleet.down = {3}
+    exporter, registry = run_exporter(fleet, 3, poll_interval=1, poll_timeout=.2)
+
+    assert not exporter.backoff.due(exporter.backoff.next_attempt[3] - .1)[3]
+    assert fleet.requests == 3 * 9 + 2
+    name = fleet.preps[3]['name']
+    assert registry.get_sample_value('icon_prep_node_up', {'name': name, 'network_name': 'mainnet'}) == 0
+    assert registry.get_sample_value('icon_exporter_backed_off_nodes', {'network_name': 'mainnet'}) == 1
+
+
+def test_backed_off_nodes_are_evicted():
+    fleet = FakeFleet(10, latency=.001, jitter=0, block_time=.05)
+    metrics = Metrics(CollectorRegistry())
+    labels = {'name': fleet.preps[3]['name'], 'network_name': 'mainnet'}
+
+    async def run():
+        port = await fleet.start()
+        session = create_session()
+        try:
+            exporter = Exporter(Config(main_api_endpoint=f'http://127.0.0.1:{port}/api/v3', end_ranking=hex(10),
+                                       peer_api_port=port, poll_interval=1, poll_timeout=.2), metrics)
+            await exporter.open(session)
+            await exporter.poll()
+            assert metrics.registry.get_sample_value('icon_prep_node_block_height', labels) > 0
+            fleet.down = {3}
+            for _ in range(2):
+                await exporter.poll()
+            # Backed off after the second failed poll, long before evict_after_missed_polls
+            assert exporter.backoff.backed_off(time())[3]
+        finally:
+            await session.close()
+            await fleet.stop()
+
+    asyncio.run(run())
+    assert metrics.registry.get_sample_value('icon_prep_node_block_height', labels) is None
+    assert metrics.registry.get_sample_value('icon_prep_node_up', labels) == 0
+
+
+def test_prep_list_refreshes_on_term_change():
+    fleet = FakeFleet(10, latency=.001, jitter=0, block_time=.05)
+    preps_requests = []
+    iiss_requests = []
+    rpc_result = fleet.rpc_result
+
+    def counting_rpc_result(request):
+        result = rpc_result(request)
+        if 'preps' in result:
+            preps_requests.append(result)
+        elif 'nextCalculation' in result:
+            # A new term every other poll
+            iiss_requests.append(result)
+            result['nextCalculation'] = hex(fleet.start_height + len(iiss_requests) // 2 * 100)
+        return result
+
+    fleet.rpc_result = counting_rpc_result
+    exporter, _ = run_exporter(fleet, 5, poll_interval=1)
+    # Initial list, then the polls after the two term changes
+    assert len(preps_requests) == 3
+
+
+def test_reference_falls_back_to_last_block_when_main_preps_are_down():
+    fleet = FakeFleet(30, latency=.001, jitter=0, block_time=.05)
+    fleet.down = set(range(22))
+    exporter, registry = run_exporter(fleet, 1, poll_timeout=.2)
+
+    assert exporter.reference_node_index is None
+    assert exporter.reference_block_height == exporter.last_block_height
+    assert registry.get_sample_value('icon_prep_reference_block_height',
+                                     {'network_name': 'mainnet'}) == exporter.last_block_height
+
+
+def test_productivity_from_prep_list_refreshes():
+    metrics = Metrics(CollectorRegistry())
+    exporter = Exporter(Config(), metrics)
+    prep_list = [{'name': 'a', 'address': 'hx1', 'p2pEndpoint': '10.0.0.1:7100', 'totalBlocks': 1000,
+                  'validatedBlocks': 990, 'delegated': 100., 'stake': 0., 'penalty': 0},
+                 {'name': 'b', 'address': 'hx2', 'p2pEndpoint': '10.0.0.2:7100', 'totalBlocks': 0,
+                  'validatedBlocks': 0, 'delegated': 50., 'stake': 0., 'penalty': 2}]
+    exporter.set_prep_list(prep_list, 1000)
+    refreshed = [dict(prep_list[1], delegated=40.), dict(prep_list[0], totalBlocks=1200, validatedBlocks=1150)]
+    exporter.set_prep_list(refreshed, 1100)
+
+    def value(metric, name):
+        return metrics.registry.get_sample_value(metric, {'name': name, 'network_name': 'mainnet'})
+
+    assert value('icon_prep_node_validation_rate', 'a') == .8
+    assert value('icon_prep_node_missed_blocks_rate', 'a') == .4
+    assert value('icon_prep_node_delegation_change', 'b') == -10
+    assert value('icon_prep_node_validation_rate', 'b') is None
+    assert value('icon_prep_node_penalty', 'b') == 2
+    assert value('icon_prep_node_delegated', 'a') == 100
+
+
+def test_late_responses_reach_metrics_before_the_next_poll():
+    fleet = FakeFleet(5, latency=.001, jitter=0, block_time=.05)
+    fleet.delays = {4: .4}
+    metrics = Metrics(CollectorRegistry())
+    name = fleet.preps[4]['name']
+
+    async def scrape(session, url) -> float:
+        async with session.get(url) as response:
+            for family in text_string_to_metric_families(await response.text()):
+                for sample in family.samples:
+                    if sample.name == 'icon_prep_node_up' and sample.labels['name'] == name:
+                        return sample.value
+
+    async def run():
+        port = await fleet.start()
+        session = create_session()
+        config = Config(main_api_endpoint=f'http://127.0.0.1:{port}/api/v3', end_ranking=hex(5), peer_api_port=port,
+                        poll_interval=2, soft_deadline=.2, metrics_update_interval=.05)
+        exporter = Exporter(config, metrics)
+        cache = exposition.MetricsCache(metrics.registry, min_update_interval=config.metrics_update_interval)
+        exporter.on_change = cache.invalidate
+        metrics_port = free_port()
+        runner = await exposition.start_server(cache, metrics_port, '127.0.0.1')
+        try:
+            await exporter.open(session)
+            await exporter.poll()
+            await cache.update()
+            url = f'http://127.0.0.1:{metrics_port}/metrics'
+            before = await scrape(session, url)
+            await asyncio.sleep(.6)
+            return before, await scrape(session, url)
+        finally:
+            await runner.cleanup()
+            await session.close()
+            await fleet.stop()
+
+    before, after = asyncio.run(run())
+    assert before == 0
+    assert after == 1
@@ -0,0 +1,109 @@
+import asyncio
+import gzip
+
+import aiohttp
+from prometheus_client import CollectorRegistry, Gauge
+
+from icon_network_exporter.exposition import MetricsCache, accepts_gzip, start_server
+from benchmarks.run import free_port
+
+
+class CountingCache(MetricsCache):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.renders = 0
+
+    def render(self, fmt):
+        self.renders += 1
+        return super().render(fmt)
+
+
+def run_cache(test, refresh=None):
+    registry = CollectorRegistry()
+    gauge = Gauge('icon_total_tx', 'Total transactions', registry=registry)
+
+    async def run():
+        cache = CountingCache(registry, refresh, 1)
+        port = free_port()
+        runner = await start_server(cache, port, '127.0.0.1')
+        try:
+            async with aiohttp.ClientSession(auto_decompress=False) as session:
+                return await test(cache, gauge, session, f'http://127.0.0.1:{port}/metrics')
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+def test_payload_is_rendered_once_per_poll_and_negotiated():
+    async def test(cache, gauge, session, url):
+        gauge.set(1)
+        await cache.update()
+        for _ in range(5):
+            async with session.get(url, headers={'Accept-Encoding': 'gzip'}) as r:
+                assert r.headers['Content-Encoding'] == 'gzip'
+                assert b'icon_total_tx 1.0' in gzip.decompress(await r.read())
+                gzip_etag = r.headers['ETag']
+        assert cache.renders == 1
+
+        async with session.get(url, headers={'Accept-Encoding': 'identity'}) as r:
+            assert 'Content-Encoding' not in r.headers
+            assert b'icon_total_tx 1.0' in await r.read()
+            assert r.headers['ETag'] != gzip_etag
+        async with session.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': gzip_etag}) as r:
+            assert r.status == 304
+        async with session.get(url, headers={'Accept': 'application/openmetrics-text; version=1.0.0',
+                                                 'Accept-Encoding': 'identity'}) as r:
+            assert r.headers['Content-Type'].startswith('application/openmetrics-text')
+            assert (await r.read()).endswith(b'# EOF\n')
+        assert cache.renders == 2
+
+        gauge.set(2)
+        await cache.update()
+        async with session.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': gzip_etag}) as r:
+            assert r.status == 200
+            assert b'icon_total_tx 2.0' in gzip.decompress(await r.read())
+
+    run_cache(test)
+
+
+def test_changes_between_polls_are_rendered_at_most_every_interval():
+    async def test(cache, gauge, session, url):
+        await cache.update()
+        for i in range(10):
+            gauge.set(i)
+            cache.invalidate()
+        await asyncio.sleep(.1)
+        # Still within min_update_interval of the poll's render
+        assert cache.renders == 1
+        await asyncio.sleep(1)
+        assert cache.renders == 2
+        async with session.get(url, headers={'Accept-Encoding': 'identity'}) as r:
+            assert b'icon_total_tx 9.0' in await r.read()
+
+    run_cache(test)
+
+
+def test_on_demand_refresh_renders_new_polls_only():
+    polls = [0]
+
+    async def refresh():
+        return polls[0]
+
+    async def test(cache, gauge, session, url):
+        for poll in (1, 1, 2):
+            polls[0] = poll
+            gauge.set(poll)
+            async with session.get(url, headers={'Accept-Encoding': 'identity'}) as r:
+                assert f'icon_total_tx {poll}.0'.encode() in await r.read()
+        assert cache.renders == 2
+
+    run_cache(test, refresh)
+
+
+def test_accepts_gzip():
+    assert accepts_gzip('gzip, deflate')
+    assert accepts_gzip('deflate;q=1, *;q=0.5')
+    assert not accepts_gzip('gzip;q=0')
+    assert not accepts_gzip('identity')
+    assert not accepts_gzip('')
@@ -0,0 +1,118 @@
+import asyncio
+
+from aiohttp import web
+
+from icon_network_exporter.exceptions import IconRPCError
+from icon_network_exporter.jsonrpc import JsonRpcClient
+from icon_network_exporter.rpc import get_iiss_info, get_last_block, get_total_supply
+from icon_network_exporter.utils import create_session
+from tests import start_server
+
+
+def respond(payload: dict) -> dict:
+    if payload['method'] == 'icx_getLastBlock':
+        return {'jsonrpc': '2.0', 'id': payload['id'], 'result': {'height': 10}}
+    if payload['method'] == 'icx_call':
+        return {'jsonrpc': '2.0', 'id': payload['id'], 'result': {'nextCalculation': '0x20'}}
+    return {'jsonrpc': '2.0', 'id': payload['id'], 'error': {'code': -32601, 'message': 'Method not found'}}
+
+
+def run_client(handler, calls):
+    requests = []
+
+    async def counting_handler(request):
+        requests.append(await request.json())
+        return await handler(requests[-1])
+
+    async def run():
+        runner, url = await start_server([web.post('/api/v3', counting_handler)])
+        session = create_session()
+        try:
+            client = JsonRpcClient(session, url + '/api/v3')
+            return await calls(client), client
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    (results, client) = asyncio.run(run())
+    return results, client, requests
+
+
+async def gather_calls(client: JsonRpcClient):
+    return await asyncio.gather(client.call(get_iiss_info()),
+                                client.call_many([get_last_block(), get_total_supply()]),
+                                return_exceptions=True)
+
+
+def test_calls_are_batched_and_demultiplexed():
+    async def handler(body):
+        # Answer out of order
+        return web.json_response([respond(p) for p in reversed(body)])
+
+    (iiss, chain), client, requests = run_client(handler, gather_calls)
+    assert len(requests) == 1 and len(requests[0]) == 3
+    assert iiss == {'nextCalculation': '0x20'}
+    assert isinstance(chain, IconRPCError)
+    assert client.supports_batch
+
+
+def test_falls_back_without_batch_support():
+    async def handler(body):
+        if isinstance(body, list):
+            return web.json_response({'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600}})
+        return web.json_response(respond(body))
+
+    async def calls(client):
+        iiss, last_block = await asyncio.gather(client.call(get_iiss_info()), client.call(get_last_block()))
+        # Later iterations go straight to single requests
+        await asyncio.gather(client.call(get_iiss_info()), client.call(get_last_block()))
+        return iiss, last_block
+
+    (iiss, last_block), client, requests = run_client(handler, calls)
+    assert iiss == {'nextCalculation': '0x20'} and last_block == {'height': 10}
+    assert not client.supports_batch
+    assert [isinstance(r, list) for r in requests] == [True, False, False, False, False]
+
+
+def test_transport_errors_fail_every_call():
+    async def handler(body):
+        return web.Response(status=502, text='bad gateway')
+
+    (iiss, chain), _, _ = run_client(handler, gather_calls)
+    assert isinstance(iiss, IconRPCError) and isinstance(chain, IconRPCError)
+
+
+def test_malformed_replies_fail_the_calls():
+    async def handler(body):
+        if isinstance(body, list):
+            # Entries without a result
+            return web.json_response([{'jsonrpc': '2.0', 'id': p['id']} for p in body])
+        return web.json_response({'message': 'API rate limit exceeded'}, status=429)
+
+    async def calls(client):
+        batch = await gather_calls(client)
+        single = await asyncio.gather(client.call(get_last_block()), return_exceptions=True)
+        return batch, single
+
+    ((iiss, chain), (last_block,)), client, requests = run_client(handler, calls)
+    assert all(isinstance(r, IconRPCError) for r in (iiss, chain, last_block))
+    assert client.supports_batch
+
+
+def test_rate_limited_batch_fails_the_calls():
+    async def handler(body):
+        return web.json_response({'message': 'API rate limit exceeded'}, status=429)
+
+    (iiss, chain), client, _ = run_client(handler, gather_calls)
+    assert isinstance(iiss, IconRPCError) and isinstance(chain, IconRPCError)
+    assert client.supports_batch
+
+
+def test_other_batch_errors_keep_batching():
+    async def handler(body):
+        return web.json_response({'jsonrpc': '2.0', 'id': None, 'error': {'code': -32000, 'message': 'busy'}})
+
+    (iiss, chain), client, requests = run_client(handler, gather_calls)
+    assert isinstance(iiss, IconRPCError) and isinstance(chain, IconRPCError)
+    assert client.supports_batch
+    assert len(requests) == 1
@@ -0,0 +1,55 @@
+import numpy as np
+from prometheus_client import CollectorRegistry, Gauge
+
+from icon_network_exporter.labels import LabelLifecycle
+from icon_network_exporter.registry import PRepRegistry
+
+
+def make_prep_list(*names):
+    return [{'name': n, 'address': f'hx{n}', 'p2pEndpoint': f'10.0.0.{i}:7100'} for i, n in enumerate(names)]
+
+
+def exported(registry: CollectorRegistry, metric: str):
+    return sorted(s.labels['name'] for m in registry.collect() if m.name == metric for s in m.samples)
+
+
+def test_departed_and_unresponsive_nodes_are_removed():
+    collector_registry = CollectorRegistry()
+    gauges = {k: Gauge(f'test_{k}', k, ['name', 'network_name'], registry=collector_registry)
+              for k in ('rank', 'block_height')}
+    registry = PRepRegistry('mainnet', gauges)
+    labels = LabelLifecycle(gauges, 'mainnet')
+
+    registry.rebuild(make_prep_list('a', 'b', 'c'))
+    labels.refresh([], registry.preps)
+    for p in registry:
+        p.gauges['rank'].set(p.rank)
+    assert exported(collector_registry, 'test_block_height') == []
+
+    labels.update(registry, np.array([True, True, False]), np.zeros(3, dtype=bool))
+    for p in registry.preps[:2]:
+        p.gauges['block_height'].set(1)
+    assert exported(collector_registry, 'test_block_height') == ['a', 'b']
+
+    # b stops responding
+    labels.update(registry, np.array([True, False, False]), np.array([False, True, True]))
+    assert exported(collector_registry, 'test_block_height') == ['a']
+    assert exported(collector_registry, 'test_rank') == ['a', 'b', 'c']
+    # Values of evicted nodes are not exported
+    registry[1].gauges['block_height'].set(2)
+    registry[2].gauges['block_height'].set(2)
+    assert exported(collector_registry, 'test_block_height') == ['a']
+
+    # b comes back, its children are only exported once set
+    labels.update(registry, np.array([True, True, False]), np.array([False, False, True]))
+    assert exported(collector_registry, 'test_block_height') == ['a']
+    registry[1].gauges['block_height'].set(2)
+    assert exported(collector_registry, 'test_block_height') == ['a', 'b']
+
+    # a is renamed and c leaves
+    old_preps = registry.preps
+    registry.rebuild(make_prep_list('a2', 'b'))
+    labels.refresh(old_preps, registry.preps)
+    registry[0].gauges['rank'].set(0)
+    assert exported(collector_registry, 'test_rank') == ['a2', 'b']
+    assert exported(collector_registry, 'test_block_height') == ['b']
@@ -0,0 +1,30 @@
+import numpy as np
+
+from icon_network_exporter.reference import get_candidates, get_reference
+from icon_network_exporter.registry import PRepRegistry
+
+nan = np.nan
+
+
+def test_quorum_height():
+    heights = np.array([100, 103, nan, 101, 102, 99])
+    candidates = np.arange(5)
+    # Median of the four that responded
+    assert get_reference(heights, candidates, .5) == (102, 4)
+    assert get_reference(heights, candidates, 0) == (103, 1)
+    assert get_reference(heights, candidates, 1) == (100, 0)
+    assert get_reference(heights, np.array([5]), .5) == (99, 5)
+
+
+def test_falls_back_when_no_candidate_responded():
+    heights = np.array([nan, nan, 105])
+    assert get_reference(heights, np.arange(2), .5, 110) == (110, None)
+    assert get_reference(heights, np.arange(0), .5) == (None, None)
+
+
+def test_candidates_from_reference_nodes():
+    registry = PRepRegistry('mainnet')
+    registry.rebuild([{'name': f'node{i}', 'address': f'hx{i}', 'p2pEndpoint': f'10.0.0.{i}:7100'}
+                      for i in range(30)])
+    np.testing.assert_array_equal(get_candidates(registry), np.arange(22))
+    np.testing.assert_array_equal(get_candidates(registry, ['hx25', 'node3', 'unknown']), [3, 25])
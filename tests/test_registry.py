@@ -0,0 +1,52 @@
+import json
+import os
+
+from prometheus_client import CollectorRegistry, Gauge
+
+from icon_network_exporter.decoding import decode_preps
+from icon_network_exporter.registry import PRepRegistry
+
+_HERE = os.path.dirname(__file__)
+
+
+def load_preps():
+    with open(os.path.join(_HERE, 'output.json')) as f:
+        return decode_preps(json.load(f)['result'])
+
+
+def test_rebuild_indexes_preps():
+    prep_list = load_preps()
+    collector_registry = CollectorRegistry()
+    gauge = Gauge('test_rank', 'rank', ['name', 'network_name'], registry=collector_registry)
+    registry = PRepRegistry('mainnet', {'rank': gauge})
+    registry.rebuild(prep_list)
+
+    assert len(registry) == len(prep_list)
+    first = registry[0]
+    assert first.name == prep_list[0]['name']
+    assert first.rank == 0
+    assert first.api_endpoint == 'http://210.180.69.101:9000/api/v1/status/peer'
+    assert registry.get_by_endpoint(first.api_endpoint) is first
+    assert registry.get_by_address(prep_list[5]['address']) is registry[5]
+    assert registry.columns['totalBlocks'][0] == 0xdf59b4
+    assert registry.columns['delegated'][0] == 0x283538e9b57a884b6cbdea / 10 ** 18
+
+    # Children are only created once a value is set
+    assert collector_registry.get_sample_value('test_rank', {'name': first.name, 'network_name': 'mainnet'}) is None
+    first.gauges['rank'].set(first.rank)
+    assert gauge.labels(first.name, 'mainnet')._value.get() == 0
+
+
+def test_rebuild_reuses_unchanged_records():
+    prep_list = load_preps()[:4]
+    registry = PRepRegistry('mainnet')
+    registry.rebuild(prep_list)
+    first, second = registry[0], registry[1]
+
+    renamed = dict(prep_list[2], name='renamed')
+    previous_index = registry.rebuild([prep_list[1], prep_list[0], renamed])
+    assert previous_index == [1, 0, 2]
+    assert registry[0] is second and second.rank == 0
+    assert registry[1] is first and first.rank == 1
+    assert registry[2].name == 'renamed'
+    assert registry.get_by_address(prep_list[3]['address']) is None
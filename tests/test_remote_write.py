@@ -0,0 +1,174 @@
+import asyncio
+import struct
+from time import time
+from types import SimpleNamespace
+
+import aiohttp
+from aiohttp import web
+from prometheus_client import CollectorRegistry
+
+from icon_network_exporter.config import Config
+from icon_network_exporter.decoding import PeerStatus
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.registry import PRep
+from icon_network_exporter.remote_write import Pusher, snappy_literal
+from tests import start_server
+
+
+def read_varint(data: bytes, i: int):
+    n = shift = 0
+    while True:
+        b = data[i]
+        n |= (b & 0x7f) << shift
+        i += 1
+        shift += 7
+        if b < 0x80:
+            return n, i
+
+
+def fields(data: bytes):
+    i = 0
+    while i < len(data):
+        tag, i = read_varint(data, i)
+        if tag & 7 == 2:
+            n, i = read_varint(data, i)
+            yield tag >> 3, data[i:i + n]
+            i += n
+        elif tag & 7 == 1:
+            yield tag >> 3, struct.unpack('<d', data[i:i + 8])[0]
+            i += 8
+        else:
+            n, i = read_varint(data, i)
+            yield tag >> 3, n
+
+
+def snappy_uncompress(data: bytes) -> bytes:
+    try:
+        import snappy
+        return snappy.uncompress(data)
+    except ImportError:
+        pass
+    # Literals only
+    length, i = read_varint(data, 0)
+    out = b''
+    while i < len(data):
+        n = data[i] >> 2
+        i += 1
+        if n >= 60:
+            size = n - 59
+            n = int.from_bytes(data[i:i + size], 'little')
+            i += size
+        out += data[i:i + n + 1]
+        i += n + 1
+    assert len(out) == length
+    return out
+
+
+def decode_write_request(body: bytes) -> list:
+    series = []
+    for _, ts in fields(snappy_uncompress(body)):
+        labels, samples = [], []
+        for field, value in fields(ts):
+            if field == 1:
+                label = dict(fields(value))
+                labels.append((label[1].decode(), label[2].decode()))
+            else:
+                samples.append(dict(fields(value)))
+        series.append((labels, samples))
+    return series
+
+
+def make_pusher(url: str, **config) -> Pusher:
+    metrics = Metrics(CollectorRegistry())
+    prep = PRep(0, 'node0', 'hx0', 0, 'http://127.0.0.1/api/v1/status/peer')
+    status = PeerStatus(prep.api_endpoint, 10, 'Vote', 5, timestamp=1600000000.5, latency=1)
+    exporter = SimpleNamespace(config=Config(), registry=[prep], responses=[status])
+    metrics.gauge_prep_node_block_height.labels('node0', 'mainnet').set(10)
+    metrics.gauge_total_tx.labels('mainnet').set(5)
+    return Pusher(None, Config(push_url=url, push_labels={'site': 'edge'}, **config), metrics, [exporter])
+
+
+def test_batches_are_retried_and_carry_response_timestamps():
+    statuses = [503, 200]
+    bodies = []
+
+    async def receive(request):
+        assert request.headers['Content-Encoding'] == 'snappy'
+        bodies.append(await request.read())
+        return web.Response(status=statuses.pop(0))
+
+    async def run():
+        runner, url = await start_server([web.post('/api/v1/write', receive)])
+        pusher = make_pusher(f'{url}/api/v1/write')
+        async with aiohttp.ClientSession() as session:
+            pusher.session = session
+            task = asyncio.ensure_future(pusher.run())
+            await pusher.enqueue()
+            while pusher.queue:
+                await asyncio.sleep(.05)
+            task.cancel()
+        await runner.cleanup()
+        return pusher
+
+    start = time()
+    pusher = asyncio.run(run())
+    assert len(bodies) == 2 and bodies[0] == bodies[1]
+    assert pusher.metrics.registry.get_sample_value('icon_exporter_push_batches_total', {'status': 'retried'}) == 1
+
+    series = {dict(labels)['__name__']: (labels, samples) for labels, samples in decode_write_request(bodies[1])}
+    labels, samples = series['icon_prep_node_block_height']
+    assert labels == sorted([('__name__', 'icon_prep_node_block_height'), ('name', 'node0'),
+                             ('network_name', 'mainnet'), ('site', 'edge')])
+    assert samples == [{1: 10.0, 2: 1600000000500}]
+    _, samples = series['icon_total_tx']
+    assert samples[0][1] == 5.0
+    assert start * 1000 <= samples[0][2] <= time() * 1000
+
+
+def test_queue_is_bounded():
+    async def run():
+        pusher = make_pusher('http://127.0.0.1:1/api/v1/write', push_queue_size=2)
+        for _ in range(3):
+            await pusher.enqueue()
+        return pusher
+
+    pusher = asyncio.run(run())
+    assert len(pusher.queue) == 2
+    assert pusher.metrics.registry.get_sample_value('icon_exporter_push_dropped_batches_total') == 1
+
+
+def test_snappy_literal_round_trip():
+    data = bytes(range(256)) * 700
+    for n in (0, 1, 59, 60, 255, 256, len(data)):
+        assert snappy_uncompress(snappy_literal(data[:n])) == data[:n]
+
+
+def test_only_the_polled_network_is_pushed_and_time_never_goes_back():
+    pusher = make_pusher('http://127.0.0.1:1/api/v1/write')
+    metrics = pusher.metrics
+    prep = PRep(0, 'node1', 'hx1', 0, 'http://127.0.0.2/api/v1/status/peer')
+    status = PeerStatus(prep.api_endpoint, 20, 'Vote', 5, timestamp=1600000000, latency=1)
+    zicon = SimpleNamespace(config=Config(network_name='zicon'), registry=[prep], responses=[status])
+    pusher.exporters.append(zicon)
+    metrics.gauge_prep_node_block_height.labels('node1', 'zicon').set(20)
+
+    def pushed(network_name):
+        return {tuple(sorted(dict(labels).items())): samples[0][2]
+                for labels, samples in decode_write_request(pusher.collect(network_name))}
+
+    def timestamp(series, name, network_name):
+        return series.get((('__name__', 'icon_prep_node_block_height'), ('name', name),
+                           ('network_name', network_name), ('site', 'edge')))
+
+    series = pushed('mainnet')
+    assert timestamp(series, 'node0', 'mainnet') == 1600000000500
+    assert timestamp(series, 'node1', 'zicon') is None
+    assert any(dict(k)['__name__'] == 'icon_total_tx' for k in series)
+
+    # zicon is halfway through its next poll, node1 has no response yet
+    zicon.responses = [None]
+    now = pushed('zicon')
+    assert timestamp(now, 'node1', 'zicon') > 1600000000500
+    # A response older than that push is left out
+    zicon.responses = [status]
+    assert timestamp(pushed('zicon'), 'node1', 'zicon') is None
@@ -0,0 +1,68 @@
+import asyncio
+from collections import Counter
+
+from prometheus_client import CollectorRegistry
+
+from benchmarks.fleet import FakeFleet
+from icon_network_exporter import Exporter
+from icon_network_exporter import replicas
+from icon_network_exporter.config import Config
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.utils import create_session
+
+
+def test_nodes_are_split_between_replicas():
+    addresses = [f'hx{i:040x}' for i in range(1000)]
+    load = Counter(replicas.owners(a, 4)[0] for a in addresses)
+    assert sorted(load) == [0, 1, 2, 3]
+    assert all(200 < n < 300 for n in load.values())
+
+    assert all(len(set(replicas.owners(a, 4, 2))) == 2 for a in addresses)
+    # Only the nodes of the removed replica move
+    kept = [a for a in addresses if replicas.owners(a, 4)[0] != 3]
+    assert all(replicas.owners(a, 3)[0] == replicas.owners(a, 4)[0] for a in kept)
+
+
+def test_select_keeps_ranks():
+    prep_list = [{'name': f'node{i}', 'address': f'hx{i}', 'p2pEndpoint': f'10.0.0.{i}:7100'} for i in range(30)]
+    shares = [replicas.select(prep_list, r, 3) for r in range(3)]
+    assert sorted(v['rank'] for share in shares for v in share) == list(range(30))
+    assert replicas.select(shares[1], 1, 3) == shares[1]
+    assert len(replicas.select(prep_list, 0, 1)) == 30
+
+
+def test_replicas_scrape_their_share():
+    fleet = FakeFleet(30, latency=.001, jitter=0, block_time=.01)
+
+    async def run():
+        port = await fleet.start()
+        session = create_session(connection_limit_per_host=4)
+        try:
+            exporters = []
+            for i in range(3):
+                config = Config(main_api_endpoint=f'http://127.0.0.1:{port}/api/v3', end_ranking=hex(30),
+                                peer_api_port=port, replica_index=i, replica_count=3)
+                exporter = Exporter(config, Metrics(CollectorRegistry()))
+                await exporter.open(session)
+                await exporter.poll()
+                exporters.append(exporter)
+            return exporters
+        finally:
+            await session.close()
+            await fleet.stop()
+
+    exporters = asyncio.run(run())
+    names = [p.name for e in exporters for p in e.registry]
+    assert sorted(names) == sorted(p['name'] for p in fleet.preps)
+    assert fleet.requests == 30
+    assert sum(e.elected for e in exporters) == 1
+
+    for e in exporters:
+        def value(metric, **labels):
+            return e.metrics.registry.get_sample_value(metric, {'network_name': 'mainnet', **labels})
+
+        ranks = {p['name']: i for i, p in enumerate(fleet.preps)}
+        assert all(value('icon_prep_node_rank', name=p.name) == ranks[p.name] for p in e.registry)
+        assert value('icon_exporter_assigned_nodes') == len(e.registry)
+        assert (value('icon_total_supply') is not None) == e.elected
+        assert value('icon_total_active_main_preps') is None
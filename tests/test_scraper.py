@@ -0,0 +1,189 @@
+import asyncio
+from time import perf_counter
+
+from aiohttp import web
+
+from prometheus_client import CollectorRegistry
+
+from icon_network_exporter.config import Config
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.registry import PRep
+from icon_network_exporter.scraper import Scraper
+from icon_network_exporter.utils import create_session
+from tests import start_server
+
+
+def run_scraper(config: Config, handler, num_nodes: int):
+    async def run():
+        runner, url = await start_server([web.get('/api/v1/status/peer', handler)])
+        session = create_session(connection_limit_per_host=num_nodes)
+        try:
+            scraper = Scraper(session, config)
+            preps = [PRep(i, f'node{i}', f'hx{i}', i, f'{url}/api/v1/status/peer?node={i}') for i in range(num_nodes)]
+            start = perf_counter()
+            resp = await scraper.scrape(preps)
+            return resp, perf_counter() - start
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+def test_parallelism_bounds_in_flight_requests():
+    in_flight = [0]
+    max_in_flight = [0]
+
+    async def handler(request):
+        in_flight[0] += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        await asyncio.sleep(.02)
+        in_flight[0] -= 1
+        return web.json_response({'block_height': 1, 'state': 'Vote', 'total_tx': 1})
+
+    resp, _ = run_scraper(Config(parallelism=3), handler, 12)
+    assert all(r.block_height == 1 for r in resp)
+    assert max_in_flight[0] == 3
+
+
+def test_deadline_drops_hanging_nodes():
+    async def handler(request):
+        if request.query['node'] == '1':
+            await asyncio.sleep(2)
+        return web.json_response({'block_height': 1, 'state': 'Vote', 'total_tx': 1})
+
+    resp, elapsed = run_scraper(Config(poll_timeout=5, poll_read_timeout=5, iteration_deadline=.3), handler, 3)
+    assert resp[0] and resp[2]
+    assert resp[1] is None
+    assert elapsed < 1
+
+
+def test_failures_are_counted_by_type():
+    async def handler(request):
+        if request.query['node'] == '1':
+            return web.Response(text='not json')
+        if request.query['node'] == '2':
+            await asyncio.sleep(2)
+        if request.query['node'] == '4':
+            return web.json_response({'block_height': 1, 'state': 'Vote', 'total_tx': 1}, status=500)
+        return web.json_response({'block_height': 1, 'state': 'Vote', 'total_tx': 1})
+
+    metrics = Metrics(CollectorRegistry())
+
+    async def run():
+        runner, url = await start_server([web.get('/api/v1/status/peer', handler)])
+        session = create_session()
+        try:
+            scraper = Scraper(session, Config(poll_timeout=.2), metrics)
+            preps = [PRep(i, f'node{i}', f'hx{i}', i, f'{url}/api/v1/status/peer?node={i}') for i in range(3)]
+            preps.append(PRep(3, 'node3', 'hx3', 3, 'http://127.0.0.1:1/api/v1/status/peer'))
+            preps.append(PRep(4, 'node4', 'hx4', 4, f'{url}/api/v1/status/peer?node=4'))
+            return await scraper.scrape(preps)
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    resp = asyncio.run(run())
+    assert resp[0] and not any(resp[1:])
+
+    def value(name, labels):
+        return metrics.registry.get_sample_value(name, labels)
+
+    for failure_type in ('decode', 'timeout', 'connect', 'http'):
+        assert value('icon_exporter_request_failures_total', {'type': failure_type, 'network_name': 'mainnet'}) == 1
+    assert value('icon_exporter_request_duration_seconds_count', {'network_name': 'mainnet'}) == 1
+
+
+def test_slow_requests_are_hedged():
+    requests = []
+
+    async def handler(request):
+        requests.append(request.query['node'])
+        if requests.count(request.query['node']) == 1:
+            await asyncio.sleep(1)
+        return web.json_response({'block_height': 1, 'state': 'Vote', 'total_tx': 1})
+
+    metrics = Metrics(CollectorRegistry())
+
+    async def run():
+        runner, url = await start_server([web.get('/api/v1/status/peer', handler)])
+        session = create_session(connection_limit_per_host=8)
+        try:
+            scraper = Scraper(session, Config(), metrics)
+            preps = [PRep(i, f'node{i}', f'hx{i}', i, f'{url}/api/v1/status/peer?node={i}') for i in range(4)]
+            start = perf_counter()
+            resp = await scraper.scrape(preps, [.05, .05, .05, None])
+            return resp, perf_counter() - start
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    resp, elapsed = asyncio.run(run())
+    assert all(resp)
+    # The node without a hedge delay waits on its slow first request
+    assert .9 < elapsed < 1.5
+    assert requests.count('0') == 2 and requests.count('3') == 1
+    assert metrics.registry.get_sample_value('icon_exporter_hedged_requests_total', {'network_name': 'mainnet'}) == 3
+
+
+def test_hedged_requests_count_against_parallelism():
+    in_flight = []
+    most_in_flight = []
+
+    async def handler(request):
+        in_flight.append(request)
+        most_in_flight.append(len(in_flight))
+        await asyncio.sleep(.2)
+        in_flight.remove(request)
+        return web.json_response({'block_height': 1, 'state': 'Vote', 'total_tx': 1})
+
+    async def run():
+        runner, url = await start_server([web.get('/api/v1/status/peer', handler)])
+        session = create_session(connection_limit_per_host=12)
+        try:
+            scraper = Scraper(session, Config(parallelism=3), Metrics(CollectorRegistry()))
+            preps = [PRep(i, f'node{i}', f'hx{i}', i, f'{url}/api/v1/status/peer?node={i}') for i in range(6)]
+            return await scraper.scrape(preps, [.05] * 6)
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    assert all(asyncio.run(run()))
+    assert max(most_in_flight) == 3
+
+
+def test_late_responses_are_published_and_folded_into_next_scrape():
+    requests = []
+    published = []
+
+    async def handler(request):
+        requests.append(request.query['node'])
+        if request.query['node'] == '1':
+            await asyncio.sleep(.3)
+        return web.json_response({'block_height': len(requests), 'state': 'Vote', 'total_tx': 1})
+
+    async def run():
+        runner, url = await start_server([web.get('/api/v1/status/peer', handler)])
+        session = create_session()
+        try:
+            scraper = Scraper(session, Config(soft_deadline=.1, iteration_deadline=1))
+            preps = [PRep(i, f'node{i}', f'hx{i}', i, f'{url}/api/v1/status/peer?node={i}') for i in range(3)]
+            start = perf_counter()
+            first = await scraper.scrape(preps, on_result=lambda p, r: published.append((p.index, perf_counter() - start)))
+            first_elapsed = perf_counter() - start
+            await asyncio.sleep(.4)
+            second = await scraper.scrape(preps)
+            return first, first_elapsed, second
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    first, first_elapsed, second = asyncio.run(run())
+    assert first[0] and first[2] and first[1] is None
+    assert first_elapsed < .25
+    # Node 1 was published when it came in, after the first scrape returned
+    assert sorted(i for i, _ in published) == [0, 1, 2]
+    assert dict(published)[1] > .25
+    # and its response used by the second scrape without another request
+    assert second[1] is not None and requests.count('1') == 1
+    assert requests.count('0') == 2
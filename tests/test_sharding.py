@@ -0,0 +1,39 @@
+import asyncio
+
+from prometheus_client import CollectorRegistry
+
+from benchmarks.fleet import FakeFleet
+from icon_network_exporter.config import Config
+from icon_network_exporter.decoding import decode_preps
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.registry import PRepRegistry
+from icon_network_exporter.sharding import ShardedScraper
+
+
+def test_sharded_scrape_lines_up_with_preps():
+    fleet = FakeFleet(20, latency=.001, jitter=0)
+    fleet.lag = [0] * 20
+    fleet.down = {7}
+    metrics = Metrics(CollectorRegistry())
+
+    async def run():
+        port = await fleet.start()
+        registry = PRepRegistry('mainnet', metrics.node_gauges(), port)
+        registry.rebuild(decode_preps({'preps': fleet.preps}))
+        scraper = ShardedScraper(Config(scrape_workers=3, poll_timeout=.5), metrics)
+        try:
+            return registry, await scraper.scrape(registry.preps)
+        finally:
+            scraper.close()
+            await fleet.stop()
+
+    registry, responses = asyncio.run(run())
+    assert len(responses) == 20
+    assert responses[7] is None
+    for prep, r in zip(registry, responses):
+        if prep.index != 7:
+            assert r.api_endpoint == prep.api_endpoint
+            assert r.block_height >= fleet.start_height
+            assert r.latency > 0
+    assert metrics.registry.get_sample_value('icon_exporter_request_failures_total',
+                                             {'type': 'timeout', 'network_name': 'mainnet'}) == 1
@@ -0,0 +1,101 @@
+import asyncio
+import os
+
+import numpy as np
+from prometheus_client import CollectorRegistry
+
+from benchmarks.fleet import FakeFleet
+from icon_network_exporter import Exporter
+from icon_network_exporter import snapshot
+from icon_network_exporter.config import Config
+from icon_network_exporter.metrics import Metrics
+from icon_network_exporter.registry import PRepRegistry
+from icon_network_exporter.store import SampleStore
+from icon_network_exporter.utils import create_session
+
+
+def test_restart_picks_up_from_snapshot(tmp_path):
+    fleet = FakeFleet(30, latency=.001, jitter=0, block_time=.01)
+
+    async def run():
+        port = await fleet.start()
+        config = Config(main_api_endpoint=f'http://127.0.0.1:{port}/api/v3', end_ranking=hex(30),
+                        peer_api_port=port, poll_interval=1, snapshot_dir=str(tmp_path))
+        session = create_session(connection_limit_per_host=4)
+        try:
+            first = Exporter(config, Metrics(CollectorRegistry()))
+            await first.open(session)
+            for _ in range(3):
+                await first.poll()
+            first.close()
+
+            rpc_requests = fleet.rpc_requests
+            metrics = Metrics(CollectorRegistry())
+            second = Exporter(config, metrics)
+            assert len(second.registry) == 30 and len(second.samples) == 3
+            await second.open(session)
+            await second.poll()
+            second.close()
+            return first, second, metrics, fleet.rpc_requests - rpc_requests
+        finally:
+            await session.close()
+            await fleet.stop()
+
+    first, second, metrics, rpc_requests = asyncio.run(run())
+    assert os.listdir(tmp_path) == ['mainnet.npz']
+    assert [p.address for p in second.registry] == [p.address for p in first.registry]
+    assert second.term_change_block == first.term_change_block
+    # No getPReps on startup, only the batched main API calls of the poll
+    assert rpc_requests == 1
+    value = metrics.registry.get_sample_value('icon_prep_node_block_time',
+                                              {'name': fleet.preps[0]['name'], 'network_name': 'mainnet'})
+    assert value > 0
+
+
+def test_stale_snapshot_is_ignored(tmp_path):
+    registry = PRepRegistry('mainnet')
+    registry.rebuild([{'name': 'a', 'address': 'hx1', 'p2pEndpoint': '1.2.3.4:7100', 'totalBlocks': 7}])
+    samples = SampleStore(4, 1)
+    samples.append({'block_height': np.array([10.])})
+    path = str(tmp_path / 'mainnet.npz')
+    snapshot.save(path, registry, samples, 100, 1234.5)
+
+    saved = snapshot.load(path, 'mainnet', 60)
+    assert saved['prep_list'] == [{'name': 'a', 'address': 'hx1', 'p2pEndpoint': '1.2.3.4:7100', 'rank': 0,
+                                   'totalBlocks': 7}]
+    assert saved['prep_list_time'] == 1234.5
+    assert saved['term_change_block'] == 100
+    np.testing.assert_array_equal(saved['samples']['block_height'], [[10.]])
+    assert snapshot.load(path, 'mainnet', 0) is None
+    assert snapshot.load(path, 'zicon', 60) is None
+    assert snapshot.load(str(tmp_path / 'missing.npz'), 'mainnet', 60) is None
+
+
+def test_broken_snapshot_is_ignored(tmp_path):
+    registry = PRepRegistry('mainnet')
+    registry.rebuild([{'name': 'a', 'address': 'hx1', 'p2pEndpoint': '1.2.3.4:7100'}])
+    samples = SampleStore(4, 1)
+    samples.append({'block_height': np.array([10.])})
+    path = str(tmp_path / 'mainnet.npz')
+    snapshot.save(path, registry, samples, 100)
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    broken = {
+        'empty': b'',
+        'truncated': content[:len(content) // 2],
+    }
+    with np.load(path) as data:
+        arrays = {k: data[k] for k in data.files}
+    for missing in ('saved_at', 'names', 'block_height'):
+        with open(tmp_path / 'missing.npz', 'wb') as f:
+            np.savez(f, **{k: v for k, v in arrays.items() if k != missing})
+        with open(tmp_path / 'missing.npz', 'rb') as f:
+            broken[missing] = f.read()
+
+    for name, content in broken.items():
+        with open(path, 'wb') as f:
+            f.write(content)
+        assert snapshot.load(path, 'mainnet', 60) is None, name
+    # The exporter starts cold
+    assert len(Exporter(Config(snapshot_dir=str(tmp_path)), Metrics(CollectorRegistry())).registry) == 0
@@ -0,0 +1,26 @@
+import numpy as np
+
+from icon_network_exporter.store import SampleStore
+
+
+def test_ring_buffer_wraps_and_keeps_order():
+    store = SampleStore(3, 2)
+    for i in range(5):
+        store.append({'block_height': np.array([i, 10 + i])})
+
+    assert len(store) == 3
+    np.testing.assert_array_equal(store.window('block_height')[:, 0], [2, 3, 4])
+    np.testing.assert_array_equal(store.window('block_height', 2)[:, 1], [13, 14])
+    np.testing.assert_array_equal(store.latest('block_height'), [4, 14])
+    assert np.isnan(store.latest('latency')).all()
+
+
+def test_remap_follows_nodes():
+    store = SampleStore(2, 2)
+    store.append({'block_height': np.array([1, 2])})
+    store.remap([1, None, 0])
+
+    assert store.num_nodes == 3
+    latest = store.latest('block_height')
+    assert latest[0] == 2 and latest[2] == 1
+    assert np.isnan(latest[1])
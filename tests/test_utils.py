@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from icon_network_exporter.exceptions import IconRPCError
+from icon_network_exporter.rpc import get_iiss_info
+from icon_network_exporter.config import Config
+from icon_network_exporter.registry import PRep
+from icon_network_exporter.scraper import Scraper
+from icon_network_exporter.utils import connections_in_use, create_session, post_rpc
+from tests import start_server
+
+
+def test_session_reuses_connections():
+    peers = set()
+
+    async def handler(request):
+        peers.add(request.transport.get_extra_info('peername'))
+        return web.json_response({'block_height': 10, 'state': 'Vote', 'total_tx': 3})
+
+    async def run():
+        runner, url = await start_server([web.get('/api/v1/status/peer', handler)])
+        url += '/api/v1/status/peer'
+        session = create_session()
+        try:
+            scraper = Scraper(session, Config())
+            preps = [PRep(0, 'node', 'hx0', 0, url)]
+            for _ in range(3):
+                resp = await scraper.scrape(preps)
+                assert resp[0].block_height == 10
+                assert resp[0].api_endpoint == url
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    asyncio.run(run())
+    # Keep-alive means all three polls went over a single connection
+    assert len(peers) == 1
+
+
+def test_connections_in_use_are_counted():
+    # Relies on aiohttp internals, fails here rather than exporting a wrong count
+    in_use = []
+
+    async def run():
+        session = create_session()
+
+        async def handler(request):
+            in_use.append(connections_in_use(session.connector))
+            return web.json_response({})
+
+        runner, url = await start_server([web.get('/', handler)])
+        try:
+            async with session.get(url) as response:
+                await response.read()
+            in_use.append(connections_in_use(session.connector))
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    asyncio.run(run())
+    assert in_use == [1, 0]
+
+
+def test_post_rpc_raises_on_error():
+    async def handler(request):
+        payload = await request.json()
+        if payload['method'] == 'icx_call':
+            return web.json_response({'jsonrpc': '2.0', 'id': payload['id'], 'result': {'nextCalculation': '0x10'}})
+        return web.json_response({'jsonrpc': '2.0', 'id': payload['id'], 'error': {'code': -32601}})
+
+    async def run():
+        runner, url = await start_server([web.post('/api/v3', handler)])
+        url += '/api/v3'
+        session = create_session()
+        try:
+            result = await post_rpc(session, url, get_iiss_info())
+            assert result['nextCalculation'] == '0x10'
+            with pytest.raises(IconRPCError):
+                await post_rpc(session, url, {'jsonrpc': '2.0', 'id': 1, 'method': 'icx_unknown'})
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+    asyncio.run(run())